@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+# Benchmarks import backend modules the same way main.py does ("import config", "from scraper import ...")
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.harness import UPDATE_BASELINE, BenchmarkSession  # noqa: E402
+
+_session = BenchmarkSession()
+
+
+@pytest.fixture(scope="session")
+def bench() -> BenchmarkSession:
+    return _session
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if UPDATE_BASELINE and _session.measurements:
+        _session.write_baseline()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _session.measurements:
+        return
+    terminalreporter.section("benchmarks")
+    for line in _session.report_lines():
+        terminalreporter.write_line(line)
+    if UPDATE_BASELINE:
+        terminalreporter.write_line(f"baseline written to {_session.path}")
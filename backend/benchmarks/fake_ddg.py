@@ -0,0 +1,230 @@
+"""
+Local DuckDuckGo stand-in for offline end-to-end runs of both engines.
+
+Serves a homepage with ``#searchbox_input``, result pages in DuckDuckGo's
+markup with a working "More results" button, the "No more results found for"
+marker after the last page, optional CAPTCHA pages and the non-JavaScript
+HTML endpoint. Run it standalone and point the backend at it:
+
+    python -m benchmarks.fake_ddg --port 8765 --pages 20 --latency 0.3
+    DDG_BASE_URL=http://127.0.0.1:8765 DDG_HTML_URL=http://127.0.0.1:8765/html/ uvicorn main:app
+
+or use ``FakeDuckDuckGo`` as a context manager in benchmarks.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+from benchmarks.fixtures import render_html_endpoint_results, render_page_results
+
+HOMEPAGE = """<!DOCTYPE html><html lang="en-US"><head><meta charset="utf-8"><title>DuckDuckGo - Protection. Privacy. Peace of mind.</title></head>
+<body><div id="__next"><main><form id="searchbox_homepage" action="/" method="get">
+<input id="searchbox_input" type="text" name="q" autocomplete="off" placeholder="Search without being tracked">
+<button type="submit" aria-label="Search">S</button></form></main></div></body></html>"""
+
+SERP = """<!DOCTYPE html><html lang="en-US"><head><meta charset="utf-8"><title>{query} at DuckDuckGo</title></head>
+<body><div id="react-layout"><div data-area="mainline"><section data-testid="mainline">
+<ol class="react-results--main">{results}</ol>
+<button id="more-results" class="UJTHdIJF7OVNcEjNt8t4" data-page="1">More results</button>
+</section></div></div>
+<script>
+(function () {{
+    const button = document.getElementById('more-results');
+    button.addEventListener('click', async function () {{
+        button.disabled = true;
+        const page = Number(button.dataset.page) + 1;
+        const response = await fetch('/more?q={quoted}&page=' + page);
+        const list = document.querySelector('ol.react-results--main');
+        list.insertAdjacentHTML('beforeend', await response.text());
+        if (response.headers.get('X-Last-Page') === '1') {{
+            button.remove();
+            list.insertAdjacentHTML('afterend', '<div class="no-results">No more results found for <b>' + {query_js} + '</b></div>');
+        }} else {{
+            button.dataset.page = String(page);
+            button.disabled = false;
+        }}
+    }});
+}})();
+</script></body></html>"""
+
+CAPTCHA = """<!DOCTYPE html><html lang="en-US"><head><meta charset="utf-8"><title>DuckDuckGo</title></head>
+<body><div class="anomaly-modal"><p>Unfortunately, bots use DuckDuckGo too. Please complete the following captcha
+challenge to confirm this search was made by a human.</p><div class="anomaly-modal__puzzle"></div></div></body></html>"""
+
+HTML_ENDPOINT = """<!DOCTYPE html><html><head><meta charset="utf-8"><title>{query} at DuckDuckGo</title></head>
+<body><div id="links" class="results">{results}{next_form}</div></body></html>"""
+
+NEXT_FORM = """<div class="nav-link"><form action="/html/" method="post">
+<input type="submit" class="btn btn--alt" value="Next"><input type="hidden" name="q" value="{query}">
+<input type="hidden" name="s" value="{offset}"><input type="hidden" name="page" value="{page}">
+<input type="hidden" name="df" value="{date_range}"></form></div>"""
+
+
+class FakeDuckDuckGo:
+    """
+    Threaded HTTP server imitating duckduckgo.com.
+
+    ``total_pages`` is how many result pages exist per query, ``latency`` the
+    delay in seconds before every search and "More results" response, and
+    ``captcha_rate`` the share of searches answered with a CAPTCHA page
+    (``?captcha=1`` forces one). Each ``df=`` date range gets its own result
+    set, and every query is capped at ``total_pages``, like DuckDuckGo's
+    pagination depth.
+    """
+
+    def __init__(self, total_pages: int = 10, latency: float = 0.0, captcha_rate: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0, seed: int = 0):
+        self.total_pages = total_pages
+        self.latency = latency
+        self.captcha_rate = captcha_rate
+        self.seed = seed
+        self.requests = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def html_url(self) -> str:
+        return f"{self.base_url}/html/"
+
+    def start(self) -> "FakeDuckDuckGo":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-ddg", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count(self, kind: str):
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def _seed(self, params: dict) -> int:
+        date_range = params.get("df", [""])[0]
+        return self.seed + zlib.crc32(date_range.encode("utf-8")) if date_range else self.seed
+
+    def _captcha(self, params: dict) -> bool:
+        if params.get("captcha", [""])[0] == "1":
+            return True
+        with self._lock:
+            return self._rng.random() < self.captcha_rate
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, body: str, status: int = 200, headers: dict = None):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                query = params.get("q", [""])[0]
+
+                if url.path == "/" and not query:
+                    server._count("homepage")
+                    return self._send(HOMEPAGE)
+
+                if url.path == "/":
+                    server._count("search")
+                    time.sleep(server.latency)
+                    if server._captcha(params):
+                        server._count("captcha")
+                        return self._send(CAPTCHA)
+                    return self._send(SERP.format(
+                        query=escape(query),
+                        query_js=json.dumps(escape(query)),
+                        quoted=quote_plus(query) + (f"&df={quote_plus(params['df'][0])}" if "df" in params else ""),
+                        results=render_page_results(0, server._seed(params)),
+                    ))
+
+                if url.path == "/more":
+                    server._count("more")
+                    time.sleep(server.latency)
+                    page = int(params.get("page", ["2"])[0])
+                    if page > server.total_pages:
+                        return self._send("", headers={"X-Last-Page": "1"})
+                    last = "1" if page >= server.total_pages else "0"
+                    return self._send(render_page_results(page - 1, server._seed(params)), headers={"X-Last-Page": last})
+
+                self._send("Not found", status=404)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != "/html/":
+                    return self._send("Not found", status=404)
+
+                length = int(self.headers.get("Content-Length") or 0)
+                params = parse_qs(self.rfile.read(length).decode("utf-8"))
+                query = params.get("q", [""])[0]
+                page = int(params.get("page", ["1"])[0])
+
+                server._count("html")
+                time.sleep(server.latency)
+                if page == 1 and server._captcha(params):
+                    server._count("captcha")
+                    return self._send(CAPTCHA)
+
+                next_form = ""
+                if page < server.total_pages:
+                    next_form = NEXT_FORM.format(query=escape(query), offset=page * 10, page=page + 1,
+                                                 date_range=escape(params.get("df", [""])[0]))
+                self._send(HTML_ENDPOINT.format(
+                    query=escape(query),
+                    results=render_html_endpoint_results(page - 1, server._seed(params)),
+                    next_form=next_form,
+                ))
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local DuckDuckGo stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=10, help="result pages per query")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each search/More results response")
+    parser.add_argument("--captcha-rate", type=float, default=0.0, help="share of searches answered with a CAPTCHA")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeDuckDuckGo(args.pages, args.latency, args.captcha_rate, args.host, args.port, args.seed)
+    print(f"Fake DuckDuckGo on {server.base_url} (HTML endpoint {server.html_url})")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
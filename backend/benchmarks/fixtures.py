@@ -0,0 +1,173 @@
+"""
+Deterministic DuckDuckGo-like result pages for offline benchmarks.
+
+The markup mirrors a real SERP after N "More results" clicks: hashed class
+names, ``article[data-testid='result']`` containers, title links, date spans
+and snippets, page separators, plus the inline scripts and styles in <head>
+that the parser has to skip.
+"""
+import random
+from html import escape
+
+RESULTS_PER_PAGE = 10
+PAGE_SIZES = (1, 5, 20, 50)
+
+_WORDS = (
+    "python scraping performance browser results parser selenium search engine "
+    "release notes guide tutorial benchmark async cache network latency memory "
+    "throughput pagination markup extraction dataset pipeline report analysis"
+).split()
+
+_DOMAINS = (
+    "example.com", "docs.example.org", "news.example.net", "blog.example.io",
+    "forum.example.dev", "wiki.example.org", "shop.example.com", "example.co.uk",
+)
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+_HEAD = """<!DOCTYPE html><html lang="en-US"><head><meta charset="utf-8">
+<title>{query} at DuckDuckGo</title>
+<link rel="preload" href="/dist/b.css" as="style"><link rel="stylesheet" href="/dist/s.css">
+<style>{style}</style>
+<script>{script}</script>
+</head>"""
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(count))
+
+
+def _date_html(rng: random.Random, index: int) -> str:
+    """Mix of the date shapes DuckDuckGo shows, including none at all."""
+    kind = index % 6
+    if kind == 0:
+        return f'<span class="MILR5XIVy9h75WrLvKiq qsXMqKZNYEaWqGnWVdoa">{rng.choice(_MONTHS)} {rng.randint(1, 28)}, {rng.randint(2015, 2025)}</span>'
+    if kind == 1:
+        return f'<span class="MILR5XIVy9h75WrLvKiq qsXMqKZNYEaWqGnWVdoa">{rng.randint(2, 30)} days ago</span>'
+    if kind == 2:
+        return '<span class="MILR5XIVy9h75WrLvKiq qsXMqKZNYEaWqGnWVdoa">Yesterday</span>'
+    if kind == 3:
+        return f'<time datetime="2024-01-01">{rng.randint(2015, 2025)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}</time>'
+    if kind == 4:
+        # Date only in the snippet text
+        return f'<span>{rng.choice(_MONTHS)} {rng.randint(1, 28)}, {rng.randint(2015, 2025)} &mdash; </span>'
+    return ""
+
+
+def _result_html(rng: random.Random, page: int, index: int) -> str:
+    domain = rng.choice(_DOMAINS)
+    path = "/".join(_words(rng, 3).split())
+    url = f"https://{domain}/{path}?id={page}-{index}"
+    title = escape(_words(rng, rng.randint(4, 10)).title())
+    snippet = escape(_words(rng, rng.randint(20, 40)))
+    return (
+        f'<li data-layout="organic" class="wLL07_0Xnd1QZpzpfR4W">'
+        f'<article id="r{page}-{index}" data-testid="result" data-nrn="result" '
+        f'class="yQDlj3B5DI5YO8c8Ulio CpkrTDP54mqzpuCSn1Fa SKlplDuh9FjtDprgoMxk">'
+        f'<div class="OHr0VX9IuNcv6iakvT6A"><div class="mwuQiMOjmFJ5vmN6Vcqw">'
+        f'<span class="DpVR46dTZaePK29PDkz8"><img src="/assets/icons/{domain}.ico" width="16" height="16" alt=""></span>'
+        f'<a href="https://{domain}/" rel="noopener" class="Rn_JXVtoPVAFyGkcaXyK" data-testid="result-extras-url-link">'
+        f'<span class="veU5I0hFkgFGOPhX2RBE">{domain}</span></a></div></div>'
+        f'<div class="ikg2IXiCD14iVX7AdZo1"><h2 class="LnpumSThxEWMIsDdAT17 CXMyPcQ6nDv47DKFeywM">'
+        f'<a href="{url}" rel="noopener" target="_self" class="eVNpHGjtxRBq_gLOfGDr LQNqh2U1kzYxREs65IJu" '
+        f'data-testid="result-title-a" data-handled-by-react="true">'
+        f'<span class="EKtkFWMYpwzMKOYr0GYm LQVY1Jpkk8nyJ6HBWKAk">{title}</span></a></h2></div>'
+        f'<div class="E2eLOJr8HctVnDOTM8fs"><div data-result="snippet" class="OgdwYG6KE2qthn9XQWFC">'
+        f'<div><span class="kY2IgmnCmOGjharHErah">{_date_html(rng, index)}<span>{snippet} <b>{escape(rng.choice(_WORDS))}</b> '
+        f'{escape(_words(rng, 8))}</span></span></div></div></div>'
+        f'</article></li>'
+    )
+
+
+def render_serp(pages: int, query: str = "python scraping", seed: int = 0) -> str:
+    """A result page after ``pages - 1`` "More results" clicks, ``RESULTS_PER_PAGE`` results each."""
+    rng = random.Random(seed)
+    parts = [_HEAD.format(
+        query=escape(query),
+        style=".r{color:#000}" * 400,
+        script="window.__state=" + repr([_words(rng, 20) for _ in range(200)]) + ";",
+    )]
+    parts.append('<body><div id="react-layout"><div data-area="mainline"><section data-testid="mainline">'
+                 '<ol class="react-results--main">')
+    for page in range(pages):
+        if page:
+            parts.append(f'<li class="ahfhYNK3QqaUWJTe9IBA"><div aria-label="Page {page + 1}" class="CfsFAPHs_ZAwkYqd8t0a">'
+                         f'<span>{page + 1}</span></div></li>')
+        for index in range(RESULTS_PER_PAGE):
+            parts.append(_result_html(rng, page, index))
+    parts.append('</ol><button id="more-results" class="UJTHdIJF7OVNcEjNt8t4">More results</button>'
+                 '</section></div></div><script>window.__loaded=true;</script></body></html>')
+    return "".join(parts)
+
+
+def render_page_results(page: int, seed: int = 0) -> str:
+    """The ``RESULTS_PER_PAGE`` result items of one page, deterministic per (seed, page)."""
+    rng = random.Random(seed * 100003 + page)
+    return "".join(_result_html(rng, page, index) for index in range(RESULTS_PER_PAGE))
+
+
+def render_html_endpoint_results(page: int, seed: int = 0) -> str:
+    """One page of results in the markup of the non-JavaScript HTML endpoint."""
+    rng = random.Random(seed * 100003 + page)
+    items = []
+    for index in range(RESULTS_PER_PAGE):
+        domain = rng.choice(_DOMAINS)
+        url = f"https://{domain}/{'/'.join(_words(rng, 3).split())}?id={page}-{index}"
+        title = escape(_words(rng, rng.randint(4, 10)).title())
+        snippet = escape(_words(rng, rng.randint(20, 40)))
+        items.append(
+            f'<div class="result results_links results_links_deep web-result"><div class="links_main links_deep result__body">'
+            f'<h2 class="result__title"><a rel="nofollow" class="result__a" href="{url}">{title}</a></h2>'
+            f'<div class="result__extras"><div class="result__extras__url"><a class="result__url" href="{url}">{domain}</a></div></div>'
+            f'<a class="result__snippet" href="{url}">{snippet}</a></div></div>'
+        )
+    return "".join(items)
+
+
+def render_fallback_page(links: int = 200, seed: int = 0) -> str:
+    """A page with no known result containers, only loose links, for the fallback extractor."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(links):
+        domain = rng.choice(_DOMAINS)
+        title = escape(_words(rng, rng.randint(3, 8)).title())
+        date = f'<span class="date">{rng.choice(_MONTHS)} {rng.randint(1, 28)}, {rng.randint(2015, 2025)}</span>' if i % 2 else ""
+        items.append(f'<p><a href="https://{domain}/story/{i}">{title}</a> {date}</p>')
+        if i % 10 == 0:
+            items.append('<a href="/settings">Settings</a><a href="https://twitter.com/share">Share on social media</a>')
+    return "<html><head><title>Results</title></head><body><div>" + "".join(items) + "</div></body></html>"
+
+
+def date_samples(count: int = 2000, seed: int = 0) -> list:
+    """Mostly distinct raw date strings in every format the normalizer understands."""
+    rng = random.Random(seed)
+    samples = []
+    for i in range(count):
+        year, month, day = rng.randint(2000, 2025), rng.randint(1, 12), rng.randint(1, 28)
+        kind = i % 8
+        if kind == 0:
+            samples.append(f"{_MONTHS[month - 1]} {day}, {year}")
+        elif kind == 1:
+            samples.append(f"{_MONTHS[month - 1]} {day} {year}")
+        elif kind == 2:
+            samples.append(f"{rng.randint(1, 400)} days ago")
+        elif kind == 3:
+            samples.append(rng.choice(("Today", "Yesterday", "today", "yesterday")))
+        elif kind == 4:
+            samples.append(f"{year}-{month:02d}-{day:02d}")
+        elif kind == 5:
+            samples.append(f"{month:02d}/{day:02d}/{year}")
+        elif kind == 6:
+            samples.append(f"{year}/{month:02d}/{day:02d}")
+        else:
+            samples.append(f"published {rng.choice(_WORDS)}")
+    return samples
+
+
+QUERY_SAMPLES = (
+    {"normal_query": "python scraping"},
+    {"normal_query": "selenium", "exact_phrase": "headless chrome", "exclude_terms": "java, ruby",
+     "filetype": "pdf", "site_include": "example.com", "intitle": "guide"},
+    {"semantic_query": "fast html parsing", "include_terms": "lxml, soupsieve", "site_exclude": "pinterest.com",
+     "inurl": "docs"},
+)
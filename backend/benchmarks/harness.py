@@ -0,0 +1,181 @@
+import gc
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Allowed slowdown / memory growth over the stored baseline before a benchmark fails
+TIME_TOLERANCE = float(os.getenv("BENCH_TIME_TOLERANCE", "0.5"))
+MEMORY_TOLERANCE = float(os.getenv("BENCH_MEMORY_TOLERANCE", "0.15"))
+# Rewrite baseline.json from this run instead of comparing against it
+UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE", "").lower() in ("1", "true", "yes")
+DEFAULT_REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+
+
+def _reference_workload():
+    # Fixed mix of the things parsing spends time on: dict/str work and regex-free scanning
+    words = [f"word{i}" for i in range(2000)]
+    counts = {}
+    for word in words * 10:
+        counts[word.upper()] = counts.get(word.upper(), 0) + len(word.split("d"))
+    return counts
+
+
+def calibrate(repeat: int = 5) -> float:
+    """
+    Best time of a fixed reference workload. Benchmarks are compared with the
+    baseline relative to this, so a slower or busier machine doesn't read as a regression.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            _reference_workload()
+            times.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return min(times)
+
+
+class Measurement:
+    """Timing and peak-memory result of one benchmark."""
+
+    def __init__(self, name: str, times: list, references: list, peak_bytes: int, items: int, unit: str,
+                 use_median: bool = False):
+        self.name = name
+        self.times = times
+        self.references = references
+        self.peak_bytes = peak_bytes
+        self.items = items
+        self.unit = unit
+        self.use_median = use_median
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def throughput(self) -> float:
+        """Items (results, dates, queries) per second on the best run."""
+        return self.items / self.best if self.best else float("inf")
+
+    @property
+    def relative(self) -> float:
+        """
+        Best run time in units of the reference workload timed right before it;
+        the median ratio with ``use_median``, for runs too short for best-of to be steady.
+        """
+        ratios = [t / reference for t, reference in zip(self.times, self.references)]
+        return statistics.median(ratios) if self.use_median else min(ratios)
+
+    def to_baseline(self) -> dict:
+        return {
+            "seconds": round(self.best, 6),
+            "relative": round(self.relative, 4),
+            "peak_bytes": self.peak_bytes,
+            "items": self.items,
+        }
+
+
+def measure(name: str, func, setup=None, repeat: int = None, unit: str = "results",
+            use_median: bool = False) -> Measurement:
+    """
+    Benchmark ``func(*setup())``: one warm-up call, ``repeat`` timed calls and a
+    separate tracemalloc call for peak memory (tracing slows the timed runs down).
+    ``func`` returns the processed items (or their count) for throughput.
+    """
+    repeat = repeat or DEFAULT_REPEAT
+
+    def call():
+        return setup() if setup else ()
+
+    output = func(*call())
+    items = output if isinstance(output, int) else len(output)
+
+    times = []
+    references = []
+    for _ in range(repeat):
+        args = call()
+        references.append(calibrate(repeat=3))
+        # Like timeit, keep collector pauses out of the timed region
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+
+    args = call()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(name, times, references, peak, items, unit, use_median)
+
+
+class BenchmarkSession:
+    """Collects measurements of a run and compares them with ``baseline.json``."""
+
+    def __init__(self, path: str = BASELINE_PATH):
+        self.path = path
+        self.measurements = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.baseline = json.load(f)
+        except (OSError, ValueError):
+            self.baseline = {}
+
+    def record(self, measurement: Measurement) -> list:
+        """Store ``measurement``; returns regressions against the baseline (empty when fine)."""
+        self.measurements.append(measurement)
+        if UPDATE_BASELINE:
+            return []
+        reference = self.baseline.get(measurement.name)
+        if not reference:
+            return []
+
+        problems = []
+        if reference.get("items") not in (None, measurement.items):
+            problems.append(f"{measurement.name}: produced {measurement.items} {measurement.unit}, "
+                            f"baseline {reference['items']}")
+        if measurement.relative > reference["relative"] * (1 + TIME_TOLERANCE):
+            problems.append(f"{measurement.name}: {measurement.relative / reference['relative'] - 1:+.0%} "
+                            f"slower than baseline relative to the reference workload "
+                            f"({measurement.best * 1000:.2f} ms; +{TIME_TOLERANCE:.0%} allowed)")
+        allowed = reference["peak_bytes"] * (1 + MEMORY_TOLERANCE)
+        if measurement.peak_bytes > allowed:
+            problems.append(f"{measurement.name}: peak {measurement.peak_bytes / 1024:.0f} KB, baseline "
+                            f"{reference['peak_bytes'] / 1024:.0f} KB (+{MEMORY_TOLERANCE:.0%} allowed)")
+        return problems
+
+    def write_baseline(self):
+        baseline = dict(self.baseline)
+        baseline.update({m.name: m.to_baseline() for m in self.measurements})
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+
+    def report_lines(self) -> list:
+        lines = [f"{'benchmark':<34}{'best ms':>10}{'median ms':>11}{'throughput':>22}{'peak KB':>10}{'vs base':>9}"]
+        for m in self.measurements:
+            reference = self.baseline.get(m.name)
+            delta = f"{m.relative / reference['relative'] - 1:+.0%}" if reference and reference.get("relative") else "new"
+            lines.append(
+                f"{m.name:<34}{m.best * 1000:>10.2f}{m.median * 1000:>11.2f}"
+                f"{m.throughput:>12.0f} {m.unit + '/s':<9}{m.peak_bytes / 1024:>10.0f}{delta:>9}"
+            )
+        return lines
@@ -0,0 +1,53 @@
+"""
+Result cache rules that decide which cached runs may serve a request and how they
+are cut down to fewer pages. Each test runs against the memory tier and, with the
+memory tier emptied after every ``put``, against the gzip disk tier.
+"""
+import pytest
+
+from cache import ResultCache
+
+
+def _results(count: int) -> list:
+    return [{"title": f"Result {i}", "url": f"https://example.com/{i}"} for i in range(count)]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def result_cache(request, tmp_path):
+    return ResultCache(ttl=60, max_bytes=1 << 20, disk_dir=str(tmp_path) if request.param == "disk" else "")
+
+
+def _put(cache: ResultCache, *args, **kwargs):
+    cache.put(*args, **kwargs)
+    if cache.disk_dir:
+        cache._entries.clear()
+
+
+def test_slices_deeper_run_by_page(result_cache):
+    results = _results(50)
+    _put(result_cache, "q", 5, results, [10, 10, 10, 10, 10], 5)
+
+    assert result_cache.get("q", 3) == (results[:30], 3)
+    assert result_cache.get("q", 5) == (results, 5)
+    assert result_cache.get("q", 6) is None
+
+
+def test_fallback_extraction_run_is_not_sliced(result_cache):
+    # Fallback link extraction attributes every record to the last page
+    results = _results(40)
+    _put(result_cache, "q", 5, results, [0, 0, 0, 0, 40], 5, sliceable=False)
+
+    assert result_cache.get("q", 3) is None
+    assert result_cache.get("q", 5) == (results, 5)
+
+    # A shallower run with real per-page counts replaces it
+    _put(result_cache, "q", 3, results[:30], [10, 10, 10], 3)
+    assert result_cache.get("q", 3) == (results[:30], 3)
+
+
+def test_exhausted_fallback_run_serves_deeper_requests(result_cache):
+    results = _results(25)
+    _put(result_cache, "q", 3, results, [0, 0, 25], 3, exhausted=True, sliceable=False)
+
+    assert result_cache.get("q", 10) == (results, 3)
+    assert result_cache.get("q", 2) is None
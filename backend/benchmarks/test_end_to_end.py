@@ -0,0 +1,131 @@
+"""
+Full scrape sessions against the local DuckDuckGo stand-in (``fake_ddg.py``).
+
+The HTTP engine always runs. Selenium sessions need Chrome and only run with
+``BENCH_BROWSER=1``.
+"""
+import os
+
+import pytest
+
+import config
+from benchmarks.fake_ddg import FakeDuckDuckGo
+from benchmarks.fixtures import render_serp
+from benchmarks.harness import measure
+from scraper import DriverPool, DuckDuckGoScraper, HtmlScraper, scrape_sharded
+
+BROWSER = os.getenv("BENCH_BROWSER", "").lower() in ("1", "true", "yes")
+PAGES = 20
+
+
+@pytest.fixture(scope="module")
+def fake_ddg():
+    with FakeDuckDuckGo(total_pages=PAGES) as server:
+        yield server
+
+
+def _check(bench, measurement):
+    problems = bench.record(measurement)
+    assert not problems, "; ".join(problems)
+
+
+def test_http_engine_session(bench, fake_ddg):
+    scraper = HtmlScraper(base_url=fake_ddg.html_url)
+
+    def run():
+        df, pages = scraper.scrape("python scraping", PAGES)
+        assert pages == PAGES
+        return len(df)
+
+    measurement = measure(f"http_session[{PAGES}p]", run, repeat=3)
+    assert measurement.items == PAGES * 10
+    _check(bench, measurement)
+
+
+def test_http_engine_captcha(fake_ddg):
+    with FakeDuckDuckGo(captcha_rate=1.0) as server:
+        scraper = HtmlScraper(base_url=server.html_url)
+        with pytest.raises(RuntimeError, match="CAPTCHA"):
+            scraper.scrape("python scraping", 2)
+        assert scraper.stats["captcha_detected"]
+
+
+def test_http_sharded_session(bench, fake_ddg, monkeypatch):
+    # Each df= range has its own result set, so shards reach past one session's PAGES
+    monkeypatch.setattr(config, "HTML_SEARCH_URL", fake_ddg.html_url)
+
+    def run():
+        stats = {}
+        records, pages, _ = scrape_sharded(
+            "http", "python scraping", PAGES, "2024-01-01", "2024-12-31", mode="fixed", shards=4, stats=stats
+        )
+        assert pages == 4 * PAGES
+        assert all(shard["status"] == "ok" for shard in stats["shards"])
+        return len(records)
+
+    measurement = measure(f"http_sharded[4x{PAGES}p]", run, repeat=3)
+    assert measurement.items == 4 * PAGES * 10
+    _check(bench, measurement)
+
+
+@pytest.fixture(scope="module")
+def driver_pool():
+    pool = DriverPool(lambda: DuckDuckGoScraper()._setup_driver(headless=True), size=1)
+    pool.warm()
+    yield pool
+    pool.close()
+
+
+@pytest.mark.skipif(not BROWSER, reason="set BENCH_BROWSER=1 to run Selenium sessions (needs Chrome)")
+@pytest.mark.parametrize("wait", ["poll", "observer"])
+def test_selenium_pooled_sessions(bench, fake_ddg, driver_pool, monkeypatch, wait):
+    monkeypatch.setattr(config, "PAGINATION_WAIT", wait)
+    scraper = DuckDuckGoScraper(base_url=fake_ddg.base_url)
+
+    def run():
+        df, pages = scraper.scrape("python scraping", PAGES, driver_pool=driver_pool)
+        assert pages == PAGES
+        return len(df)
+
+    measurement = measure(f"selenium_pooled_session[{wait},{PAGES}p]", run, repeat=3)
+    assert measurement.items == PAGES * 10
+    # A failing in-page wait falls back to polling; the observer run must not have needed it
+    assert scraper.pagination_wait == wait
+    _check(bench, measurement)
+
+
+@pytest.mark.skipif(not BROWSER, reason="set BENCH_BROWSER=1 to run Selenium sessions (needs Chrome)")
+@pytest.mark.parametrize("wait", ["poll", "observer"])
+def test_selenium_end_of_results(driver_pool, monkeypatch, wait):
+    monkeypatch.setattr(config, "PAGINATION_WAIT", wait)
+    with FakeDuckDuckGo(total_pages=3) as server:
+        scraper = DuckDuckGoScraper(base_url=server.base_url)
+        df, pages = scraper.scrape("python scraping", 6, driver_pool=driver_pool)
+    # Stops at the "No more results" marker instead of retrying the missing button
+    assert pages == 3
+    assert len(df) == 30
+    assert scraper.stats["end_of_results"]
+    assert scraper.pagination_wait == wait
+
+
+@pytest.mark.skipif(not BROWSER, reason="set BENCH_BROWSER=1 to run Selenium sessions (needs Chrome)")
+@pytest.mark.parametrize("mode", ["html", "browser"])
+@pytest.mark.parametrize("pages", [1, 5, 20])
+def test_selenium_extraction_parity(driver_pool, tmp_path, mode, pages):
+    # Both extraction modes must produce exactly what _parse_results makes of the same markup
+    html = render_serp(pages, seed=pages)
+    path = tmp_path / "serp.html"
+    path.write_text(html, encoding="utf-8")
+
+    scraper = DuckDuckGoScraper(extraction_mode=mode)
+    expected = scraper._parse_results(html)
+    extract = scraper._extract_new_records if mode == "browser" else scraper._extract_new_results
+    with driver_pool.borrow() as driver:
+        driver.get(path.as_uri())
+        state = {}
+        records = extract(driver, state)
+        # A second call only returns nodes added since the first
+        assert extract(driver, state) == []
+
+    assert len(expected) == pages * 10
+    assert records == expected
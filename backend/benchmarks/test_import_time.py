@@ -0,0 +1,62 @@
+"""
+Cold-start budget for the API: how long ``import main`` takes in a fresh
+interpreter (as reported by ``python -X importtime``) and which heavy
+dependencies it loads. pandas, Selenium, BeautifulSoup, webdriver_manager and
+the export libraries must only be imported once a scrape or export needs them.
+
+``BENCH_IMPORT_BUDGET_MS`` sets the absolute budget (default 1000 ms); the time
+is also compared with ``baseline.json`` like the other benchmarks.
+"""
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import DEFAULT_REPEAT, Measurement, calibrate
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = float(os.getenv("BENCH_IMPORT_BUDGET_MS", "1000"))
+LAZY_MODULES = (
+    "pandas", "selenium", "bs4", "soupsieve", "lxml", "webdriver_manager", "requests", "pyarrow", "xlsxwriter",
+)
+
+_PRINT_MODULES = "import sys, main; print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))"
+
+
+def _import_main():
+    """(seconds ``import main`` took, top-level modules loaded) in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PRINT_MODULES],
+        cwd=BACKEND_DIR,
+        # Keep the import side-effect free: no history database in the user's home
+        env={**os.environ, "RESULT_STORE_PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = None
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "main":
+            cumulative = int(parts[1])
+    assert cumulative is not None, "no importtime entry for main"
+    return cumulative / 1e6, set(completed.stdout.split())
+
+
+def test_import_main_time(bench):
+    times, references = [], []
+    for _ in range(DEFAULT_REPEAT):
+        references.append(calibrate(repeat=3))
+        times.append(_import_main()[0])
+    measurement = Measurement("import_main", times, references, 0, 1, "imports")
+
+    problems = bench.record(measurement)
+    if measurement.best * 1000 > BUDGET_MS:
+        problems.append(f"import main: {measurement.best * 1000:.0f} ms, budget {BUDGET_MS:.0f} ms")
+    assert not problems, "; ".join(problems)
+
+
+def test_import_main_defers_heavy_dependencies():
+    loaded = _import_main()[1]
+    eager = [module for module in LAZY_MODULES if module in loaded]
+    assert not eager, f"import main loads {', '.join(eager)} eagerly"
@@ -0,0 +1,86 @@
+"""
+Offline parsing benchmarks. Run from ``backend/``:
+
+    python -m pytest benchmarks -q
+
+Fails when a benchmark is slower or uses more memory than ``baseline.json``
+allows; ``BENCH_UPDATE_BASELINE=1`` records a new baseline instead.
+"""
+import pytest
+
+import config
+from benchmarks.fixtures import PAGE_SIZES, QUERY_SAMPLES, date_samples, render_fallback_page, render_serp
+from benchmarks.harness import measure
+from scraper.dates import DateNormalizer, normalize_date
+from scraper.duckduckgo import DuckDuckGoScraper
+from scraper.parsing import make_soup
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    return DuckDuckGoScraper()
+
+
+def _check(bench, measurement):
+    problems = bench.record(measurement)
+    assert not problems, "; ".join(problems)
+
+
+@pytest.mark.parametrize("pages", PAGE_SIZES)
+def test_parse_results(bench, scraper, pages):
+    html = render_serp(pages)
+    # Large pages are few repeats of long, allocation-heavy runs: compare the median, not one lucky best
+    measurement = measure(f"parse_results[{pages}p]", lambda: scraper._parse_results(html),
+                          repeat=5 if pages >= 20 else None, use_median=True)
+    assert measurement.items == pages * 10
+    _check(bench, measurement)
+
+
+def test_extract_fallback_links(bench, scraper):
+    soup = make_soup(render_fallback_page(), body_only=True)
+    measurement = measure("extract_fallback_links", lambda: scraper._extract_fallback_links(soup))
+    assert measurement.items == 200
+    _check(bench, measurement)
+
+
+def test_extract_published_date(bench, scraper):
+    articles = scraper._select_articles(make_soup(render_serp(20), body_only=True))
+
+    def setup():
+        # Date normalization is memoized; start cold so parsing cost is included
+        normalize_date.cache_clear()
+        scraper.dates = DateNormalizer()
+        return (articles,)
+
+    def run(articles):
+        return [scraper._extract_published_date(article) for article in articles]
+
+    _check(bench, measure("extract_published_date[200]", run, setup=setup, unit="articles"))
+
+
+def test_parse_english_date(bench, scraper):
+    date_texts = date_samples()
+
+    def setup():
+        normalize_date.cache_clear()
+        scraper.dates = DateNormalizer()
+        return (date_texts,)
+
+    def run(date_texts):
+        return [scraper._parse_english_date(date_text) for date_text in date_texts]
+
+    _check(bench, measure("parse_english_date[2000]", run, setup=setup, unit="dates"))
+
+
+def test_build_query(bench, monkeypatch):
+    # Importing main opens the history database; keep it out of the developer's home
+    monkeypatch.setattr(config, "STORE_PATH", "")
+    from main import build_query
+
+    queries = list(QUERY_SAMPLES) * 10000
+
+    def run():
+        return [build_query(query) for query in queries]
+
+    # Short, allocation-heavy run: best-of swings with one lucky repeat, so compare the median of more repeats
+    _check(bench, measure("build_query[30000]", run, repeat=9, unit="queries", use_median=True))
@@ -0,0 +1,211 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_query(query: str) -> str:
+    """Normalize a built query so trivially different spellings share a cache entry."""
+    return " ".join((query or "").split()).casefold()
+
+
+def cache_key(query: str, start_date=None, end_date=None) -> str:
+    """Cache key for a query and date range. Page count is deliberately not part of the key."""
+    return "|".join([canonical_query(query), start_date or "", end_date or ""])
+
+
+class CacheEntry:
+    """
+    Results of one scrape plus how many of them came from each page. ``exhausted``
+    is set only when the scraper saw DuckDuckGo's end of results, not when it
+    stopped early for another reason (timeouts, a blocked page). ``sliceable`` is
+    False when ``page_counts`` don't reflect real per-page output (fallback link
+    extraction attributes every record to the last page), so the run can't be cut
+    down to fewer pages.
+    """
+
+    def __init__(self, results: list, page_counts: list, pages_retrieved: int, max_pages: int, created_at: float = None,
+                 exhausted: bool = False, sliceable: bool = True):
+        self.results = results
+        self.page_counts = page_counts
+        self.pages_retrieved = pages_retrieved
+        self.max_pages = max_pages
+        self.exhausted = exhausted
+        self.sliceable = sliceable
+        self.created_at = created_at if created_at is not None else time.time()
+        self.size = len(json.dumps(self.to_dict(), default=str))
+
+    def covers(self, max_pages: int) -> bool:
+        """True if this run loaded at least as many pages as requested, or reached the end of results."""
+        if not self.sliceable:
+            # Only requests this run answers whole
+            return self.pages_retrieved == max_pages or (self.exhausted and self.pages_retrieved < max_pages)
+        return self.pages_retrieved >= max_pages or self.exhausted
+
+    def slice(self, max_pages: int):
+        """Results and page count as if the scrape had stopped after ``max_pages`` pages."""
+        pages = min(self.pages_retrieved, max_pages)
+        if pages >= len(self.page_counts) or not self.sliceable:
+            return self.results, pages
+        return self.results[:sum(self.page_counts[:pages])], pages
+
+    def to_dict(self) -> dict:
+        return {
+            "results": self.results,
+            "page_counts": self.page_counts,
+            "pages_retrieved": self.pages_retrieved,
+            "max_pages": self.max_pages,
+            "exhausted": self.exhausted,
+            "sliceable": self.sliceable,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CacheEntry":
+        return cls(data["results"], data["page_counts"], data["pages_retrieved"], data["max_pages"], data["created_at"],
+                   data.get("exhausted", False), data.get("sliceable", True))
+
+
+class ResultCache:
+    """TTL + memory-bounded LRU cache of scrape results with an optional gzip disk tier."""
+
+    def __init__(self, ttl: float = None, max_bytes: int = None, disk_dir: str = None):
+        self.ttl = ttl if ttl is not None else config.CACHE_TTL
+        self.max_bytes = max_bytes if max_bytes is not None else config.CACHE_MAX_BYTES
+        self.disk_dir = disk_dir if disk_dir is not None else config.CACHE_DIR
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0, "expired": 0}
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, query: str, max_pages: int, start_date=None, end_date=None):
+        """Return (results, pages_retrieved) for a covering, unexpired entry, or None."""
+        key = cache_key(query, start_date, end_date)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        from_disk = False
+        if (entry is None or not entry.covers(max_pages)) and self.disk_dir:
+            # The disk copy may be deeper than a shallower run kept in memory
+            disk_entry = self._read_disk(key)
+            if disk_entry is not None and (entry is None or disk_entry.covers(max_pages)):
+                entry = disk_entry
+                from_disk = True
+
+        with self._lock:
+            if entry is None or not entry.covers(max_pages):
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            if from_disk:
+                self._stats["disk_hits"] += 1
+                self._store(key, entry)
+
+        return entry.slice(max_pages)
+
+    def put(self, query: str, max_pages: int, results: list, page_counts: list, pages_retrieved: int,
+            start_date=None, end_date=None, exhausted: bool = False, sliceable: bool = True):
+        """Store a successful scrape; empty runs are not cached."""
+        if not results:
+            return
+        key = cache_key(query, start_date, end_date)
+        entry = CacheEntry(results, page_counts, pages_retrieved, max_pages, exhausted=exhausted, sliceable=sliceable)
+        with self._lock:
+            existing = self._entries.get(key)
+            # Never replace a deeper run with a shallower one, unless the deeper one can't be sliced
+            if existing is not None and not self._expired(existing) and existing.sliceable \
+                    and (existing.exhausted or existing.pages_retrieved > pages_retrieved):
+                return
+            self._store(key, entry)
+        if self.disk_dir:
+            self._write_disk(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".json.gz"):
+                    try:
+                        os.remove(os.path.join(self.disk_dir, name))
+                    except OSError:
+                        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "disk_enabled": bool(self.disk_dir),
+            }
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.created_at > self.ttl
+
+    def _store(self, key: str, entry: CacheEntry):
+        if key in self._entries:
+            self._remove(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json.gz")
+
+    def _read_disk(self, key: str):
+        path = self._disk_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = CacheEntry.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        if self._expired(entry):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: CacheEntry):
+        path = self._disk_path(key)
+        try:
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry.to_dict(), f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠️ Could not write result cache entry: %s", e)
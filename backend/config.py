@@ -98,4 +98,141 @@ MORE_RESULTS_SELECTORS = [
     "a:contains('More results')",
     ".more_results",
     "[data-testid='more-results']"
-]
\ No newline at end of file
+]
+
+# "More results" waits: "observer" waits inside the page on a MutationObserver and falls back
+# to polling if the script fails; "poll" checks the page from Python with WebDriverWait
+PAGINATION_WAIT = os.getenv('PAGINATION_WAIT', 'observer')
+
+# Driver pool: pre-launched Chrome instances reused across scrapes (0 disables pooling)
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+DRIVER_MAX_USES = int(os.getenv('DRIVER_MAX_USES', '25'))
+DRIVER_CHECKOUT_TIMEOUT = float(os.getenv('DRIVER_CHECKOUT_TIMEOUT', '120'))
+
+# Driver bootstrap: discovery results are cached per Chrome version so setup
+# doesn't re-probe binaries or re-run webdriver-manager on every scrape
+CHROME_BINARY_PATHS = [
+    '/usr/bin/chromium',
+    '/usr/bin/chromium-browser',
+    '/usr/bin/google-chrome',
+    '/usr/bin/google-chrome-stable'
+]
+CHROMEDRIVER_PATHS = [
+    '/usr/bin/chromedriver',
+    '/usr/local/bin/chromedriver',
+    '/usr/bin/chromium-driver'
+]
+DRIVER_CACHE_PATH = os.getenv(
+    'DRIVER_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ddg-scraper', 'driver_bootstrap.json')
+)
+DRIVER_STRATEGY_FAILURE_TTL = float(os.getenv('DRIVER_STRATEGY_FAILURE_TTL', '3600'))
+
+# Concurrent browser sessions across all scrape entry points (jobs, searches, batches, shards)
+MAX_CONCURRENT_SESSIONS = int(os.getenv('MAX_CONCURRENT_SESSIONS', str(max(DRIVER_POOL_SIZE, 1))))
+JOB_HISTORY_SIZE = int(os.getenv('JOB_HISTORY_SIZE', '200'))
+JOB_DEFAULT_DURATION = float(os.getenv('JOB_DEFAULT_DURATION', '60'))
+
+# Result cache in front of DuckDuckGoScraper.scrape()
+CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+CACHE_TTL = float(os.getenv('CACHE_TTL', '3600'))
+CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+CACHE_DIR = os.getenv('CACHE_DIR') or None  # set to enable the compressed on-disk tier
+
+# Scraping engines: "selenium" (headless Chrome), "http" (browserless HTML endpoint)
+# or "auto" (HTTP first, Selenium fallback)
+DEFAULT_ENGINE = os.getenv('SCRAPER_ENGINE', 'selenium')
+# Point both engines at a stand-in server (e.g. benchmarks/fake_ddg.py) for offline runs
+DDG_BASE_URL = os.getenv('DDG_BASE_URL', 'https://duckduckgo.com').rstrip('/')
+HTML_SEARCH_URL = os.getenv('DDG_HTML_URL', 'https://html.duckduckgo.com/html/')
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '15'))
+HTTP_PAGE_DELAY = float(os.getenv('HTTP_PAGE_DELAY', '0'))
+
+# Batch search: concurrent scrapes per POST /search/batch
+BATCH_PARALLELISM = int(os.getenv('BATCH_PARALLELISM', str(max(DRIVER_POOL_SIZE, 1))))
+BATCH_MAX_PARALLELISM = int(os.getenv('BATCH_MAX_PARALLELISM', '8'))
+
+# Streaming search: events buffered per /search/stream; a slow client makes the scrape wait
+STREAM_QUEUE_SIZE = int(os.getenv('STREAM_QUEUE_SIZE', '1000'))
+
+# Date-range sharding: split long start_date..end_date ranges into sub-range scrapes.
+# "off", "fixed" (SHARD_DAYS-day shards) or "adaptive" (shards that hit max_pages are split again)
+SHARD_MODE = os.getenv('SHARD_MODE', 'off')
+SHARD_DAYS = int(os.getenv('SHARD_DAYS', '30'))
+SHARD_MIN_DAYS = int(os.getenv('SHARD_MIN_DAYS', '1'))
+SHARD_MAX_SHARDS = int(os.getenv('SHARD_MAX_SHARDS', '32'))
+SHARD_PARALLELISM = int(os.getenv('SHARD_PARALLELISM', str(max(DRIVER_POOL_SIZE, 1))))
+
+# HTML parser backend for BeautifulSoup: "lxml" (falls back to "html.parser" if not installed) or "html.parser"
+HTML_PARSER = os.getenv('HTML_PARSER', 'lxml')
+
+# Memoized raw date text -> ISO date conversions
+DATE_CACHE_SIZE = int(os.getenv('DATE_CACHE_SIZE', '4096'))
+
+# Adaptive selector ordering: weight kept by older hits each time a selector matches
+SELECTOR_SCORE_DECAY = float(os.getenv('SELECTOR_SCORE_DECAY', '0.9'))
+# Catch-all link selectors that stay last regardless of how often they match
+LINK_FALLBACK_SELECTORS = ["a[href*='http']"]
+
+# Result extraction during pagination: "html" parses new result nodes' outerHTML in Python,
+# "browser" extracts title/URL/date text in the page and returns compact JSON
+EXTRACTION_MODE = os.getenv('EXTRACTION_MODE', 'html')
+
+# Network-level request blocking via the Chrome DevTools Protocol (Network.setBlockedURLs)
+BLOCK_NETWORK_REQUESTS = os.getenv('BLOCK_NETWORK_REQUESTS', 'true').lower() not in ('0', 'false', 'no')
+BLOCKED_URL_PATTERNS = [
+    # Fonts
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # Stylesheets
+    '*.css',
+    # Images and favicons
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*favicon*',
+    '*external-content.duckduckgo.com*',
+    # Media
+    '*.mp4', '*.webm', '*.mp3',
+    # DuckDuckGo telemetry beacons
+    '*improving.duckduckgo.com*',
+    # Ads and trackers
+    '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*',
+    '*googletagmanager.com*', '*bat.bing.com*', '*facebook.net*',
+]
+# Typical response sizes used to estimate bytes saved by blocked requests, by CDP resource type
+BLOCKED_BYTES_ESTIMATE = {
+    'Font': 40000,
+    'Stylesheet': 30000,
+    'Image': 15000,
+    'Media': 200000,
+    'Script': 50000,
+    'Ping': 500,
+    'Other': 2000,
+}
+
+# Logging; per-article parsing messages are only emitted at DEBUG
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', '%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+# Recent search results kept in memory for paginated GET /runs/{id}/results reads
+RUNS_MAX = int(os.getenv('RUNS_MAX', '50'))
+RUNS_TTL = float(os.getenv('RUNS_TTL', '3600'))
+RUNS_MAX_PAGE_SIZE = int(os.getenv('RUNS_MAX_PAGE_SIZE', '1000'))
+
+# GET /runs/{id}/export: rows per streamed CSV/JSONL chunk and per Parquet row group
+EXPORT_CHUNK_ROWS = int(os.getenv('EXPORT_CHUNK_ROWS', '1000'))
+EXPORT_PARQUET_COMPRESSION = os.getenv('EXPORT_PARQUET_COMPRESSION', 'zstd')
+
+# SQLite history of every scrape (queries, runs, results); empty RESULT_STORE_PATH disables it
+STORE_PATH = os.getenv(
+    'RESULT_STORE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ddg-scraper', 'results.db')
+)
+STORE_BATCH_SIZE = int(os.getenv('RESULT_STORE_BATCH_SIZE', '200'))
+
+# Result URLs: redirect wrappers are unwrapped, these query parameters stripped,
+# and results whose canonical URL was already seen in the scrape are dropped
+DEDUPE_RESULTS = os.getenv('DEDUPE_RESULTS', 'true').lower() not in ('0', 'false', 'no')
+TRACKING_PARAM_PREFIXES = ['utm_', 'pk_', 'mtm_', '_hs']
+TRACKING_PARAMS = {
+    'gclid', 'gclsrc', 'dclid', 'fbclid', 'msclkid', 'yclid', 'twclid', 'igshid',
+    'mc_cid', 'mc_eid', 'ref_src', 'ref_url', 'spm', 'srsltid', 'rut',
+}
@@ -0,0 +1,147 @@
+"""
+Streaming exports of run results. CSV and JSONL are produced chunk by chunk;
+XLSX and Parquet are written to a temporary file with bounded memory and then
+streamed back from disk.
+"""
+import csv
+import importlib.util
+import io
+import json
+import os
+import tempfile
+
+import config
+
+EXPORT_FIELDS = ("title", "url", "published_date")
+HEADERS = {"title": "Title", "url": "URL", "published_date": "Post Date"}
+READ_CHUNK_BYTES = 64 * 1024
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def available(fmt: str) -> bool:
+    # Parquet export is optional; check for pyarrow without importing it
+    return fmt != "parquet" or importlib.util.find_spec("pyarrow") is not None
+
+
+def _rows(records):
+    for record in records:
+        yield [record.get(field) or "" for field in EXPORT_FIELDS]
+
+
+def iter_csv(records, chunk_rows: int = None):
+    """CSV with a header row, encoded and yielded every ``chunk_rows`` rows."""
+    chunk_rows = chunk_rows or config.EXPORT_CHUNK_ROWS
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([HEADERS[field] for field in EXPORT_FIELDS])
+    for count, row in enumerate(_rows(records), 1):
+        writer.writerow(row)
+        if count % chunk_rows == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_jsonl(records, chunk_rows: int = None):
+    """One JSON object per line, yielded every ``chunk_rows`` records."""
+    chunk_rows = chunk_rows or config.EXPORT_CHUNK_ROWS
+    lines = []
+    for record in records:
+        lines.append(json.dumps({field: record.get(field) for field in EXPORT_FIELDS}, default=str))
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def write_xlsx(records, path: str):
+    """XlsxWriter in constant_memory mode flushes each row to disk as it is written."""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    try:
+        sheet = workbook.add_worksheet("Search Results")
+        bold = workbook.add_format({"bold": True})
+        sheet.write_row(0, 0, [HEADERS[field] for field in EXPORT_FIELDS], bold)
+        for row_number, row in enumerate(_rows(records), 1):
+            sheet.write_row(row_number, 0, row)
+    finally:
+        workbook.close()
+
+
+def write_parquet(records, path: str, chunk_rows: int = None):
+    """Compressed Parquet written one row group per ``chunk_rows`` records."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    chunk_rows = chunk_rows or config.EXPORT_CHUNK_ROWS
+    schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+    with pq.ParquetWriter(path, schema, compression=config.EXPORT_PARQUET_COMPRESSION) as writer:
+        columns = {field: [] for field in EXPORT_FIELDS}
+        pending = 0
+        for record in records:
+            for field in EXPORT_FIELDS:
+                columns[field].append(record.get(field))
+            pending += 1
+            if pending >= chunk_rows:
+                writer.write_table(pa.table(columns, schema=schema))
+                columns = {field: [] for field in EXPORT_FIELDS}
+                pending = 0
+        if pending:
+            writer.write_table(pa.table(columns, schema=schema))
+
+
+def remove_file(path: str):
+    """Delete a finished export file; a no-op if it is already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _iter_file(path: str):
+    """Yield a file in chunks; it is deleted once fully read or the generator is closed."""
+    try:
+        with open(path, "rb") as handle:
+            while True:
+                chunk = handle.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        remove_file(path)
+
+
+def iter_export(records, fmt: str):
+    """
+    (byte chunks of ``records`` exported as ``fmt``, temporary file path or None).
+
+    XLSX and Parquet go through a temporary file. The caller must delete it with
+    ``remove_file`` after the response, for example in a background task, because
+    the chunk generator only cleans up if it is actually iterated or closed.
+    """
+    if fmt == "csv":
+        return iter_csv(records), None
+    if fmt == "jsonl":
+        return iter_jsonl(records), None
+
+    handle, path = tempfile.mkstemp(suffix=f".{FORMATS[fmt][1]}")
+    os.close(handle)
+    try:
+        if fmt == "xlsx":
+            write_xlsx(records, path)
+        else:
+            write_parquet(records, path)
+    except Exception:
+        remove_file(path)
+        raise
+    return _iter_file(path), path
@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+import config
+
+
+class Job:
+    """A queued search and everything a client needs to poll its status."""
+
+    def __init__(self, request, priority: int = 0):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.priority = priority
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = {"current": 0, "total": 0, "message": "Queued"}
+        self.result = None
+        self.error = None
+
+    def update_progress(self, current, total, message):
+        """progress_callback hook passed through to DuckDuckGoScraper.scrape()."""
+        self.progress = {"current": current, "total": total, "message": message}
+
+
+class SessionLimiter:
+    """
+    Caps concurrent browser sessions across every scrape entry point: jobs,
+    /search, /search/stream, /search/batch and each shard of a sharded scrape.
+    """
+
+    def __init__(self, limit: int = None):
+        self.limit = limit or config.MAX_CONCURRENT_SESSIONS
+        self._semaphore = threading.BoundedSemaphore(self.limit)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiting = 0
+
+    @contextmanager
+    def slot(self):
+        """Hold one session slot, waiting for a free one first."""
+        with self._lock:
+            self._waiting += 1
+        self._semaphore.acquire()
+        with self._lock:
+            self._waiting -= 1
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"active": self._active, "waiting": self._waiting, "limit": self.limit}
+
+
+class JobScheduler:
+    """Runs jobs on a fixed number of worker threads, bounding concurrent browser sessions.
+
+    Higher ``priority`` runs first; jobs with equal priority run in FIFO order.
+    ``runner`` is called as ``runner(request, progress_callback=..., job_id=...)``.
+    """
+
+    def __init__(self, runner, max_concurrent: int = None, history_size: int = None):
+        self._runner = runner
+        self.max_concurrent = max_concurrent or config.MAX_CONCURRENT_SESSIONS
+        self.history_size = history_size or config.JOB_HISTORY_SIZE
+
+        self._heap = []
+        self._counter = itertools.count()
+        self._jobs = OrderedDict()
+        self._running = set()
+        self._durations = deque(maxlen=20)
+        self._cond = threading.Condition()
+        self._workers = []
+
+    def submit(self, request, priority: int = 0) -> Job:
+        job = Job(request, priority)
+        with self._cond:
+            self._ensure_workers()
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (-priority, next(self._counter), job))
+            self._prune_history()
+            self._cond.notify()
+        return job
+
+    def get(self, job_id: str):
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def queue_position(self, job: Job):
+        """Zero-based position in the queue, or None once the job has started."""
+        with self._cond:
+            if job.status != "queued":
+                return None
+            ahead = sorted(entry[:2] for entry in self._heap)
+            key = next(entry[:2] for entry in self._heap if entry[2] is job)
+            return ahead.index(key)
+
+    def eta_seconds(self, job: Job):
+        """Rough estimate of seconds until the job finishes, from recent job durations."""
+        average = self.average_duration()
+        if job.status == "running":
+            elapsed = time.time() - job.started_at
+            total = job.progress.get("total") or 0
+            current = job.progress.get("current") or 0
+            if total and current:
+                return max(elapsed / current * total - elapsed, 0.0)
+            return max(average - elapsed, 0.0)
+        if job.status == "queued":
+            position = self.queue_position(job) or 0
+            return (position // self.max_concurrent + 1) * average
+        return 0.0
+
+    def average_duration(self) -> float:
+        with self._cond:
+            if not self._durations:
+                return config.JOB_DEFAULT_DURATION
+            return sum(self._durations) / len(self._durations)
+
+    def stats(self) -> dict:
+        with self._cond:
+            queued = len(self._heap)
+            running = len(self._running)
+        return {
+            "queued": queued,
+            "running": running,
+            "max_concurrent": self.max_concurrent,
+            "average_duration": round(self.average_duration(), 2),
+        }
+
+    def _ensure_workers(self):
+        while len(self._workers) < self.max_concurrent:
+            worker = threading.Thread(target=self._work, name=f"job-worker-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _prune_history(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in ("completed", "failed")]
+        for job_id in finished[:max(len(finished) - self.history_size, 0)]:
+            del self._jobs[job_id]
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                _, _, job = heapq.heappop(self._heap)
+                self._running.add(job.id)
+                job.status = "running"
+                job.started_at = time.time()
+
+            try:
+                job.result = self._runner(job.request, progress_callback=job.update_progress, job_id=job.id)
+                job.status = "completed"
+            except Exception as e:
+                job.error = str(e)
+                job.status = "failed"
+            finally:
+                job.finished_at = time.time()
+                with self._cond:
+                    self._running.discard(job.id)
+                    if job.status == "completed":
+                        self._durations.append(job.finished_at - job.started_at)
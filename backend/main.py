@@ -1,10 +1,71 @@
-from fastapi import FastAPI
+import datetime
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
 from pydantic import BaseModel
-from typing import Optional, List, Dict
-from scraper import DuckDuckGoScraper
+from typing import Optional, List, Dict, Literal
+from scraper import (
+    DuckDuckGoScraper, DriverPool, as_dicts, get_bootstrap, registry_stats, scrape_sharded, scrape_with_engine,
+    split_date_range,
+)
+from jobs import JobScheduler, SessionLimiter
+from cache import ResultCache
+from store import ResultStore
+from runs import RunRegistry, parse_sort
+import export
+
+import config
+import metrics
+
+logging.basicConfig(level=config.LOG_LEVEL, format=config.LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+driver_pool = None
+if config.DRIVER_POOL_SIZE > 0:
+    def _launch_pooled_driver():
+        scraper = DuckDuckGoScraper()
+        driver = scraper._setup_driver(headless=True)
+        metrics.record_driver_setup(scraper.stats.get("driver_strategy", "unknown"))
+        return driver
+
+    driver_pool = DriverPool(_launch_pooled_driver)
+
+
+def _warm_up():
+    # Resolve Chrome/driver discovery once, then pre-launch pooled drivers
+    get_bootstrap().resolve()
+    if driver_pool is not None:
+        driver_pool.warm()
+
+result_cache = ResultCache() if config.CACHE_ENABLED else None
+result_store = ResultStore() if config.STORE_PATH else None
+run_registry = RunRegistry()
+# Shared by jobs, /search, streams, batches and shards: at most MAX_CONCURRENT_SESSIONS browsers
+sessions = SessionLimiter()
+
 
-app = FastAPI(title="DuckDuckGo Scraper API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so health checks answer immediately
+    threading.Thread(target=_warm_up, name="driver-warmup", daemon=True).start()
+    yield
+    if driver_pool is not None:
+        driver_pool.close()
+    if result_store is not None:
+        result_store.close()
+
+
+app = FastAPI(title="DuckDuckGo Scraper API", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -29,11 +90,60 @@ class SearchRequest(BaseModel):
     max_pages: int = 20
     start_date: Optional[str] = None
     end_date: Optional[str] = None
+    engine: Optional[Literal["selenium", "http", "auto"]] = None
+    # False returns only run_id and counts; page through GET /runs/{run_id}/results instead
+    include_results: bool = True
+    # Split start_date..end_date into concurrent sub-range scrapes (default: SHARD_MODE)
+    shard_mode: Optional[Literal["off", "fixed", "adaptive"]] = None
+    shard_days: Optional[int] = None
+    shards: Optional[int] = None
 
 class SearchResult(BaseModel):
     query: str
     pages_retrieved: int
     results: List[Dict]
+    run_id: Optional[str] = None
+    total_results: Optional[int] = None
+    engine: Optional[str] = None
+    network: Optional[Dict] = None
+    timings: Optional[Dict[str, float]] = None
+    duplicates_dropped: Optional[int] = None
+    shards: Optional[List[Dict]] = None
+
+class BatchSearchRequest(BaseModel):
+    requests: List[SearchRequest]
+    parallelism: Optional[int] = None
+
+class BatchItemResult(BaseModel):
+    index: int
+    query: str
+    status: str
+    duration_seconds: float
+    result: Optional[SearchResult] = None
+    error: Optional[str] = None
+
+class BatchSearchResult(BaseModel):
+    results: List[BatchItemResult]
+    succeeded: int
+    failed: int
+    duration_seconds: float
+
+class JobRequest(SearchRequest):
+    priority: int = 0
+
+class JobStatus(BaseModel):
+    id: str
+    status: str
+    priority: int
+    progress: Dict
+    queue_position: Optional[int] = None
+    queue_depth: int
+    eta_seconds: Optional[float] = None
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[SearchResult] = None
+    error: Optional[str] = None
 
 
 def _add_normal_query(queries, parts):
@@ -92,24 +202,497 @@ def build_query(queries: dict) -> str:
     _add_inurl(queries, parts)
     return " ".join(parts)
 
-@app.post("/search", response_model=SearchResult)
-def search(req: SearchRequest):
+def _validate_dates(start_date, end_date):
+    """HTTP 400 unless a given date range is two YYYY-MM-DD dates in order."""
+    if not (start_date and end_date):
+        return
+    try:
+        start = datetime.date.fromisoformat(start_date)
+        end = datetime.date.fromisoformat(end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Date format must be YYYY-MM-DD")
+    if end < start:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+
+def _prepare_search(req: SearchRequest):
+    """
+    (final query, max_pages, start_date, end_date); HTTP 400 for an empty query, fewer
+    than one page or an invalid date range, before any run is recorded.
+    """
     queries = req.dict()
     max_pages = queries.pop("max_pages")
     start_date = queries.pop("start_date")
     end_date = queries.pop("end_date")
+    queries.pop("engine")
+    for field in ("include_results", "shard_mode", "shard_days", "shards"):
+        queries.pop(field)
+    if max_pages < 1:
+        raise HTTPException(status_code=400, detail="max_pages must be at least 1")
+    _validate_dates(start_date, end_date)
     final_query = build_query(queries)
+    if not final_query.strip():
+        raise HTTPException(status_code=400, detail="Search query is empty")
+    return final_query, max_pages, start_date, end_date
+
+def _shard_mode(req: SearchRequest, start_date, end_date):
+    """Sharding mode for this request, or None when it runs as a single scrape."""
+    mode = req.shard_mode or config.SHARD_MODE
+    return mode if mode != "off" and start_date and end_date else None
+
+def _scrape(req: SearchRequest, final_query: str, max_pages: int, job_id: str = None, result_callback=None, **kwargs):
+    """scrape_with_engine plus metrics and history; returns (records, pages_retrieved, engine, stats)."""
+    stats = {}
+    shard_mode = _shard_mode(req, kwargs.get("start_date"), kwargs.get("end_date"))
+    # Reject invalid input before the run is recorded in the history
+    _validate_dates(kwargs.get("start_date"), kwargs.get("end_date"))
+    if shard_mode:
+        split_date_range(kwargs["start_date"], kwargs["end_date"], req.shard_days, req.shards)
+
+    run_id = None
+    if result_store is not None:
+        run_id = result_store.start_run(
+            final_query, max_pages, kwargs.get("start_date"), kwargs.get("end_date"), req.engine
+        )
+        stats["store_run_id"] = run_id
+
+    def on_results(page, records):
+        if run_id is not None:
+            result_store.add_results(run_id, page, records)
+        if result_callback:
+            result_callback(page, records)
+
+    try:
+        if shard_mode:
+            records, pages_retrieved, engine = scrape_sharded(
+                req.engine, final_query, max_pages, mode=shard_mode, shard_days=req.shard_days, shards=req.shards,
+                headless=True, driver_pool=driver_pool, session_slot=sessions.slot, stats=stats,
+                log_context={"job": job_id}, result_callback=on_results, **kwargs
+            )
+        else:
+            records, pages_retrieved, engine = scrape_with_engine(
+                req.engine, final_query, max_pages, headless=True, driver_pool=driver_pool,
+                session_slot=sessions.slot, stats=stats, log_context={"job": job_id}, result_callback=on_results,
+                **kwargs
+            )
+    except Exception as e:
+        metrics.record_scrape(req.engine or config.DEFAULT_ENGINE, stats, failed=True)
+        if run_id is not None:
+            result_store.finish_run(run_id, error=str(e))
+        raise
+    metrics.record_scrape(engine, stats, pages_retrieved)
+    if run_id is not None:
+        result_store.finish_run(run_id, pages_retrieved, engine)
+    return records, pages_retrieved, engine, stats
+
+def _run_search(req: SearchRequest, progress_callback=None, job_id: str = None) -> SearchResult:
+    final_query, max_pages, start_date, end_date = _prepare_search(req)
+    # Sharded scrapes go deeper than a single one, so they neither read nor fill the cache
+    use_cache = result_cache is not None and not _shard_mode(req, start_date, end_date)
+
+    if use_cache:
+        cached = result_cache.get(final_query, max_pages, start_date, end_date)
+        if cached is not None:
+            results, pages_retrieved = cached
+            if progress_callback:
+                progress_callback(pages_retrieved, max_pages, f"⚡ Served {len(results)} cached results")
+            metrics.record_cache_hit()
+            return SearchResult(
+                query=final_query,
+                pages_retrieved=pages_retrieved,
+                results=results if req.include_results else [],
+                run_id=run_registry.add(final_query, results),
+                total_results=len(results),
+                engine="cache",
+            )
+
+    page_counts = {}
+
+    def count_page(page, records):
+        page_counts[page] = page_counts.get(page, 0) + len(records)
 
-    scraper = DuckDuckGoScraper()
-    df, pages_retrieved = scraper.scrape(
+    records, pages_retrieved, engine, stats = _scrape(
+        req,
         final_query,
         max_pages,
-        headless=True,
+        job_id=job_id,
+        progress_callback=progress_callback,
         start_date=start_date,
         end_date=end_date,
+        result_callback=count_page,
+    )
+    results = as_dicts(records)
+
+    if use_cache:
+        result_cache.put(
+            final_query,
+            max_pages,
+            results,
+            [page_counts.get(page, 0) for page in range(1, pages_retrieved + 1)],
+            pages_retrieved,
+            start_date,
+            end_date,
+            exhausted=stats.get("end_of_results", False),
+            sliceable=not stats.get("fallback_extraction", False),
+        )
+    return SearchResult(
+        query=final_query,
+        pages_retrieved=pages_retrieved,
+        results=results if req.include_results else [],
+        run_id=run_registry.add(final_query, results),
+        total_results=len(results),
+        engine=engine,
+        network=stats.get("network"),
+        timings=stats.get("timings"),
+        duplicates_dropped=stats.get("duplicates_dropped"),
+        shards=stats.get("shards"),
+    )
+
+scheduler = JobScheduler(_run_search)
+
+def _job_status(job) -> JobStatus:
+    return JobStatus(
+        id=job.id,
+        status=job.status,
+        priority=job.priority,
+        progress=job.progress,
+        queue_position=scheduler.queue_position(job),
+        queue_depth=scheduler.stats()["queued"],
+        eta_seconds=round(scheduler.eta_seconds(job), 1),
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=job.result,
+        error=job.error,
+    )
+
+@app.post("/search", response_model=SearchResult)
+def search(req: SearchRequest):
+    return _run_search(req)
+
+def _run_batch_item(index: int, req: SearchRequest) -> BatchItemResult:
+    started = time.perf_counter()
+    query = ""
+    try:
+        query = _prepare_search(req)[0]
+        result = _run_search(req)
+        return BatchItemResult(
+            index=index,
+            query=query,
+            status="ok",
+            duration_seconds=round(time.perf_counter() - started, 3),
+            result=result,
+        )
+    except Exception as e:
+        # One failed query must not sink the rest of the batch
+        return BatchItemResult(
+            index=index,
+            query=query,
+            status="error",
+            duration_seconds=round(time.perf_counter() - started, 3),
+            error=e.detail if isinstance(e, HTTPException) else str(e),
+        )
+
+@app.post("/search/batch", response_model=BatchSearchResult)
+def search_batch(batch: BatchSearchRequest):
+    started = time.perf_counter()
+    if not batch.requests:
+        return BatchSearchResult(results=[], succeeded=0, failed=0, duration_seconds=0.0)
+
+    parallelism = batch.parallelism or config.BATCH_PARALLELISM
+    parallelism = min(parallelism, config.BATCH_MAX_PARALLELISM, len(batch.requests))
+    if driver_pool is not None and any((req.engine or config.DEFAULT_ENGINE) != "http" for req in batch.requests):
+        # Items beyond the pool would only wait in checkout until DRIVER_CHECKOUT_TIMEOUT
+        parallelism = min(parallelism, driver_pool.size)
+    parallelism = max(1, parallelism)
+
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="batch-search") as executor:
+        items = list(executor.map(_run_batch_item, range(len(batch.requests)), batch.requests))
+
+    succeeded = sum(1 for item in items if item.status == "ok")
+    return BatchSearchResult(
+        results=items,
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        duration_seconds=round(time.perf_counter() - started, 3),
     )
-    results = df.to_dict(orient="records")
-    return SearchResult(query=final_query, pages_retrieved=pages_retrieved, results=results)
+
+def _format_event(event: dict, fmt: str) -> str:
+    payload = json.dumps(event, default=str)
+    if fmt == "sse":
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+class StreamCancelled(Exception):
+    """The client of a streaming search disconnected."""
+
+def _stream_search(req: SearchRequest, fmt: str, cancelled: threading.Event = None):
+    """
+    Run a scrape in the background and yield progress and result events as they happen.
+    Setting ``cancelled`` (the client went away) stops the scrape at its next callback.
+    """
+    final_query, max_pages, start_date, end_date = _prepare_search(req)
+
+    use_cache = result_cache is not None and not _shard_mode(req, start_date, end_date)
+    cached = result_cache.get(final_query, max_pages, start_date, end_date) if use_cache else None
+    if cached is not None:
+        metrics.record_cache_hit()
+        results, pages_retrieved = cached
+        for record in results:
+            yield _format_event({"type": "result", "page": None, "record": record}, fmt)
+        yield _format_event({
+            "type": "done",
+            "query": final_query,
+            "pages_retrieved": pages_retrieved,
+            "total_results": len(results),
+            "run_id": run_registry.add(final_query, results),
+            "cached": True,
+        }, fmt)
+        return
+
+    events = queue.Queue(maxsize=config.STREAM_QUEUE_SIZE)
+    done = object()
+    cancelled = cancelled or threading.Event()
+    collected = []
+
+    def emit(event):
+        """Queue an event for the client; raises StreamCancelled once the client is gone."""
+        while not cancelled.is_set():
+            try:
+                events.put(event, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+        raise StreamCancelled()
+
+    def on_progress(current, total, message):
+        emit({"type": "progress", "current": current, "total": total, "message": message})
+
+    def on_results(page, records):
+        if cancelled.is_set():
+            raise StreamCancelled()
+        records = as_dicts(records)
+        collected.extend(records)
+        for record in records:
+            emit({"type": "result", "page": page, "record": record})
+
+    def run():
+        try:
+            _, pages_retrieved, engine, stats = _scrape(
+                req,
+                final_query,
+                max_pages,
+                progress_callback=on_progress,
+                start_date=start_date,
+                end_date=end_date,
+                result_callback=on_results,
+                keep_results=False,
+            )
+            emit({
+                "type": "done",
+                "query": final_query,
+                "pages_retrieved": pages_retrieved,
+                "total_results": len(collected),
+                "run_id": run_registry.add(final_query, collected),
+                "engine": engine,
+                "timings": stats.get("timings"),
+                "duplicates_dropped": stats.get("duplicates_dropped"),
+                "shards": stats.get("shards"),
+            })
+        except StreamCancelled:
+            logger.info("🔌 Stream client disconnected, scrape stopped")
+        except Exception as e:
+            with suppress(StreamCancelled):
+                emit({"type": "error", "message": str(e)})
+        finally:
+            with suppress(StreamCancelled):
+                emit(done)
+
+    threading.Thread(target=run, name="search-stream", daemon=True).start()
+
+    try:
+        while not cancelled.is_set():
+            try:
+                event = events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if event is done:
+                return
+            yield _format_event(event, fmt)
+    finally:
+        cancelled.set()
+
+async def _cancel_on_exit(chunks, cancelled: threading.Event):
+    """
+    Iterate the sync ``chunks`` generator off the event loop and set ``cancelled``
+    however the response ends. A client disconnect cancels this generator, while
+    the sync one would just stay suspended until garbage collection.
+    """
+    try:
+        async for chunk in iterate_in_threadpool(chunks):
+            yield chunk
+    finally:
+        cancelled.set()
+
+@app.post("/search/stream")
+def search_stream(req: SearchRequest, format: Literal["ndjson", "sse"] = "ndjson"):
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    # Validate before the response starts; errors after that can only be stream events
+    _prepare_search(req)
+    cancelled = threading.Event()
+    body = _cancel_on_exit(_stream_search(req, format, cancelled), cancelled)
+    return StreamingResponse(body, media_type=media_type)
+
+@app.post("/jobs", response_model=JobStatus, status_code=202)
+def create_job(req: JobRequest):
+    search_req = SearchRequest(**req.dict(exclude={"priority"}))
+    _prepare_search(search_req)
+    job = scheduler.submit(search_req, priority=req.priority)
+    return _job_status(job)
+
+@app.get("/jobs")
+def jobs_overview():
+    return {**scheduler.stats(), "sessions": sessions.stats()}
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+def get_job(job_id: str):
+    job = scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_status(job)
+
+@app.get("/cache/stats")
+def cache_stats():
+    if result_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **result_cache.stats()}
+
+@app.delete("/cache")
+def clear_cache():
+    if result_cache is not None:
+        result_cache.clear()
+    return {"cleared": result_cache is not None}
+
+@app.get("/selectors/stats")
+def selector_stats():
+    return registry_stats()
+
+@app.get("/pool/stats")
+def pool_stats():
+    if driver_pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **driver_pool.stats()}
+
+@app.get("/runs/stats")
+def runs_stats():
+    return run_registry.stats()
+
+@app.get("/runs/{run_id}/results")
+def run_results(
+    run_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=config.RUNS_MAX_PAGE_SIZE),
+    sort: str = "position",
+    title_contains: Optional[str] = None,
+    url_contains: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+):
+    """One window of a recent run's results; ``sort`` is a field name, prefixed with "-" for descending."""
+    run = run_registry.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found or expired")
+    try:
+        parse_sort(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return run.window(offset, limit, sort, title_contains, url_contains, date_from, date_to)
+
+@app.get("/runs/{run_id}/export")
+def run_export(
+    run_id: str,
+    format: Literal["csv", "xlsx", "parquet", "jsonl"] = "csv",
+    sort: str = "position",
+    title_contains: Optional[str] = None,
+    url_contains: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+):
+    """Every result of a run matching the filters, streamed in the requested format."""
+    run = run_registry.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found or expired")
+    if not export.available(format):
+        raise HTTPException(status_code=503, detail="pyarrow is not installed")
+    try:
+        records = run.iter_results(sort, title_contains, url_contains, date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = export.FORMATS[format]
+    filename = f"search_results_{run_id[:8]}.{extension}"
+    chunks, path = export.iter_export(records, format)
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        # Also runs when the client left before the body was streamed
+        background=BackgroundTask(export.remove_file, path) if path else None,
+    )
+
+def _require_store() -> ResultStore:
+    if result_store is None:
+        raise HTTPException(status_code=404, detail="Result store is disabled")
+    return result_store
+
+@app.get("/history/queries")
+def history_queries(limit: int = Query(50, ge=1, le=1000), offset: int = Query(0, ge=0)):
+    return _require_store().queries(limit, offset)
+
+@app.get("/history/queries/{query_id}/runs")
+def history_runs(query_id: int, limit: int = Query(50, ge=1, le=1000)):
+    return _require_store().runs(query_id, limit)
+
+@app.get("/history/runs/{run_id}")
+def history_run(run_id: int):
+    run = _require_store().run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+@app.get("/history/runs/{run_id}/results")
+def history_run_results(run_id: int, limit: int = Query(1000, ge=1, le=10000), offset: int = Query(0, ge=0)):
+    return _require_store().run_results(run_id, limit, offset)
+
+@app.get("/history/runs/{run_id}/new")
+def history_new_results(run_id: int):
+    """Results not returned by any earlier run of the same query."""
+    return _require_store().new_results(run_id)
+
+@app.get("/history/results")
+def history_results(
+    domain: Optional[str] = None,
+    url: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    query_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=10000),
+    offset: int = Query(0, ge=0),
+):
+    return _require_store().search_results(domain, url, date_from, date_to, query_id, limit, offset)
+
+@app.get("/history/stats")
+def history_stats():
+    if result_store is None:
+        return {"enabled": False}
+    return {"enabled": True, **result_store.stats()}
+
+@app.get("/metrics")
+def metrics_endpoint():
+    rendered = metrics.render()
+    if rendered is None:
+        raise HTTPException(status_code=503, detail="prometheus_client is not installed")
+    body, content_type = rendered
+    return Response(content=body, media_type=content_type)
 
 @app.get("/")
 def health_check():
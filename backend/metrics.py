@@ -0,0 +1,74 @@
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+except ImportError:  # Metrics are optional; /metrics reports them as unavailable
+    Counter = Histogram = None
+
+PAGE_BUCKETS = (1, 2, 5, 10, 20, 30, 50, 100)
+RESULT_BUCKETS = (0, 1, 5, 10, 20, 30, 50, 100)
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+ENABLED = Counter is not None
+
+if ENABLED:
+    SCRAPES = Counter("ddg_scrapes_total", "Scrapes run, by engine and outcome", ["engine", "status"])
+    SCRAPE_SECONDS = Histogram("ddg_scrape_duration_seconds", "End-to-end scrape time", ["engine"],
+                               buckets=STAGE_BUCKETS)
+    STAGE_SECONDS = Histogram("ddg_scrape_stage_seconds", "Time spent in each scrape stage", ["engine", "stage"],
+                              buckets=STAGE_BUCKETS)
+    PAGES_PER_SCRAPE = Histogram("ddg_pages_per_scrape", "Result pages retrieved per scrape", ["engine"],
+                                 buckets=PAGE_BUCKETS)
+    RESULTS_PER_PAGE = Histogram("ddg_results_per_page", "Results extracted per page", ["engine"],
+                                 buckets=RESULT_BUCKETS)
+    FALLBACK_EXTRACTIONS = Counter("ddg_fallback_extractions_total", "Scrapes that fell back to scanning every link")
+    CAPTCHA_DETECTIONS = Counter("ddg_captcha_detections_total", "Scrapes stopped by a block or CAPTCHA page",
+                                 ["engine"])
+    DRIVER_SETUPS = Counter("ddg_driver_setups_total", "Chrome drivers acquired, by setup strategy", ["strategy"])
+    CACHE_HITS = Counter("ddg_cache_hits_total", "Searches served from the result cache")
+    DUPLICATES_DROPPED = Counter("ddg_duplicate_results_dropped_total", "Results dropped as duplicate URLs",
+                                 ["engine"])
+
+
+def record_scrape(engine: str, stats: dict, pages_retrieved: int = 0, failed: bool = False):
+    """Fold one scrape's ``stats`` (as filled in by the scraper) into the exported metrics."""
+    if not ENABLED:
+        return
+    engine = engine or "unknown"
+    SCRAPES.labels(engine, "error" if failed else "ok").inc()
+
+    timings = stats.get("timings") or {}
+    if "total" in timings:
+        SCRAPE_SECONDS.labels(engine).observe(timings["total"])
+    for stage, samples in (stats.get("stage_samples") or {}).items():
+        for seconds in samples:
+            STAGE_SECONDS.labels(engine, stage).observe(seconds)
+
+    if not failed:
+        PAGES_PER_SCRAPE.labels(engine).observe(pages_retrieved)
+    for count in stats.get("page_results") or ():
+        RESULTS_PER_PAGE.labels(engine).observe(count)
+
+    if stats.get("duplicates_dropped"):
+        DUPLICATES_DROPPED.labels(engine).inc(stats["duplicates_dropped"])
+    if stats.get("fallback_extraction"):
+        FALLBACK_EXTRACTIONS.inc()
+    if stats.get("captcha_detected"):
+        CAPTCHA_DETECTIONS.labels(engine).inc()
+    if stats.get("driver_strategy"):
+        record_driver_setup(stats["driver_strategy"])
+
+
+def record_driver_setup(strategy: str):
+    if ENABLED:
+        DRIVER_SETUPS.labels(strategy).inc()
+
+
+def record_cache_hit():
+    if ENABLED:
+        CACHE_HITS.inc()
+
+
+def render():
+    """(body, content type) for the /metrics endpoint, or None without prometheus_client."""
+    if not ENABLED:
+        return None
+    return generate_latest(), CONTENT_TYPE_LATEST
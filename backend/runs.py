@@ -0,0 +1,196 @@
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+import config
+
+SORT_FIELDS = ("position", "title", "url", "published_date")
+FILTER_CACHE_SIZE = 8
+
+
+def parse_sort(sort: str):
+    """``"title"`` / ``"-published_date"`` -> (field, descending); ValueError for unknown fields."""
+    sort = (sort or "position").strip()
+    descending = sort.startswith("-")
+    field = sort.lstrip("+-")
+    if field not in SORT_FIELDS:
+        raise ValueError(f"Cannot sort by {field!r}; expected one of {', '.join(SORT_FIELDS)}")
+    return field, descending
+
+
+class RunIndex:
+    """
+    Results of one search, indexed for windowed reads.
+
+    Sort orders are computed once per field and direction, dates are kept in
+    a sorted array for range lookups, and recent filter results (with their
+    sorted views) are cached so paging through a filtered table is a slice.
+    """
+
+    def __init__(self, run_id: str, query: str, results: list, created_at: float = None):
+        self.run_id = run_id
+        self.query = query
+        self.results = results
+        self.created_at = created_at if created_at is not None else time.time()
+
+        self._titles = [(record.get("title") or "").casefold() for record in results]
+        self._urls = [(record.get("url") or "").casefold() for record in results]
+        dates = [record.get("published_date") or "" for record in results]
+        self._dates = dates
+        self._date_order = sorted((i for i, date in enumerate(dates) if date), key=dates.__getitem__)
+        self._sorted_dates = [dates[i] for i in self._date_order]
+
+        self._orders = {}
+        self._filters = OrderedDict()
+        self._lock = threading.Lock()
+        for field in SORT_FIELDS:
+            self._order(field, False)
+
+    def __len__(self):
+        return len(self.results)
+
+    def _order(self, field: str, descending: bool) -> list:
+        """Result indices sorted by ``field``; empty values always sort last."""
+        key = (field, descending)
+        order = self._orders.get(key)
+        if order is None:
+            if field == "position":
+                order = list(range(len(self.results)))
+                if descending:
+                    order.reverse()
+            else:
+                values = {"title": self._titles, "url": self._urls, "published_date": self._dates}[field]
+                filled = [i for i, value in enumerate(values) if value]
+                # sort() is stable, so ties keep scrape order in both directions
+                filled.sort(key=values.__getitem__, reverse=descending)
+                order = filled + [i for i, value in enumerate(values) if not value]
+            self._orders[key] = order
+        return order
+
+    def _date_range(self, date_from: str = None, date_to: str = None) -> list:
+        start = bisect_left(self._sorted_dates, date_from) if date_from else 0
+        end = bisect_right(self._sorted_dates, date_to) if date_to else len(self._sorted_dates)
+        return sorted(self._date_order[start:end])
+
+    def _matches(self, title: str, url: str, date_from: str, date_to: str) -> list:
+        """Sorted indices of the results passing the filters."""
+        key = (title, url, date_from, date_to)
+        cached = self._filters.get(key)
+        if cached is not None:
+            self._filters.move_to_end(key)
+            return cached["matches"]
+
+        if date_from or date_to:
+            candidates = self._date_range(date_from, date_to)
+        else:
+            candidates = self._narrowest(title, url) or range(len(self.results))
+        titles, urls = self._titles, self._urls
+        matches = [
+            i for i in candidates
+            if (not title or title in titles[i]) and (not url or url in urls[i])
+        ]
+
+        self._filters[key] = {"matches": matches, "views": {}}
+        if len(self._filters) > FILTER_CACHE_SIZE:
+            self._filters.popitem(last=False)
+        return matches
+
+    def _narrowest(self, title: str, url: str):
+        """
+        Smallest cached match list that is a superset of the new filter's, so
+        typing one more character only rescans the previous matches.
+        """
+        best = None
+        for (c_title, c_url, c_from, c_to), cached in self._filters.items():
+            if c_from or c_to or c_title not in title or c_url not in url:
+                continue
+            if best is None or len(cached["matches"]) < len(best):
+                best = cached["matches"]
+        return best
+
+    def _view(self, sort: str, title_contains: str, url_contains: str, date_from: str, date_to: str):
+        """(sort field, descending, sorted indices of the matching results)."""
+        field, descending = parse_sort(sort)
+        title = (title_contains or "").casefold()
+        url = (url_contains or "").casefold()
+
+        with self._lock:
+            order = self._order(field, descending)
+            if not (title or url or date_from or date_to):
+                view = order
+            else:
+                matches = self._matches(title, url, date_from, date_to)
+                views = self._filters[(title, url, date_from, date_to)]["views"]
+                view = views.get((field, descending))
+                if view is None:
+                    if len(matches) == len(self.results):
+                        view = order
+                    else:
+                        selected = bytearray(len(self.results))
+                        for i in matches:
+                            selected[i] = 1
+                        view = [i for i in order if selected[i]]
+                    views[(field, descending)] = view
+        return field, descending, view
+
+    def window(self, offset: int = 0, limit: int = 50, sort: str = None, title_contains: str = None,
+               url_contains: str = None, date_from: str = None, date_to: str = None) -> dict:
+        """One page of results plus the number of results matching the filters."""
+        field, descending, view = self._view(sort, title_contains, url_contains, date_from, date_to)
+        return {
+            "run_id": self.run_id,
+            "query": self.query,
+            "total": len(view),
+            "run_total": len(self.results),
+            "offset": offset,
+            "limit": limit,
+            "sort": f"{'-' if descending else ''}{field}",
+            "results": [self.results[i] for i in view[offset:offset + limit]],
+        }
+
+    def iter_results(self, sort: str = None, title_contains: str = None, url_contains: str = None,
+                     date_from: str = None, date_to: str = None):
+        """Every matching result in the requested order, without copying the list."""
+        view = self._view(sort, title_contains, url_contains, date_from, date_to)[2]
+        return (self.results[i] for i in view)
+
+
+class RunRegistry:
+    """Recent runs kept in memory (LRU, bounded by count and age) for GET /runs/{id}/results."""
+
+    def __init__(self, max_runs: int = None, ttl: float = None):
+        self.max_runs = max_runs if max_runs is not None else config.RUNS_MAX
+        self.ttl = ttl if ttl is not None else config.RUNS_TTL
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, query: str, results: list) -> str:
+        """Index ``results`` and return the new run's id."""
+        run = RunIndex(uuid.uuid4().hex, query, results)
+        with self._lock:
+            self._runs[run.run_id] = run
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+        return run.run_id
+
+    def get(self, run_id: str):
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            if self.ttl and time.time() - run.created_at > self.ttl:
+                del self._runs[run_id]
+                return None
+            self._runs.move_to_end(run_id)
+            return run
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "runs": len(self._runs),
+                "results": sum(len(run) for run in self._runs.values()),
+                "max_runs": self.max_runs,
+                "ttl": self.ttl,
+            }
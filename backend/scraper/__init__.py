@@ -1 +1,8 @@
-from .duckduckgo import DuckDuckGoScraper
\ No newline at end of file
+from .duckduckgo import DuckDuckGoScraper
+from .pool import DriverPool
+from .bootstrap import DriverBootstrap, get_bootstrap
+from .html_engine import HtmlScraper
+from .engines import ENGINES, scrape_with_engine
+from .sharding import SHARD_MODES, scrape_sharded, split_date_range
+from .selector_registry import SelectorRegistry, registry_stats
+from .records import ResultRecord, as_dicts, to_dataframe
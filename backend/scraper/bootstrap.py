@@ -0,0 +1,163 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+import config
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("webdriver_manager", "system_chrome", "basic_chrome")
+
+
+def _find_first_existing(paths):
+    for path in paths:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def detect_chrome_binary():
+    """Locate a Chrome/Chromium binary on the system."""
+    binary = _find_first_existing(config.CHROME_BINARY_PATHS)
+    if binary:
+        return binary
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        found = shutil.which(name)
+        if found:
+            return found
+    return None
+
+
+def detect_chrome_version(binary) -> str:
+    """Return the Chrome version string reported by the binary, or 'unknown'."""
+    if not binary:
+        return "unknown"
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except Exception:
+        return "unknown"
+    match = re.search(r"(\d+(?:\.\d+)+)", output or "")
+    return match.group(1) if match else "unknown"
+
+
+class DriverBootstrap:
+    """Resolves Chrome/driver discovery once per process and caches the winning setup on disk."""
+
+    def __init__(self, cache_path: str = None, failure_ttl: float = None):
+        self.cache_path = cache_path or config.DRIVER_CACHE_PATH
+        self.failure_ttl = failure_ttl if failure_ttl is not None else config.DRIVER_STRATEGY_FAILURE_TTL
+        self._lock = threading.RLock()
+        self._resolved = False
+        self.chrome_binary = None
+        self.chrome_version = "unknown"
+        self.system_driver_path = None
+        self._manager_path = None
+        self._entry = {}
+
+    def resolve(self):
+        """Probe the filesystem and load the cache entry for the installed Chrome version."""
+        with self._lock:
+            if self._resolved:
+                return self
+            self.chrome_binary = detect_chrome_binary()
+            self.chrome_version = detect_chrome_version(self.chrome_binary)
+            self.system_driver_path = _find_first_existing(config.CHROMEDRIVER_PATHS)
+            self._entry = self._load_cache().get(self.chrome_version, {})
+
+            cached_driver = self._entry.get("driver_path")
+            if self._entry.get("strategy") == "webdriver_manager" and cached_driver and os.path.exists(cached_driver):
+                self._manager_path = cached_driver
+
+            self._resolved = True
+            logger.info("🔧 Chrome %s at %s; cached strategy: %s", self.chrome_version,
+                        self.chrome_binary or "default location", self._entry.get("strategy") or "none")
+            return self
+
+    @property
+    def strategy(self):
+        return self._entry.get("strategy")
+
+    def ordered_strategies(self) -> list:
+        """Strategies to try: cached winner first, recently failed ones skipped."""
+        self.resolve()
+        with self._lock:
+            now = time.time()
+            failed = self._entry.get("failed", {})
+            winner = self._entry.get("strategy")
+
+            ordered = [winner] if winner in STRATEGIES else []
+            ordered += [s for s in STRATEGIES if s != winner]
+            fresh = [s for s in ordered if s == winner or now - failed.get(s, 0) > self.failure_ttl]
+            # Never leave the caller with nothing to try
+            return fresh or ordered
+
+    def webdriver_manager_path(self) -> str:
+        """ChromeDriverManager().install() once per process (or reuse the cached path)."""
+        self.resolve()
+        with self._lock:
+            if not self._manager_path or not os.path.exists(self._manager_path):
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                self._manager_path = ChromeDriverManager().install()
+            return self._manager_path
+
+    def record_success(self, strategy: str, driver_path: str = None, binary_path: str = None):
+        with self._lock:
+            if (self._entry.get("strategy") == strategy and self._entry.get("driver_path") == driver_path
+                    and not self._entry.get("failed", {}).get(strategy)):
+                return
+            self._entry["strategy"] = strategy
+            self._entry["driver_path"] = driver_path
+            self._entry["binary_path"] = binary_path
+            self._entry.get("failed", {}).pop(strategy, None)
+            self._save()
+
+    def record_failure(self, strategy: str):
+        with self._lock:
+            self._entry.setdefault("failed", {})[strategy] = time.time()
+            if self._entry.get("strategy") == strategy:
+                # The cached winner stopped working (e.g. Chrome was updated underneath us)
+                self._entry["strategy"] = None
+                self._entry["driver_path"] = None
+                self._manager_path = None
+            self._save()
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        data = self._load_cache()
+        data[self.chrome_version] = self._entry
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("⚠️ Could not write driver bootstrap cache: %s", e)
+
+
+_bootstrap = None
+_bootstrap_lock = threading.Lock()
+
+
+def get_bootstrap() -> DriverBootstrap:
+    """Process-wide DriverBootstrap instance."""
+    global _bootstrap
+    with _bootstrap_lock:
+        if _bootstrap is None:
+            _bootstrap = DriverBootstrap()
+        return _bootstrap
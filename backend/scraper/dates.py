@@ -0,0 +1,121 @@
+import datetime
+import re
+from functools import lru_cache
+
+import config
+
+_MONTH_NAMES = (
+    "Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|"
+    "January|February|March|April|May|June|July|August|September|October|November|December"
+)
+
+# Dates like "Mar 19, 2025" or "March 19, 2025" inside a date element
+ENGLISH_DATE = re.compile(rf"({_MONTH_NAMES})\s+(\d{{1,2}}),?\s+(\d{{4}})", re.IGNORECASE)
+DAYS_AGO = re.compile(r"(\d+)\s+days?\s+ago", re.IGNORECASE)
+
+# Stricter variants used to spot a date anywhere in an article's text
+ENGLISH_DATE_IN_TEXT = re.compile(rf"\b(?:{_MONTH_NAMES})\s+\d{{1,2}},?\s+\d{{4}}\b")
+DAYS_AGO_IN_TEXT = re.compile(r"\b\d+\s+days?\s+ago\b")
+
+MONTHS = {
+    'jan': 1, 'january': 1,
+    'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4,
+    'may': 5,
+    'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'september': 9,
+    'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12
+}
+
+DATE_FORMATS = (
+    '%B %d, %Y',    # March 19, 2025
+    '%b %d, %Y',    # Mar 19, 2025
+    '%B %d %Y',     # March 19 2025
+    '%b %d %Y',     # Mar 19 2025
+    '%Y-%m-%d',     # 2025-03-19
+    '%m/%d/%Y',     # 03/19/2025
+    '%d/%m/%Y',     # 19/03/2025
+    '%Y/%m/%d',     # 2025/03/19
+)
+
+
+def find_date_text(text: str):
+    """Last-resort search for something date-like in free article text."""
+    match = ENGLISH_DATE_IN_TEXT.search(text)
+    if match:
+        return match.group(0).strip()
+    if 'Today' in text:
+        return 'Today'
+    match = DAYS_AGO_IN_TEXT.search(text)
+    if match:
+        return match.group(0).strip()
+    return None
+
+
+@lru_cache(maxsize=config.DATE_CACHE_SIZE)
+def normalize_date(date_text: str, today: datetime.date):
+    """
+    Convert raw English date text to an ISO date string, or None.
+
+    Relative dates ("Today", "Yesterday", "3 days ago") are resolved against
+    ``today``, which is also part of the cache key.
+    """
+    date_text = date_text.strip()
+
+    if "Today" in date_text or "today" in date_text:
+        return today.isoformat()
+
+    match = DAYS_AGO.search(date_text)
+    if match:
+        return (today - datetime.timedelta(days=int(match.group(1)))).isoformat()
+
+    if "Yesterday" in date_text or "yesterday" in date_text:
+        return (today - datetime.timedelta(days=1)).isoformat()
+
+    match = ENGLISH_DATE.search(date_text)
+    if match:
+        month_num = MONTHS.get(match.group(1).lower())
+        if month_num:
+            try:
+                return datetime.date(int(match.group(3)), month_num, int(match.group(2))).isoformat()
+            except ValueError:
+                return None
+
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(date_text, date_format).date().isoformat()
+        except ValueError:
+            continue
+
+    return None
+
+
+class DateNormalizer:
+    """Normalizes raw date text against a single reference "now" (one per scrape)."""
+
+    def __init__(self, reference: datetime.datetime = None):
+        self.today = (reference or datetime.datetime.now()).date()
+
+    def parse(self, date_text: str):
+        """ISO date for ``date_text``, or None if it can't be parsed."""
+        if not date_text:
+            return None
+        try:
+            return normalize_date(date_text, self.today)
+        except Exception:
+            return None
+
+    def parse_many(self, date_texts) -> list:
+        """Normalize a whole column of raw date strings in one call."""
+        seen = {}
+        parsed = []
+        for date_text in date_texts:
+            if date_text not in seen:
+                seen[date_text] = self.parse(date_text)
+            parsed.append(seen[date_text])
+        return parsed
@@ -1,33 +1,225 @@
 import datetime
+import json
 import os
-from urllib.parse import quote_plus
 import time
-import re
-
-import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from urllib.parse import quote_plus
 
 import config
+from .bootstrap import get_bootstrap
+from .dates import DateNormalizer, find_date_text
+from .log import scrape_logger
+from .records import ResultRecord, to_dataframe
+from .parsing import (
+    DATE_SELECTOR_GROUP,
+    LINK_SELECTORS,
+    PRIMARY_DATE_SELECTOR,
+    RESULT_SELECTORS,
+    fragment_nodes,
+    make_soup,
+)
+from .timing import StageTimer
+from .urls import Deduplicator
+from .selector_registry import LINK_REGISTRY, RESULT_REGISTRY
+
+# Defines findSelector(selectors): queries all candidates at once, then returns the
+# highest-ranked selector that matched any node (or null)
+FIND_SELECTOR_JS = """
+    function findSelector(selectors) {
+        let nodes = [];
+        try {
+            nodes = document.querySelectorAll(selectors.join(', '));
+        } catch (e) {
+            for (const candidate of selectors) {
+                try { if (document.querySelector(candidate)) return candidate; } catch (err) {}
+            }
+            return null;
+        }
+        if (!nodes.length) return null;
+        for (const candidate of selectors) {
+            for (const node of nodes) {
+                if (node.matches(candidate)) return candidate;
+            }
+        }
+        return null;
+    }
+"""
+
+def _more_results_rules():
+    """
+    Split MORE_RESULTS_SELECTORS into plain CSS selectors and [tag, text] rules for the
+    jQuery-style ``tag:contains('text')`` entries, which CSS cannot express.
+    """
+    css_selectors = [s for s in config.MORE_RESULTS_SELECTORS if ':contains(' not in s]
+    text_rules = [
+        [s.split(':contains(')[0], s.split(":contains('")[1].split("')")[0]]
+        for s in config.MORE_RESULTS_SELECTORS if ':contains(' in s
+    ]
+    return css_selectors, text_rules
+
+# Counted before and after each "More results" click to detect newly loaded results
+RESULT_COUNT_SELECTOR = "article, .result, [data-testid='result']"
+
+# Helpers for execute_async_script, with arguments (cssSelectors, textRules, countSelector, timeout).
+# waitFor() re-evaluates a check whenever the DOM changes and calls done() with its first
+# truthy result, so pagination waits end as soon as DuckDuckGo has responded.
+PAGINATION_JS = """
+    const [cssSelectors, textRules, countSelector] = arguments;
+
+    function noMoreResults() {
+        return !!document.body && document.body.innerText.includes('No more results found for');
+    }
+
+    function isVisible(el) {
+        return !!el && !el.disabled && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+
+    function findMoreButton() {
+        if (noMoreResults()) return {state: 'end'};
+        if (cssSelectors.length) {
+            for (const el of document.querySelectorAll(cssSelectors.join(', '))) {
+                if (isVisible(el)) return {state: 'button', element: el};
+            }
+        }
+        for (const [tag, text] of textRules) {
+            for (const el of document.getElementsByTagName(tag)) {
+                if (el.textContent.includes(text) && isVisible(el)) return {state: 'button', element: el};
+            }
+        }
+        return null;
+    }
+
+    function newResultsSince(count) {
+        if (document.querySelectorAll(countSelector).length > count) return {state: 'loaded'};
+        if (noMoreResults()) return {state: 'end'};
+        return null;
+    }
+
+    function waitFor(check, timeoutMs, done) {
+        let finished = false;
+        let scheduled = false;
+        let observer = null;
+        let timer = null;
+
+        function finish(value) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            done(value);
+        }
+
+        function evaluate() {
+            scheduled = false;
+            let value = null;
+            try { value = check(); } catch (e) {}
+            if (value) finish(value);
+        }
+
+        evaluate();
+        if (finished) return;
+
+        // Batch bursts of mutations into one check
+        observer = new MutationObserver(() => {
+            if (!scheduled) {
+                scheduled = true;
+                setTimeout(evaluate, 50);
+            }
+        });
+        observer.observe(document.documentElement, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            attributeFilter: ['style', 'class', 'hidden', 'disabled'],
+        });
+        timer = setTimeout(() => finish({state: 'timeout'}), timeoutMs);
+    }
+"""
+
+# Appended to FIND_SELECTOR_JS. Arguments: (resultSelectors, start, lockedSelector,
+# linkSelectors, dateSelectors). Mirrors _parse_articles: the title is the stripped text
+# of the first link selector with an href, the date the stripped text of the first
+# date selector with text. Whole article text is only returned when no date element
+# matched, for the Python-side regex fallback.
+EXTRACT_RECORDS_JS = """
+    const [resultSelectors, start, lockedSelector, linkSelectors, dateSelectors] = arguments;
+
+    function strings(root) {
+        const out = [];
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+            acceptNode(node) {
+                const parent = node.parentNode ? node.parentNode.nodeName : '';
+                return (parent === 'SCRIPT' || parent === 'STYLE' || parent === 'TEMPLATE')
+                    ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+            }
+        });
+        while (walker.nextNode()) out.push(walker.currentNode.nodeValue);
+        return out;
+    }
+
+    function strippedText(el) {
+        return strings(el).map(s => s.trim()).filter(Boolean).join('');
+    }
+
+    const selector = lockedSelector || findSelector(resultSelectors);
+    if (!selector) return {selector: null, total: 0, records: []};
+    const nodes = document.querySelectorAll(selector);
+    const records = [];
+
+    for (let i = start; i < nodes.length; i++) {
+        const node = nodes[i];
+        try {
+            let link = null;
+            let linkSelector = null;
+            for (const candidate of linkSelectors) {
+                const el = node.querySelector(candidate);
+                if (el && el.getAttribute('href')) { link = el; linkSelector = candidate; break; }
+            }
+            if (!link) { records.push({linkSelector: null}); continue; }
+
+            let dateText = null;
+            for (const candidate of dateSelectors) {
+                const el = node.querySelector(candidate);
+                const text = el ? strippedText(el) : '';
+                if (text) { dateText = text; break; }
+            }
+
+            records.push({
+                linkSelector: linkSelector,
+                title: strippedText(link),
+                href: link.getAttribute('href'),
+                dateText: dateText,
+                text: dateText ? null : strings(node).join(''),
+            });
+        } catch (e) {
+            records.push({linkSelector: null});
+        }
+    }
+    return {selector: selector, total: nodes.length, records: records};
+"""
 
 class DuckDuckGoScraper:
     """DuckDuckGo search results scraper using Selenium."""
 
-    def __init__(self):
-        # This constructor is intentionally left empty because
-        # all configuration and setup are handled in other methods.
-        pass
+    def __init__(self, extraction_mode: str = None, base_url: str = None):
+        self.base_url = (base_url or config.DDG_BASE_URL).rstrip('/')
+        # Relative dates ("3 days ago") are resolved against one reference time;
+        # scrape() resets it so every result of a run shares the same "now"
+        self.dates = DateNormalizer()
+        # "html" ships result nodes' outerHTML to Python; "browser" extracts records in the page
+        self.extraction_mode = extraction_mode or config.EXTRACTION_MODE
+        # "poll" (WebDriverWait) or "observer" (in-page MutationObserver) for pagination
+        self.pagination_wait = config.PAGINATION_WAIT
+        # Per-scrape statistics (network usage, stage timings, ...) filled in by scrape()
+        self.stats = {}
+        self.timer = StageTimer()
+        # Per-article messages are DEBUG, so they cost one level check when disabled
+        self.log = scrape_logger(__name__)
 
     def _setup_driver(self, headless: bool = True):
         """Setup and configure Chrome driver with performance optimizations."""
+        # Selenium is imported on first use so the API and HTTP engine start without it
+        from selenium.webdriver.chrome.options import Options
+
         chrome_options = Options()
         
         # Basic Chrome options
@@ -85,26 +277,37 @@ class DuckDuckGoScraper:
             }
         })
         
-        # Rest of setup method remains the same...
+        # Network-only performance log, read back after each scrape to count blocked requests
+        if config.BLOCK_NETWORK_REQUESTS:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        
+        # Discovery is resolved once per process; the cached winning strategy goes first
+        # and strategies that failed recently are skipped.
+        bootstrap = get_bootstrap()
         driver = None
         last_error = None
         
-        setup_methods = [
-            ("WebDriver Manager", self._setup_with_webdriver_manager),
-            ("System Chrome", self._setup_with_system_chrome),
-            ("Basic Chrome", self._setup_basic_chrome)
-        ]
+        setup_methods = {
+            "webdriver_manager": ("WebDriver Manager", self._setup_with_webdriver_manager),
+            "system_chrome": ("System Chrome", self._setup_with_system_chrome),
+            "basic_chrome": ("Basic Chrome", self._setup_basic_chrome)
+        }
         
-        for method_name, setup_func in setup_methods:
+        for strategy in bootstrap.ordered_strategies():
+            method_name, setup_func = setup_methods[strategy]
             try:
-                print(f"Attempting {method_name} setup...")
-                driver = setup_func(chrome_options)
+                self.log.info("Attempting %s setup...", method_name)
+                driver, driver_path = setup_func(chrome_options, bootstrap)
                 if driver:
-                    print(f"✅ {method_name} setup successful")
+                    self.log.info("✅ %s setup successful", method_name)
+                    bootstrap.record_success(strategy, driver_path, chrome_options.binary_location)
+                    self.stats["driver_strategy"] = strategy
                     break
             except Exception as e:
                 last_error = e
-                print(f"❌ {method_name} failed: {e}")
+                bootstrap.record_failure(strategy)
+                self.log.warning("❌ %s failed: %s", method_name, e)
                 continue
         
         if not driver:
@@ -122,15 +325,71 @@ class DuckDuckGoScraper:
         try:
             self._apply_stealth_settings(driver)
         except Exception as e:
-            print(f"Warning: Could not apply stealth settings: {e}")
+            self.log.warning("Could not apply stealth settings: %s", e)
+        
+        # Block fonts, stylesheets, favicons and trackers at the network level
+        if config.BLOCK_NETWORK_REQUESTS:
+            try:
+                self._apply_network_blocking(driver)
+            except Exception as e:
+                self.log.warning("Could not apply network blocking: %s", e)
         
         return driver
 
-    def _setup_with_webdriver_manager(self, chrome_options):
+    def _apply_network_blocking(self, driver):
+        """Block unneeded requests through the Chrome DevTools Protocol."""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.BLOCKED_URL_PATTERNS})
+
+    def _collect_network_stats(self, driver) -> dict:
+        """
+        Drain the performance log and summarize network activity since the last call.
+        
+        Blocked requests never report a size, so ``estimated_bytes_saved`` uses the
+        typical sizes in ``config.BLOCKED_BYTES_ESTIMATE``.
+        """
+        stats = {
+            "requests": 0,
+            "bytes_transferred": 0,
+            "blocked_requests": 0,
+            "blocked_by_type": {},
+            "estimated_bytes_saved": 0,
+        }
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return stats
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            
+            if method == "Network.requestWillBeSent":
+                stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                stats["bytes_transferred"] += int(params.get("encodedDataLength") or 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                resource_type = params.get("type", "Other")
+                stats["blocked_requests"] += 1
+                stats["blocked_by_type"][resource_type] = stats["blocked_by_type"].get(resource_type, 0) + 1
+                stats["estimated_bytes_saved"] += config.BLOCKED_BYTES_ESTIMATE.get(
+                    resource_type, config.BLOCKED_BYTES_ESTIMATE["Other"]
+                )
+        
+        return stats
+
+    def _setup_with_webdriver_manager(self, chrome_options, bootstrap):
         """Setup using webdriver-manager with enhanced error handling."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
         try:
-            # Download and install the correct ChromeDriver
-            driver_path = ChromeDriverManager().install()
+            # Install the correct ChromeDriver once per process and reuse the path
+            driver_path = bootstrap.webdriver_manager_path()
             service = Service(driver_path)
             
             # Add service arguments for better stability
@@ -138,70 +397,55 @@ class DuckDuckGoScraper:
             
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
-            return driver
+            return driver, driver_path
             
         except Exception as e:
-            print(f"WebDriver Manager failed: {e}")
+            self.log.warning("WebDriver Manager failed: %s", e)
             raise
 
-    def _setup_with_system_chrome(self, chrome_options):
+    def _setup_with_system_chrome(self, chrome_options, bootstrap):
         """Setup using system Chrome/Chromium."""
-        # Look for system Chrome/Chromium
-        chrome_paths = [
-            '/usr/bin/chromium',
-            '/usr/bin/chromium-browser', 
-            '/usr/bin/google-chrome',
-            '/usr/bin/google-chrome-stable'
-        ]
-        
-        chrome_binary = None
-        for path in chrome_paths:
-            if os.path.exists(path):
-                chrome_binary = path
-                print(f"Found Chrome at: {path}")
-                break
-        
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        chrome_binary = bootstrap.chrome_binary
         if not chrome_binary:
             raise Exception("No system Chrome/Chromium found")
         
         chrome_options.binary_location = chrome_binary
         
-        # Try to find system ChromeDriver
-        driver_paths = [
-            '/usr/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/usr/bin/chromium-driver'
-        ]
-        
-        for driver_path in driver_paths:
-            if os.path.exists(driver_path):
-                try:
-                    service = Service(driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    driver.set_page_load_timeout(30)
-                    return driver
-                except Exception as e:
-                    print(f"Failed with system driver {driver_path}: {e}")
-                    continue
+        # Use the system ChromeDriver found during bootstrap
+        driver_path = bootstrap.system_driver_path
+        if driver_path:
+            try:
+                service = Service(driver_path)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+                driver.set_page_load_timeout(30)
+                return driver, driver_path
+            except Exception as e:
+                self.log.warning("Failed with system driver %s: %s", driver_path, e)
         
         # Fallback to webdriver-manager for system Chrome
         try:
-            service = Service(ChromeDriverManager().install())
+            driver_path = bootstrap.webdriver_manager_path()
+            service = Service(driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
             driver.set_page_load_timeout(30)
-            return driver
+            return driver, driver_path
         except Exception as e:
             raise Exception(f"System Chrome setup failed: {e}")
 
-    def _setup_basic_chrome(self, chrome_options):
+    def _setup_basic_chrome(self, chrome_options, bootstrap):
         """Basic Chrome setup as last resort."""
+        from selenium import webdriver
+
         # Remove binary location to use default
         chrome_options.binary_location = None
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
             driver.set_page_load_timeout(30)
-            return driver
+            return driver, None
         except Exception as e:
             raise Exception(f"Basic Chrome setup failed: {e}")
 
@@ -240,37 +484,39 @@ class DuckDuckGoScraper:
         try:
             driver.execute_script(stealth_script)
         except Exception as e:
-            print(f"Could not execute stealth script: {e}")
+            self.log.warning("Could not execute stealth script: %s", e)
 
     def _wait_for_results(self, driver) -> bool:
-        """Wait for search results with enhanced selectors."""
-        wait = WebDriverWait(driver, 15)  # Increased timeout
+        """Wait for search results, checking every result selector in one DOM query per poll."""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        candidates = RESULT_REGISTRY.ordered()
         
-        # Try each selector with different strategies
-        for selector in config.RESULT_SELECTORS:
-            try:
-                if selector.startswith('#'):
-                    elements = wait.until(EC.presence_of_all_elements_located((By.ID, selector[1:])))
-                elif selector.startswith('.'):
-                    elements = wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector[1:])))
-                else:
-                    elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                
-                if elements:
-                    print(f"✅ Found {len(elements)} results with selector: {selector}")
-                    return True
-                    
-            except TimeoutException:
-                print(f"⏰ Timeout waiting for selector: {selector}")
-                continue
-            except Exception as e:
-                print(f"❌ Error with selector {selector}: {e}")
-                continue
+        try:
+            selector = WebDriverWait(driver, 15).until(
+                lambda d: d.execute_script(FIND_SELECTOR_JS + "return findSelector(arguments[0]);", candidates)
+            )
+        except TimeoutException:
+            RESULT_REGISTRY.record_miss()
+            self.log.warning("⏰ Timeout waiting for any result selector")
+            return False
+        except Exception as e:
+            RESULT_REGISTRY.record_miss()
+            self.log.error("❌ Error waiting for results: %s", e)
+            return False
         
-        return False
+        RESULT_REGISTRY.record_hit(selector)
+        self.log.debug("✅ Found results with selector: %s", selector)
+        return True
 
     def _handle_page_not_loaded(self, driver):
         """Optimized page loading error handling."""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             # Quick checks first
             page_url = driver.current_url
@@ -284,14 +530,13 @@ class DuckDuckGoScraper:
                 };
             """)
             
-            print(f"🔍 Debug Info:")
-            print(f"   Title: {page_info['title']}")
-            print(f"   URL: {page_url}")
-            print(f"   Content preview: {page_info['bodyText'][:100]}...")
+            self.log.info("🔍 Page not loaded: title=%r url=%s content=%r...",
+                          page_info["title"], page_url, page_info["bodyText"][:100])
             
             # Check for blocking patterns
             blocking_keywords = ['blocked', 'captcha', 'verify', 'protection', 'cloudflare', 'access denied']
             if any(keyword in page_info['bodyText'].lower() for keyword in blocking_keywords):
+                self.stats["captcha_detected"] = True
                 raise RuntimeError(f"❌ Page blocked or CAPTCHA detected.")
             
             # Verify we're on DuckDuckGo
@@ -299,7 +544,7 @@ class DuckDuckGoScraper:
                 raise RuntimeError(f"❌ Wrong page loaded. Expected DuckDuckGo, got: {page_info['title']}")
             
             # Quick recovery attempt
-            print("🔄 Attempting page recovery...")
+            self.log.info("🔄 Attempting page recovery...")
             
             # Single scroll to trigger any lazy loading
             driver.execute_script("window.scrollTo(0, Math.min(500, document.body.scrollHeight));")
@@ -314,176 +559,226 @@ class DuckDuckGoScraper:
                 EC.presence_of_element_located((By.CSS_SELECTOR, "article, .result, [data-testid='result']"))
             )
             
-            print("✅ Page recovery successful")
+            self.log.info("✅ Page recovery successful")
             return True
             
         except TimeoutException:
             raise RuntimeError("❌ Could not find search results after recovery attempts")
         except Exception as e:
-            print(f"❌ Page handling error: {e}")
+            self.log.error("❌ Page handling error: %s", e)
             raise
 
-    def _click_more_results(self, driver, max_clicks: int, progress_callback=None) -> int:
-        """Enhanced more results clicking with progress tracking."""
+    def _wait_in_page(self, driver, check: str, timeout: float) -> dict:
+        """
+        Run ``check`` (an expression over the PAGINATION_JS helpers) inside the page and
+        resolve as soon as a DOM mutation makes it truthy, instead of polling from Python.
+        
+        Returns:
+            The check's result, or {"state": "timeout"}
+        """
+        css_selectors, text_rules = _more_results_rules()
+        driver.set_script_timeout(timeout + 5)
+        outcome = driver.execute_async_script(
+            PAGINATION_JS + f"waitFor(() => {check}, arguments[3] * 1000, arguments[arguments.length - 1]);",
+            css_selectors, text_rules, RESULT_COUNT_SELECTOR, timeout,
+        )
+        return outcome or {"state": "timeout"}
+
+    def _next_page_observer(self, driver, initial_results: int, timeout: float, report) -> str:
+        """Find and click "More results" with in-page MutationObserver waits."""
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        
+        # Resolves as soon as the button or the "No more results" marker shows up
+        outcome = self._wait_in_page(driver, "findMoreButton()", timeout)
+        if outcome.get("state") == "end":
+            return "end"
+        if outcome.get("state") != "button":
+            return "no_button"
+        
+        report("Clicking 'More results'...")
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", outcome["element"])
+        report("Waiting for new content to load...")
+        
+        # Resolves on the first DOM mutation that adds result nodes
+        loaded = self._wait_in_page(driver, f"newResultsSince({int(initial_results)})", timeout * 2)
+        return loaded.get("state", "timeout")
+
+    def _next_page_polling(self, driver, initial_results: int, timeout: float, report) -> str:
+        """Find and click "More results" by polling the page from Python."""
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        css_selectors, text_rules = _more_results_rules()
+        css = ", ".join(css_selectors)
+        xpath = " | ".join(f"//{tag}[contains(., '{text}')]" for tag, text in text_rules)
+        no_more_results = "return document.body.innerText.includes('No more results found for');"
+        
+        def find_button(d):
+            # One combined lookup per poll instead of a full timeout per selector
+            if d.execute_script(no_more_results):
+                return "end"
+            candidates = d.find_elements(By.CSS_SELECTOR, css) if css else []
+            if xpath:
+                candidates += d.find_elements(By.XPATH, xpath)
+            return next((el for el in candidates if el.is_displayed() and el.is_enabled()), False)
+        
+        def new_results(d):
+            # Marker first: the last page's results arrive together with it, so counting
+            # afterwards cannot miss them
+            end = d.execute_script(no_more_results)
+            if len(d.find_elements(By.CSS_SELECTOR, RESULT_COUNT_SELECTOR)) > initial_results:
+                return "loaded"
+            return "end" if end else False
+        
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        
+        try:
+            element = WebDriverWait(
+                driver, timeout, poll_frequency=0.1, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(find_button)
+        except TimeoutException:
+            return "no_button"
+        if element == "end":
+            return "end"
+        
+        report("Clicking 'More results'...")
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
+        report("Waiting for new content to load...")
+        
+        try:
+            return WebDriverWait(driver, timeout * 2, poll_frequency=0.1).until(new_results)
+        except TimeoutException:
+            return "timeout"
+
+    def _next_page(self, driver, initial_results: int, timeout: float, report) -> str:
+        """
+        Load the next page of results.
+        
+        Returns:
+            "loaded", "end" (no more results), "timeout" (clicked, nothing new) or "no_button"
+        """
+        if self.pagination_wait == "observer":
+            from selenium.common.exceptions import WebDriverException
+            
+            try:
+                return self._next_page_observer(driver, initial_results, timeout, report)
+            except WebDriverException as e:
+                # Script errors or async-script timeouts: poll from Python for the rest of the session
+                self.log.warning("⚠️ In-page pagination wait failed, polling instead: %s", e)
+                self.pagination_wait = "poll"
+        return self._next_page_polling(driver, initial_results, timeout, report)
+
+    def _click_more_results(self, driver, max_clicks: int, progress_callback=None, on_page_loaded=None) -> int:
+        """Enhanced more results clicking with progress tracking.
+        
+        ``on_page_loaded(pages_retrieved)`` is called for the initial page and after
+        every page that loads successfully, so results can be extracted as they arrive.
+        """
         pages_retrieved = 1
         consecutive_failures = 0
         max_consecutive_failures = 3
         
-        print(f"🔄 Attempting to load {max_clicks} pages (Cloud optimized)...")
+        self.log.info("🔄 Attempting to load %d pages...", max_clicks)
         
         # Initial progress update
         if progress_callback:
             progress_callback(pages_retrieved, max_clicks, "Loaded initial page")
         
+        if on_page_loaded:
+            on_page_loaded(pages_retrieved)
+        
+        # Longer wait for cloud environments
+        cloud_timeout = 30 if os.getenv('STREAMLIT_SHARING') or os.getenv('STREAMLIT_CLOUD') else 20
+        
+        def report(message):
+            if progress_callback:
+                progress_callback(pages_retrieved, max_clicks, message)
+        
         for i in range(max_clicks - 1):
+            page_started = time.perf_counter()
             try:
-                # Stop if "No more results found for" appears anywhere on the page
-                if driver.execute_script("return document.body.innerText.includes('No more results found for');"):
-                    print("🛑 No more results found message detected.")
-                    if progress_callback:
-                        progress_callback(pages_retrieved, max_clicks, "🛑 No more results found, stopping pagination.")
-                    break
-
                 # Update progress at start of each page attempt
-                if progress_callback:
-                    progress_callback(pages_retrieved, max_clicks, f"Loading page {pages_retrieved + 1}...")
-                
-                # Longer wait for cloud environments
-                cloud_timeout = 30 if os.getenv('STREAMLIT_SHARING') or os.getenv('STREAMLIT_CLOUD') else 20
-                wait = WebDriverWait(driver, cloud_timeout)
+                report(f"Loading page {pages_retrieved + 1}...")
                 
                 # Store initial result count
-                initial_results = len(driver.find_elements(By.CSS_SELECTOR, "article, .result, [data-testid='result']"))
-                
-                # Update progress - scrolling
-                if progress_callback:
-                    progress_callback(pages_retrieved, max_clicks, f"Scrolling to find more results button...")
+                initial_results = driver.execute_script(
+                    "return document.querySelectorAll(arguments[0]).length;", RESULT_COUNT_SELECTOR
+                )
                 
-                # More conservative scrolling for cloud
-                driver.execute_script("""
-                    window.scrollTo({
-                        top: document.body.scrollHeight - window.innerHeight,
-                        behavior: 'smooth'
-                    });
-                """)
+                # Update progress - finding button
+                report("Looking for 'More results' button...")
                 
-                # Wait longer for page stabilization in cloud
-                time.sleep(0.5 if os.getenv('STREAMLIT_SHARING') or os.getenv('STREAMLIT_CLOUD') else 0.3)
+                state = self._next_page(driver, initial_results, cloud_timeout, report)
                 
-                # Wait for document ready with longer timeout
-                WebDriverWait(driver, cloud_timeout).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
+                if state == "end":
+                    self.stats["end_of_results"] = True
+                    self.log.info("🛑 No more results found message detected.")
+                    report("🛑 No more results found, stopping pagination.")
+                    break
                 
-                button_found = False
+                if state == "loaded":
+                    self.timer.record("pagination", time.perf_counter() - page_started)
+                    pages_retrieved += 1
+                    consecutive_failures = 0  # Reset failure counter
+                    self.log.info("✅ Loaded page %d", pages_retrieved)
+                    
+                    # Update progress - success
+                    report(f"✅ Successfully loaded page {pages_retrieved}")
+                    
+                    if on_page_loaded:
+                        on_page_loaded(pages_retrieved)
+                    continue
                 
-                # Update progress - finding button
-                if progress_callback:
-                    progress_callback(pages_retrieved, max_clicks, f"Looking for 'More results' button...")
+                if state == "timeout":
+                    self.log.warning("⚠️ Timeout waiting for new content on page %d", i + 2)
+                    report(f"⚠️ Timeout loading page {pages_retrieved + 1}")
                 
-                for selector in config.MORE_RESULTS_SELECTORS:
-                    try:
-                        if ':contains(' in selector:
-                            text = selector.split("':contains('")[1].split("')")[0]
-                            tag = selector.split(':contains(')[0]
-                            xpath = f"//{tag}[contains(text(), '{text}')]"
-                            element = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-                        else:
-                            element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                        
-                        if element and element.is_displayed():
-                            # Update progress - clicking
-                            if progress_callback:
-                                progress_callback(pages_retrieved, max_clicks, f"Clicking 'More results' for page {pages_retrieved + 1}...")
-                            
-                            # Scroll to element with animation
-                            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-                            
-                            # Click using JavaScript
-                            driver.execute_script("arguments[0].click();", element)
-                            
-                            # Update progress - waiting for content
-                            if progress_callback:
-                                progress_callback(pages_retrieved, max_clicks, f"Waiting for new content to load...")
-                            
-                            # Wait for new content with extended timeout for cloud
-                            try:
-                                WebDriverWait(driver, cloud_timeout * 2).until(
-                                    lambda d: len(d.find_elements(By.CSS_SELECTOR, "article, .result, [data-testid='result']")) > initial_results
-                                )
-                                button_found = True
-                                pages_retrieved += 1
-                                consecutive_failures = 0  # Reset failure counter
-                                print(f"✅ Loaded page {pages_retrieved}")
-                                
-                                # Update progress - success
-                                if progress_callback:
-                                    progress_callback(pages_retrieved, max_clicks, f"✅ Successfully loaded page {pages_retrieved}")
-                                break
-                            except TimeoutException:
-                                print(f"⚠️ Timeout waiting for new content on page {i+2}")
-                                consecutive_failures += 1
-                                if progress_callback:
-                                    progress_callback(pages_retrieved, max_clicks, f"⚠️ Timeout loading page {pages_retrieved + 1}")
-                                continue
-                                
-                    except (NoSuchElementException, TimeoutException):
-                        continue
-                    except Exception as e:
-                        print(f"⚠️ Error with selector {selector}: {e}")
-                        continue
+                consecutive_failures += 1
+                self.log.info("🔚 No more results button found (attempt %d)", consecutive_failures)
+                report(f"🔚 No more results available (stopped at page {pages_retrieved})")
                 
-                if not button_found:
-                    consecutive_failures += 1
-                    print(f"🔚 No more results button found (attempt {consecutive_failures})")
-                    if progress_callback:
-                        progress_callback(pages_retrieved, max_clicks, f"🔚 No more results available (stopped at page {pages_retrieved})")
-                    
-                    # Exit early if too many consecutive failures
-                    if consecutive_failures >= max_consecutive_failures:
-                        print(f"❌ Stopping after {consecutive_failures} consecutive failures")
-                        if progress_callback:
-                            progress_callback(pages_retrieved, max_clicks, f"❌ Stopped after {consecutive_failures} consecutive failures")
-                        break
+                # Exit early if too many consecutive failures
+                if consecutive_failures >= max_consecutive_failures:
+                    self.log.warning("❌ Stopping after %d consecutive failures", consecutive_failures)
+                    report(f"❌ Stopped after {consecutive_failures} consecutive failures")
+                    break
                         
             except Exception as e:
                 consecutive_failures += 1
-                print(f"❌ Error loading page {i+2}: {e}")
-                if progress_callback:
-                    progress_callback(pages_retrieved, max_clicks, f"❌ Error loading page {i+2}: {str(e)[:50]}...")
+                self.log.warning("❌ Error loading page %d: %s", i + 2, e)
+                report(f"❌ Error loading page {i+2}: {str(e)[:50]}...")
                 
                 # Exit early if too many consecutive failures
                 if consecutive_failures >= max_consecutive_failures:
-                    print(f"❌ Stopping after {consecutive_failures} consecutive failures")
-                    if progress_callback:
-                        progress_callback(pages_retrieved, max_clicks, f"❌ Stopped after {consecutive_failures} consecutive failures")
+                    self.log.warning("❌ Stopping after %d consecutive failures", consecutive_failures)
+                    report(f"❌ Stopped after {consecutive_failures} consecutive failures")
                     break
         
-        print(f"📊 Successfully loaded {pages_retrieved} pages")
-        if progress_callback:
-            progress_callback(pages_retrieved, max_clicks, f"🎉 Completed! Loaded {pages_retrieved} pages total")
+        self.log.info("📊 Successfully loaded %d pages", pages_retrieved)
+        report(f"🎉 Completed! Loaded {pages_retrieved} pages total")
         
         return pages_retrieved
 
     def _find_title_link(self, article):
         """Find title link with enhanced selector support."""
-        for selector in config.LINK_SELECTORS:
-            try:
-                link = article.select_one(selector)
-                if link and link.get('href'):
-                    return link
-            except Exception:
-                continue
-        return None
+        link, selector = LINK_SELECTORS.first_by_priority(
+            article, accept=lambda element: element.get('href'), order=LINK_REGISTRY.ordered()
+        )
+        if selector:
+            LINK_REGISTRY.record_hit(selector)
+        else:
+            LINK_REGISTRY.record_miss()
+        return link
 
     def _extract_fallback_links(self, soup) -> list:
         """Enhanced fallback link extraction."""
         results = []
-        print("🔄 Using fallback link extraction...")
+        self.log.info("🔄 Using fallback link extraction...")
         
         # Find all links
         all_links = soup.find_all('a', href=True)
-        print(f"🔍 Found {len(all_links)} total links")
+        self.log.debug("🔍 Found %d total links", len(all_links))
         
         for link in all_links:
             try:
@@ -507,244 +802,88 @@ class DuckDuckGoScraper:
                     except:
                         pass
                     
-                    results.append({
-                        "title": title,
-                        "url": href,
-                        "published_date": published_date
-                    })
+                    results.append(ResultRecord(title, href, published_date))
                     
             except Exception as e:
                 continue
         
-        print(f"📊 Fallback extraction found {len(results)} results")
+        self.log.info("📊 Fallback extraction found %d results", len(results))
         return results
 
     def _extract_published_date(self, article):
         """Extract published date from article with English date handling."""
         try:
             # Debug: Print the article HTML to see what we're working with
-            # print(f"🔍 Article HTML snippet: {str(article)[:500]}...")
+            # self.log.debug("🔍 Article HTML snippet: %s...", str(article)[:500])
             
-            date_span = None
             date_text = None
             
-            # Primary selector - the exact class from your example
-            date_span = article.select_one("span.MILR5XIVy9h75WrLvKiq.qsXMqKZNYEaWqGnWVdoa")
+            # One walk over the article for the primary and all fallback selectors,
+            # keeping their priority order
+            date_span, selector = DATE_SELECTOR_GROUP.first_by_priority(
+                article, accept=lambda element: element.get_text(strip=True)
+            )
             if date_span:
                 date_text = date_span.get_text(strip=True)
-                print(f"✅ Found date with primary selector: '{date_text}'")
-            
-            if not date_span or not date_text:
-                # Enhanced fallback selectors - more comprehensive search
-                date_selectors = [
-                    # Class-based selectors
-                    "span[class*='MILR5XIVy9h75WrLvKiq']",
-                    "span[class*='qsXMqKZNYEaWqGnWVdoa']",
-                    "span[class*='date']",
-                    "span[class*='time']",
-                    "span[class*='published']",
-                    "span[class*='timestamp']",
-                    
-                    # Generic time/date elements
-                    "time",
-                    "time[datetime]",
-                    
-                    # Common class names
-                    ".date",
-                    ".published",
-                    ".timestamp",
-                    ".publish-date",
-                    ".post-date",
-                    ".article-date",
-                ]
-                
-                for selector in date_selectors:
-                    try:
-                        date_span = article.select_one(selector)
-                        if date_span:
-                            date_text = date_span.get_text(strip=True)
-                            if date_text:
-                                print(f"✅ Found date with fallback selector '{selector}': '{date_text}'")
-                                break
-                    except Exception as e:
-                        # Continue to next selector if this one fails
-                        continue
+                if selector == PRIMARY_DATE_SELECTOR:
+                    self.log.debug("✅ Found date with primary selector: %r", date_text)
+                else:
+                    self.log.debug("✅ Found date with fallback selector %r: %r", selector, date_text)
             
             if not date_text:
                 # Last resort: search for any text that looks like an English date in the entire article
-                article_text = article.get_text()
-                
-                # Look for English date patterns in the text
-                import re
-                
-                # Pattern for dates like "Mar 19, 2025" or "March 19, 2025"
-                english_date_pattern = r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b'
-                matches = re.findall(english_date_pattern, article_text)
-                if matches:
-                    date_text = matches[0].strip()
-                    print(f"✅ Found date with regex pattern: '{date_text}'")
-                
-                # Pattern for "Today"
-                elif 'Today' in article_text:
-                    date_text = 'Today'
-                    print(f"✅ Found 'Today' in article text")
-                
-                # Pattern for "x days ago" or "x day ago"
-                else:
-                    days_ago_pattern = r'\b\d+\s+days?\s+ago\b'
-                    matches = re.findall(days_ago_pattern, article_text)
-                    if matches:
-                        date_text = matches[0].strip()
-                        print(f"✅ Found days ago pattern: '{date_text}'")
+                date_text = find_date_text(article.get_text())
+                if date_text:
+                    self.log.debug("✅ Found date in article text: %r", date_text)
             
             if not date_text:
-                print("⚠️ No date found in article")
+                self.log.debug("⚠️ No date found in article")
                 return None
             
             # Parse the found date text
             parsed_date = self._parse_english_date(date_text)
             if parsed_date:
-                print(f"✅ Successfully parsed date: '{date_text}' -> '{parsed_date}'")
+                self.log.debug("✅ Successfully parsed date: %r -> %r", date_text, parsed_date)
             else:
-                print(f"⚠️ Failed to parse date: '{date_text}'")
+                self.log.debug("⚠️ Failed to parse date: %r", date_text)
             
             return parsed_date
             
         except Exception as e:
-            print(f"⚠️ Error extracting date: {e}")
+            self.log.debug("⚠️ Error extracting date: %s", e)
             return None
 
     def _parse_english_date(self, date_text: str):
         """Parse English date text and convert to ISO format."""
-        try:
-            current_date = datetime.datetime.now()
-            
-            # Clean up the date text
-            date_text = date_text.strip()
-            print(f"🔍 Parsing date text: '{date_text}'")
-            
-            # Handle "Today"
-            if "Today" in date_text or "today" in date_text:
-                result = current_date.date().isoformat()
-                print(f"✅ Parsed 'Today' as: {result}")
-                return result
-            
-            # Handle "x days ago" or "x day ago"
-            days_ago_pattern = r'(\d+)\s+days?\s+ago'
-            match = re.search(days_ago_pattern, date_text, re.IGNORECASE)
-            if match:
-                days_ago = int(match.group(1))
-                target_date = current_date - datetime.timedelta(days=days_ago)
-                result = target_date.date().isoformat()
-                print(f"✅ Parsed '{days_ago} days ago' as: {result}")
-                return result
-            
-            # Handle "Yesterday"
-            if "Yesterday" in date_text or "yesterday" in date_text:
-                target_date = current_date - datetime.timedelta(days=1)
-                result = target_date.date().isoformat()
-                print(f"✅ Parsed 'Yesterday' as: {result}")
-                return result
-            
-            # Month name mapping (both abbreviated and full)
-            month_mapping = {
-                'jan': 1, 'january': 1,
-                'feb': 2, 'february': 2,
-                'mar': 3, 'march': 3,
-                'apr': 4, 'april': 4,
-                'may': 5,
-                'jun': 6, 'june': 6,
-                'jul': 7, 'july': 7,
-                'aug': 8, 'august': 8,
-                'sep': 9, 'september': 9,
-                'oct': 10, 'october': 10,
-                'nov': 11, 'november': 11,
-                'dec': 12, 'december': 12
-            }
-            
-            # Parse English date formats like "Mar 19, 2025" or "March 19, 2025"
-            # Pattern with optional comma
-            english_date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})'
-            match = re.search(english_date_pattern, date_text, re.IGNORECASE)
-            if match:
-                month_name = match.group(1).lower()
-                day = int(match.group(2))
-                year = int(match.group(3))
-                
-                print(f"🔍 Extracted: month='{month_name}', day={day}, year={year}")
-                
-                # Find month number
-                month_num = month_mapping.get(month_name)
-                
-                if month_num:
-                    try:
-                        parsed_date = datetime.date(year, month_num, day)
-                        result = parsed_date.isoformat()
-                        print(f"✅ Successfully created date: {day}/{month_num}/{year} = {result}")
-                        return result
-                    except ValueError as e:
-                        print(f"⚠️ Invalid date: {day}/{month_num}/{year} - {e}")
-                        return None
-                else:
-                    print(f"⚠️ Could not match English month: '{month_name}'")
-            
-            # Try parsing other common date formats using strptime
-            date_formats = [
-                '%B %d, %Y',    # March 19, 2025
-                '%b %d, %Y',    # Mar 19, 2025
-                '%B %d %Y',     # March 19 2025
-                '%b %d %Y',     # Mar 19 2025
-                '%Y-%m-%d',     # 2025-03-19
-                '%m/%d/%Y',     # 03/19/2025
-                '%d/%m/%Y',     # 19/03/2025
-                '%Y/%m/%d',     # 2025/03/19
-            ]
-            
-            for date_format in date_formats:
-                try:
-                    parsed_date = datetime.datetime.strptime(date_text, date_format).date()
-                    result = parsed_date.isoformat()
-                    print(f"✅ Parsed with format '{date_format}': {result}")
-                    return result
-                except ValueError:
-                    continue
-            
-            # If no pattern matches, return None
-            print(f"⚠️ No matching pattern found for: '{date_text}'")
-            return None
-            
-        except Exception as e:
-            print(f"⚠️ Error parsing English date '{date_text}': {e}")
-            return None
-    
-    def _parse_results(self, html: str) -> list:
-        """Enhanced result parsing with date extraction."""
-        soup = BeautifulSoup(html, "html.parser")
-        results = []
-        
-        print("🔍 Parsing search results...")
-        
-        # Try to find articles using each selector
-        articles = []
-        successful_selector = None
-        
-        for selector in config.RESULT_SELECTORS:
+        return self.dates.parse(date_text)
+
+    def _select_articles(self, soup):
+        """Find result articles using the first matching result selector."""
+        for selector in RESULT_REGISTRY.ordered():
             try:
-                found_articles = soup.select(selector)
+                found_articles = RESULT_SELECTORS.compiled[selector].select(soup)
                 if found_articles:
-                    articles = found_articles
-                    successful_selector = selector
-                    print(f"✅ Found {len(articles)} articles using: {selector}")
-                    break
+                    RESULT_REGISTRY.record_hit(selector)
+                    self.log.debug("✅ Found %d articles using: %s", len(found_articles), selector)
+                    return found_articles
             except Exception as e:
-                print(f"❌ Selector failed {selector}: {e}")
+                self.log.warning("❌ Selector failed %s: %s", selector, e)
                 continue
+        RESULT_REGISTRY.record_miss()
+        return []
+
+    def _clean_href(self, href: str) -> str:
+        """Make protocol-relative and site-relative result links absolute."""
+        if href.startswith('//'):
+            return 'https:' + href
+        if href.startswith('/'):
+            return self.base_url + href
+        return href
+
+    def _parse_articles(self, articles) -> list:
+        """Extract title, URL and published date from result articles."""
+        results = []
         
-        if not articles:
-            print("⚠️ No articles found, trying fallback method...")
-            return self._extract_fallback_links(soup)
-        
-        # Extract data from articles
         for i, article in enumerate(articles):
             try:
                 link = self._find_title_link(article)
@@ -754,29 +893,122 @@ class DuckDuckGoScraper:
                     
                     # Validate result
                     if title and href and len(title) > 5:
-                        # Clean up URL if needed
-                        if href.startswith('//'):
-                            href = 'https:' + href
-                        elif href.startswith('/'):
-                            href = 'https://duckduckgo.com' + href
+                        href = self._clean_href(href)
                         
                         # Extract published date
                         published_date = self._extract_published_date(article)
                         
-                        results.append({
-                            "title": title,
-                            "url": href,
-                            "published_date": published_date
-                        })
+                        results.append(ResultRecord(title, href, published_date))
                         
             except Exception as e:
-                print(f"⚠️ Error parsing article {i}: {e}")
+                self.log.debug("⚠️ Error parsing article %d: %s", i, e)
                 continue
         
-        print(f"📊 Successfully parsed {len(results)} results")
         return results
 
-    def scrape(self, query: str, max_pages: int, headless: bool = True, progress_callback=None, start_date=None, end_date=None) -> tuple[pd.DataFrame, int]:
+    def _parse_results(self, html: str) -> list:
+        """Enhanced result parsing with date extraction."""
+        soup = make_soup(html, body_only=True)
+        
+        self.log.debug("🔍 Parsing search results...")
+        
+        articles = self._select_articles(soup)
+        
+        if not articles:
+            self.log.warning("⚠️ No articles found, trying fallback method...")
+            return self._extract_fallback_links(soup)
+        
+        results = self._parse_articles(articles)
+        
+        self.log.info("📊 Successfully parsed %d results", len(results))
+        return results
+
+    def _extract_new_results(self, driver, state: dict) -> list:
+        """Parse only the result nodes added to the page since the previous call.
+        
+        ``state`` carries the result selector locked in on the first call and the
+        number of nodes already parsed, so each page's nodes are parsed exactly once.
+        """
+        with self.timer.stage("transfer"):
+            snapshot = driver.execute_script(FIND_SELECTOR_JS + """
+                const start = arguments[1];
+                const selector = arguments[2] || findSelector(arguments[0]);
+                if (!selector) return {selector: null, total: 0, html: []};
+                const nodes = document.querySelectorAll(selector);
+                const html = [];
+                for (let i = start; i < nodes.length; i++) html.push(nodes[i].outerHTML);
+                return {selector: selector, total: nodes.length, html: html};
+            """, RESULT_REGISTRY.ordered(), state.get("seen", 0), state.get("selector"))
+        
+        if not snapshot or not snapshot.get("selector"):
+            return []
+        
+        # The selector's registry hit was already counted by _wait_for_results
+        state["selector"] = snapshot["selector"]
+        state["seen"] = snapshot["total"]
+        
+        if not snapshot["html"]:
+            return []
+        
+        with self.timer.stage("parse"):
+            articles = fragment_nodes("".join(snapshot["html"]))
+            results = self._parse_articles(articles)
+        self.log.debug("📊 Parsed %d new results from %d nodes", len(results), len(articles))
+        return results
+
+    def _extract_new_records(self, driver, state: dict) -> list:
+        """In-browser counterpart of ``_extract_new_results``.
+        
+        One script walks the result nodes added since the previous call and returns
+        only title, URL and raw date text as compact JSON, instead of shipping their
+        HTML over the WebDriver wire. Produces the same records as ``_parse_articles``.
+        """
+        with self.timer.stage("transfer"):
+            snapshot = driver.execute_script(FIND_SELECTOR_JS + EXTRACT_RECORDS_JS, RESULT_REGISTRY.ordered(),
+                                             state.get("seen", 0), state.get("selector"), LINK_REGISTRY.ordered(),
+                                             DATE_SELECTOR_GROUP.selectors)
+        
+        if not snapshot or not snapshot.get("selector"):
+            return []
+        
+        # The selector's registry hit was already counted by _wait_for_results
+        state["selector"] = snapshot["selector"]
+        state["seen"] = snapshot["total"]
+        
+        records = []
+        for raw in snapshot["records"]:
+            if not raw.get("linkSelector"):
+                LINK_REGISTRY.record_miss()
+                continue
+            LINK_REGISTRY.record_hit(raw["linkSelector"])
+            
+            title, href = raw["title"], raw["href"]
+            if title and href and len(title) > 5:
+                # Articles without a date element ship their text for the regex fallback
+                date_text = raw.get("dateText") or (find_date_text(raw["text"]) if raw.get("text") else None)
+                records.append((title, self._clean_href(href), date_text))
+        
+        # Normalize the whole date column at once
+        with self.timer.stage("parse"):
+            dates = self.dates.parse_many([date_text for _, _, date_text in records])
+        results = [
+            ResultRecord(title, href, published_date)
+            for (title, href, _), published_date in zip(records, dates)
+        ]
+        self.log.debug("📊 Extracted %d new results in browser from %d nodes", len(results), len(snapshot['records']))
+        return results
+
+    def scrape(self, query: str, max_pages: int, **kwargs):
+        """
+        ``scrape_records`` with the results as a pandas DataFrame.
+
+        Returns:
+            Tuple of (DataFrame with results, number of pages retrieved)
+        """
+        records, pages_retrieved = self.scrape_records(query, max_pages, **kwargs)
+        return to_dataframe(records), pages_retrieved
+
+    def scrape_records(self, query: str, max_pages: int, headless: bool = True, progress_callback=None, start_date=None, end_date=None, driver_pool=None, result_callback=None, keep_results: bool = True, log_context: dict = None) -> tuple[list, int]:
         """
         Enhanced scraping with progress tracking and date range support.
         
@@ -787,20 +1019,30 @@ class DuckDuckGoScraper:
             progress_callback: Function to call with progress updates
             start_date: Start date for search range (YYYY-MM-DD format)
             end_date: End date for search range (YYYY-MM-DD format)
+            driver_pool: Optional DriverPool to borrow a warm driver from instead of launching one
+            result_callback: Function called with (page, records) as soon as each page is extracted
+            keep_results: Accumulate records for the returned list; streaming callers
+                that only consume ``result_callback`` can pass False
+            log_context: Extra fields (e.g. ``job``) attached to every log line of this scrape
             
         Returns:
-            Tuple of (DataFrame with results, number of pages retrieved)
+            Tuple of (list of ResultRecord, number of pages retrieved)
         """
         if not query.strip():
             raise ValueError("❌ Query cannot be empty")
         
-        print(f"🔍 Starting scrape for: '{query}' (max {max_pages} pages)")
+        self.log = scrape_logger(__name__, query, **(log_context or {}))
+        self.log.info("🔍 Starting scrape (max %d pages)", max_pages)
+        self.dates = DateNormalizer()
+        self.stats = {"page_results": [], "fallback_extraction": False, "captcha_detected": False,
+                      "end_of_results": False}
+        self.timer = StageTimer()
         
         if progress_callback:
             progress_callback(0, max_pages, "🚀 Starting browser...")
         
         # Build URL with optional date range
-        url = f"https://duckduckgo.com/?q={quote_plus(query)}&t=h_"
+        url = f"{self.base_url}/?q={quote_plus(query)}&t=h_"
         
         # Add date range if provided
         if start_date and end_date:
@@ -809,91 +1051,166 @@ class DuckDuckGoScraper:
                 datetime.datetime.strptime(start_date, '%Y-%m-%d')
                 datetime.datetime.strptime(end_date, '%Y-%m-%d')
                 url += f"&df={start_date}..{end_date}&ia=web"
-                print(f"📅 Date range filter: {start_date} to {end_date}")
+                self.log.info("📅 Date range filter: %s to %s", start_date, end_date)
             except ValueError as e:
-                print(f"⚠️ Invalid date format: {e}. Expected YYYY-MM-DD")
+                self.log.warning("⚠️ Invalid date format: %s. Expected YYYY-MM-DD", e)
                 raise ValueError("Date format must be YYYY-MM-DD")
         
         driver = None
+        pooled = None
+        failed = False
+        results = []
+        result_count = 0
+        extraction = {"selector": None, "seen": 0}
+        # Later pages and the fallback extractor repeat URLs; drop them as they stream in
+        dedupe = Deduplicator() if config.DEDUPE_RESULTS else None
+        
+        def emit(page, page_results):
+            nonlocal result_count
+            if dedupe:
+                page_results = dedupe.filter(page_results)
+            result_count += len(page_results)
+            self.stats["page_results"].append(len(page_results))
+            if keep_results:
+                results.extend(page_results)
+            if result_callback and page_results:
+                result_callback(page, page_results)
         
         try:
             # Setup driver
-            if progress_callback:
-                progress_callback(0, max_pages, "🔧 Setting up Chrome driver...")
+            if driver_pool is not None:
+                if progress_callback:
+                    progress_callback(0, max_pages, "🔧 Borrowing Chrome driver from pool...")
+                
+                with self.timer.stage("driver_checkout"):
+                    pooled = driver_pool.checkout()
+                driver = pooled.driver
+                self.stats["driver_strategy"] = "pool"
+                self.log.info("✅ Borrowed pooled driver")
+            else:
+                if progress_callback:
+                    progress_callback(0, max_pages, "🔧 Setting up Chrome driver...")
+                
+                with self.timer.stage("driver_setup"):
+                    driver = self._setup_driver(headless)
+                self.log.info("✅ Driver setup complete")
             
-            driver = self._setup_driver(headless)
-            print("✅ Driver setup complete")
+            if config.BLOCK_NETWORK_REQUESTS:
+                # Discard log entries left over from a previous scrape on a pooled driver
+                self._collect_network_stats(driver)
             
             # Navigate to DuckDuckGo
             if progress_callback:
                 progress_callback(0, max_pages, "🌐 Loading DuckDuckGo homepage...")
             
-            print("🌐 Loading DuckDuckGo homepage...")
-            driver.get("https://duckduckgo.com/")
-            
-            # Wait for search box
-            if progress_callback:
-                progress_callback(0, max_pages, "⏳ Waiting for homepage to load...")
-            
-            wait = WebDriverWait(driver, 15)
-            wait.until(EC.presence_of_element_located((By.ID, "searchbox_input")))
-            print("✅ Homepage loaded")
+            self.log.info("🌐 Loading DuckDuckGo homepage...")
+            with self.timer.stage("homepage"):
+                driver.get(f"{self.base_url}/")
+                
+                # Wait for search box
+                if progress_callback:
+                    progress_callback(0, max_pages, "⏳ Waiting for homepage to load...")
+                
+                from selenium.webdriver.common.by import By
+                from selenium.webdriver.support import expected_conditions as EC
+                from selenium.webdriver.support.ui import WebDriverWait
+
+                wait = WebDriverWait(driver, 15)
+                wait.until(EC.presence_of_element_located((By.ID, "searchbox_input")))
+            self.log.info("✅ Homepage loaded")
             
             # Navigate to search results
             if progress_callback:
                 progress_callback(0, max_pages, f"🔍 Searching for: {query[:50]}...")
             
-            print(f"🔍 Searching for: {query}")
-            print(f"🔗 URL: {url}")
-            driver.get(url)
+            self.log.debug("🔍 Searching for: %s", query)
+            self.log.debug("🔗 URL: %s", url)
+            with self.timer.stage("search_page"):
+                driver.get(url)
             
             # Wait for results with multiple fallbacks
             if progress_callback:
                 progress_callback(1, max_pages, "⏳ Loading initial search results...")
             
-            print("⏳ Waiting for search results...")
-            if not self._wait_for_results(driver):
-                if progress_callback:
-                    progress_callback(1, max_pages, "🔄 Recovery mode - reloading page...")
-                print("⚠️ Initial result loading failed, trying recovery...")
-                self._handle_page_not_loaded(driver)
+            self.log.info("⏳ Waiting for search results...")
+            with self.timer.stage("wait_for_results"):
+                if not self._wait_for_results(driver):
+                    if progress_callback:
+                        progress_callback(1, max_pages, "🔄 Recovery mode - reloading page...")
+                    self.log.warning("⚠️ Initial result loading failed, trying recovery...")
+                    self._handle_page_not_loaded(driver)
             
-            print("✅ Search results loaded")
+            self.log.info("✅ Search results loaded")
             
             # Load additional pages
             if progress_callback:
                 progress_callback(1, max_pages, "✅ Initial page loaded, loading more pages...")
             
-            pages_retrieved = self._click_more_results(driver, max_pages, progress_callback)
+            # Results are parsed page by page as they load, so only the new
+            # nodes cross the WebDriver wire and partial results always exist
+            def collect_page(page, sweep=False):
+                try:
+                    if self.extraction_mode == "browser":
+                        page_results = self._extract_new_records(driver, extraction)
+                    else:
+                        page_results = self._extract_new_results(driver, extraction)
+                except Exception as e:
+                    self.log.warning("⚠️ Could not extract results for page %d: %s", page, e)
+                    return
+                if sweep and not page_results:
+                    return
+                emit(page, page_results)
             
-            # Get final HTML
-            if progress_callback:
-                progress_callback(pages_retrieved, max_pages, "📄 Extracting and parsing results...")
+            pages_retrieved = self._click_more_results(driver, max_pages, progress_callback, on_page_loaded=collect_page)
             
-            print("📄 Extracting page content...")
-            html = driver.page_source
+            if extraction["selector"]:
+                # A click whose load timed out can still render its nodes afterwards. Only
+                # unseen nodes are extracted, so this last sweep is cheap when there are none
+                collect_page(pages_retrieved, sweep=True)
+            
+            if not extraction["selector"]:
+                # No result container matched; fall back to scanning every link on the page
+                self.log.warning("⚠️ No articles found, trying fallback method...")
+                if progress_callback:
+                    progress_callback(pages_retrieved, max_pages, "📄 Extracting links with fallback method...")
+                self.stats["fallback_extraction"] = True
+                with self.timer.stage("transfer"):
+                    page_source = driver.page_source
+                with self.timer.stage("parse"):
+                    fallback_results = self._extract_fallback_links(make_soup(page_source, body_only=True))
+                emit(pages_retrieved, fallback_results)
             
         except Exception as e:
-            print(f"❌ Scraping error: {e}")
+            failed = True
+            self.log.error("❌ Scraping error: %s", e)
             if progress_callback:
                 progress_callback(0, max_pages, f"❌ Error: {str(e)[:50]}...")
             raise
         finally:
-            if driver:
+            if driver and config.BLOCK_NETWORK_REQUESTS:
+                network = self._collect_network_stats(driver)
+                self.stats["network"] = network
+                self.log.info("🛡️ Blocked %d requests (~%d KB saved), %d KB transferred",
+                              network['blocked_requests'], network['estimated_bytes_saved'] // 1024,
+                              network['bytes_transferred'] // 1024)
+            if pooled is not None:
+                # A failed session may be blocked or wedged, so don't hand it to the next scrape
+                driver_pool.checkin(pooled, healthy=not failed)
+                self.log.debug("🔄 Driver returned to pool")
+            elif driver:
                 try:
                     driver.quit()
-                    print("🔄 Browser closed")
+                    self.log.debug("🔄 Browser closed")
                 except:
                     pass
+            self.stats["timings"] = self.timer.totals()
+            self.stats["stage_samples"] = self.timer.samples
+            self.stats["duplicates_dropped"] = dedupe.dropped if dedupe else 0
         
-        # Parse results
-        print("🔄 Parsing results...")
-        results = self._parse_results(html)
-        
-        df = pd.DataFrame(results)
-        print(f"✅ Scraping complete: {len(df)} results from {pages_retrieved} pages")
+        self.log.info("✅ Scraping complete: %d results from %d pages (%d duplicates dropped)",
+                      result_count, pages_retrieved, self.stats["duplicates_dropped"])
         
         if progress_callback:
-            progress_callback(pages_retrieved, max_pages, f"🎉 Complete! Found {len(df)} results from {pages_retrieved} pages")
+            progress_callback(pages_retrieved, max_pages, f"🎉 Complete! Found {result_count} results from {pages_retrieved} pages")
         
-        return df, pages_retrieved
\ No newline at end of file
+        return results, pages_retrieved
\ No newline at end of file
@@ -0,0 +1,89 @@
+import logging
+from contextlib import nullcontext
+
+import config
+from .duckduckgo import DuckDuckGoScraper
+from .html_engine import HtmlScraper
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("selenium", "http", "auto")
+
+
+def _run(scraper, stats, query, max_pages, **kwargs):
+    try:
+        return scraper.scrape_records(query, max_pages, **kwargs)
+    finally:
+        if stats is not None:
+            stats.update(scraper.stats)
+
+
+def scrape_with_engine(engine: str, query: str, max_pages: int, result_callback=None, stats: dict = None,
+                       session_slot=None, **kwargs):
+    """
+    Run a scrape on the requested engine.
+
+    ``engine`` is "selenium", "http" or "auto"; "auto" tries the browserless HTTP
+    engine first and falls back to Selenium if it fails or finds nothing, but not
+    when the failure was raised by one of the caller's callbacks.
+    ``stats``, if given, is updated with the engine's per-scrape statistics.
+    ``session_slot``, if given, is a context manager factory held around every
+    Selenium run, so browser sessions can be capped across callers.
+    Remaining keyword arguments are passed through to ``scrape_records()``.
+
+    Returns:
+        Tuple of (list of ResultRecord, number of pages retrieved, engine used)
+    """
+    engine = engine or config.DEFAULT_ENGINE
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}")
+    session_slot = session_slot or nullcontext
+
+    if engine == "selenium":
+        with session_slot():
+            records, pages = _run(DuckDuckGoScraper(), stats, query, max_pages, result_callback=result_callback, **kwargs)
+        return records, pages, "selenium"
+
+    if engine == "http":
+        records, pages = _run(HtmlScraper(), stats, query, max_pages, result_callback=result_callback, **kwargs)
+        return records, pages, "http"
+
+    emitted = 0
+    callback_error = None
+
+    def guarded(callback):
+        # Exceptions from the caller's own callbacks (e.g. a stream client that went
+        # away) are not engine failures and would only be raised again by Selenium
+        def call(*args):
+            nonlocal callback_error
+            try:
+                return callback(*args)
+            except Exception as e:
+                callback_error = e
+                raise
+        return call
+
+    def track(page, records):
+        nonlocal emitted
+        emitted += len(records)
+        if result_callback:
+            result_callback(page, records)
+
+    http_kwargs = dict(kwargs)
+    if kwargs.get("progress_callback"):
+        http_kwargs["progress_callback"] = guarded(kwargs["progress_callback"])
+
+    try:
+        records, pages = _run(HtmlScraper(), stats, query, max_pages, result_callback=guarded(track), **http_kwargs)
+        if emitted:
+            return records, pages, "http"
+        logger.warning("⚠️ HTTP engine found no results, falling back to Selenium")
+    except Exception as e:
+        # Records already streamed to the caller can't be taken back
+        if emitted or e is callback_error:
+            raise
+        logger.warning("⚠️ HTTP engine failed (%s), falling back to Selenium", e)
+
+    with session_slot():
+        records, pages = _run(DuckDuckGoScraper(), stats, query, max_pages, result_callback=result_callback, **kwargs)
+    return records, pages, "selenium"
@@ -0,0 +1,169 @@
+import datetime
+import threading
+import time
+from urllib.parse import urljoin
+
+import config
+from .dates import DateNormalizer
+from .duckduckgo import DuckDuckGoScraper
+from .log import scrape_logger
+from .records import to_dataframe
+from .parsing import make_soup
+from .timing import StageTimer
+from .urls import Deduplicator
+
+
+class HtmlScraper:
+    """DuckDuckGo scraper for the non-JavaScript HTML endpoint using a pooled keep-alive HTTP session.
+
+    Implements the same ``scrape()`` contract as ``DuckDuckGoScraper`` and reuses its
+    parsing logic, but never starts a browser.
+    """
+
+    _shared_session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, base_url: str = None, session=None):
+        self.base_url = base_url or config.HTML_SEARCH_URL
+        self.session = session or self._get_shared_session()
+        self._parser = DuckDuckGoScraper()
+        self.stats = {}
+        self.timer = StageTimer()
+        self.log = scrape_logger(__name__)
+
+    @classmethod
+    def _get_shared_session(cls):
+        """Process-wide keep-alive ``requests.Session``; requests is imported when the engine is first used."""
+        with cls._session_lock:
+            if cls._shared_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "User-Agent": config.USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml",
+                    "Accept-Language": "en-US,en;q=0.9",
+                })
+                cls._shared_session = session
+            return cls._shared_session
+
+    def _next_page_form(self, soup, page_url: str):
+        """Return (action URL, form data) of the "Next" pagination form, or None on the last page."""
+        for form in soup.select("form"):
+            submit = form.select_one("input[type='submit']")
+            if not submit or (submit.get("value") or "").strip().lower() != "next":
+                continue
+            data = {
+                field.get("name"): field.get("value", "")
+                for field in form.select("input[name]")
+                if field.get("type") != "submit"
+            }
+            return urljoin(page_url, form.get("action") or page_url), data
+        return None
+
+    def _fetch(self, url: str, data: dict) -> str:
+        response = self.session.post(url, data=data, timeout=config.HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    def scrape(self, query: str, max_pages: int, **kwargs):
+        """``scrape_records`` with the results as a pandas DataFrame."""
+        records, pages_retrieved = self.scrape_records(query, max_pages, **kwargs)
+        return to_dataframe(records), pages_retrieved
+
+    def scrape_records(self, query: str, max_pages: int, headless: bool = True, progress_callback=None, start_date=None, end_date=None, driver_pool=None, result_callback=None, keep_results: bool = True, log_context: dict = None) -> tuple[list, int]:
+        """
+        Scrape the HTML endpoint page by page.
+
+        Accepts the same arguments as ``DuckDuckGoScraper.scrape_records``; ``headless``
+        and ``driver_pool`` are ignored because no browser is involved.
+
+        Returns:
+            Tuple of (list of ResultRecord, number of pages retrieved)
+        """
+        if not query.strip():
+            raise ValueError("❌ Query cannot be empty")
+
+        data = {"q": query}
+        if start_date and end_date:
+            try:
+                datetime.datetime.strptime(start_date, '%Y-%m-%d')
+                datetime.datetime.strptime(end_date, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError("Date format must be YYYY-MM-DD")
+            data["df"] = f"{start_date}..{end_date}"
+
+        self.log = scrape_logger(__name__, query, **(log_context or {}))
+        self.log.info("🔍 Starting HTTP scrape (max %d pages)", max_pages)
+        self._parser.dates = DateNormalizer()
+        self._parser.log = self.log
+        self.stats = {"page_results": [], "fallback_extraction": False, "captcha_detected": False,
+                      "end_of_results": False}
+        self.timer = StageTimer()
+
+        results = []
+        result_count = 0
+        pages_retrieved = 0
+        url = self.base_url
+        dedupe = Deduplicator() if config.DEDUPE_RESULTS else None
+
+        try:
+            while pages_retrieved < max_pages:
+                if progress_callback:
+                    progress_callback(pages_retrieved, max_pages, f"Loading page {pages_retrieved + 1}...")
+
+                with self.timer.stage("fetch"):
+                    html = self._fetch(url, data)
+                with self.timer.stage("parse"):
+                    soup = make_soup(html, body_only=True)
+                    articles = self._parser._select_articles(soup)
+                    page_results = self._parser._parse_articles(articles) if articles else []
+
+                if not articles:
+                    text = soup.get_text(" ", strip=True).lower()
+                    if any(keyword in text for keyword in ("captcha", "anomaly", "blocked")):
+                        self.stats["captcha_detected"] = True
+                        raise RuntimeError("❌ Page blocked or CAPTCHA detected.")
+                    if pages_retrieved == 0:
+                        self.log.warning("⚠️ No articles found on HTML endpoint")
+                    else:
+                        self.stats["end_of_results"] = True
+                    break
+
+                pages_retrieved += 1
+                if dedupe:
+                    page_results = dedupe.filter(page_results)
+                result_count += len(page_results)
+                self.stats["page_results"].append(len(page_results))
+                if keep_results:
+                    results.extend(page_results)
+                if result_callback and page_results:
+                    result_callback(pages_retrieved, page_results)
+
+                self.log.info("✅ Loaded page %d (%d results)", pages_retrieved, len(page_results))
+                if progress_callback:
+                    progress_callback(pages_retrieved, max_pages, f"✅ Successfully loaded page {pages_retrieved}")
+
+                next_form = self._next_page_form(soup, url)
+                if not next_form:
+                    self.stats["end_of_results"] = True
+                    self.log.info("🛑 No more results pages.")
+                    break
+                url, data = next_form
+
+                if config.HTTP_PAGE_DELAY:
+                    time.sleep(config.HTTP_PAGE_DELAY)
+        finally:
+            self.stats["timings"] = self.timer.totals()
+            self.stats["stage_samples"] = self.timer.samples
+            self.stats["duplicates_dropped"] = dedupe.dropped if dedupe else 0
+
+        self.log.info("✅ HTTP scrape complete: %d results from %d pages", result_count, pages_retrieved)
+        if progress_callback:
+            progress_callback(pages_retrieved, max_pages, f"🎉 Complete! Found {result_count} results from {pages_retrieved} pages")
+
+        return results, pages_retrieved
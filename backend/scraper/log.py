@@ -0,0 +1,23 @@
+import logging
+
+
+class ScrapeLogAdapter(logging.LoggerAdapter):
+    """Prefixes every message with the scrape's context, e.g. ``[job=ab12cd query='foo']``."""
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        if not self.extra:
+            return msg, kwargs
+        context = " ".join(
+            f"{key}={value!r}" if isinstance(value, str) and " " in value else f"{key}={value}"
+            for key, value in self.extra.items()
+        )
+        return f"[{context}] {msg}", kwargs
+
+
+def scrape_logger(name: str, query: str = None, **context) -> ScrapeLogAdapter:
+    """Logger for one scrape; ``context`` (job id, ...) is attached to every record."""
+    extra = {key: value for key, value in context.items() if value is not None}
+    if query is not None:
+        extra["query"] = query
+    return ScrapeLogAdapter(logging.getLogger(name), extra)
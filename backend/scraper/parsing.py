@@ -0,0 +1,172 @@
+import importlib.util
+import re
+
+import config
+
+# bs4, soupsieve and lxml are imported on first parse, not when the app starts
+
+PRIMARY_DATE_SELECTOR = "span.MILR5XIVy9h75WrLvKiq.qsXMqKZNYEaWqGnWVdoa"
+
+# Tried in order after the primary selector
+DATE_SELECTORS = [
+    # Class-based selectors
+    "span[class*='MILR5XIVy9h75WrLvKiq']",
+    "span[class*='qsXMqKZNYEaWqGnWVdoa']",
+    "span[class*='date']",
+    "span[class*='time']",
+    "span[class*='published']",
+    "span[class*='timestamp']",
+
+    # Generic time/date elements
+    "time",
+    "time[datetime]",
+
+    # Common class names
+    ".date",
+    ".published",
+    ".timestamp",
+    ".publish-date",
+    ".post-date",
+    ".article-date",
+]
+
+
+def _resolve_parser() -> str:
+    if config.HTML_PARSER == "lxml":
+        # find_spec checks availability without paying for the import
+        return "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+    return config.HTML_PARSER
+
+
+PARSER = _resolve_parser()
+
+_body_only = None
+
+
+_SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)(?P<attrs>(?:\[[^\]]+\])*)$")
+_ATTRIBUTE = re.compile(r"""\[([\w-]+)(?:([*^$]?=)['"]([^'"]*)['"])?\]""")
+
+
+def _compile_simple(selector: str):
+    """
+    Turn a compound selector without combinators (``span.a.b``, ``time[datetime]``,
+    ``span[class*='date']``, ``.date``) into a plain Python predicate on a Tag.
+    Returns None for anything more complex, which is left to soupsieve.
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        return None
+    tag = match.group("tag")
+    classes = [c for c in match.group("classes").split(".") if c]
+    if _ATTRIBUTE.sub("", match.group("attrs")):
+        return None
+    attrs = _ATTRIBUTE.findall(match.group("attrs"))
+
+    def predicate(element):
+        if tag and element.name != tag:
+            return False
+        if classes:
+            element_classes = element.get("class") or ()
+            if any(c not in element_classes for c in classes):
+                return False
+        for name, operator, value in attrs:
+            actual = element.get(name)
+            if actual is None:
+                return False
+            if isinstance(actual, list):
+                # Multi-valued attributes (class) compare as the space-joined string, like soupsieve
+                actual = " ".join(actual)
+            if operator == "=" and actual != value:
+                return False
+            if operator == "*=" and (not value or value not in actual):
+                return False
+            if operator == "^=" and (not value or not actual.startswith(value)):
+                return False
+            if operator == "$=" and (not value or not actual.endswith(value)):
+                return False
+        return True
+
+    return predicate
+
+
+class CompiledSelectorGroup:
+    """An ordered list of CSS selectors, compiled once on first use."""
+
+    def __init__(self, selectors):
+        self.selectors = list(selectors)
+        self._compiled = None
+        predicates = [_compile_simple(selector) for selector in self.selectors]
+        # Only groups made entirely of simple selectors can be matched in a single walk
+        self.predicates = predicates if all(predicates) else None
+
+    @property
+    def compiled(self) -> dict:
+        """Selector -> soupsieve pattern."""
+        if self._compiled is None:
+            import soupsieve as sv
+
+            self._compiled = {selector: sv.compile(selector) for selector in self.selectors}
+        return self._compiled
+
+    def first_by_priority(self, root, accept=None, order=None):
+        """
+        Same answer as calling ``select_one`` for each selector in ``order`` (default:
+        declaration order) and taking the first accepted hit. Groups of simple
+        selectors are resolved in one walk over ``root``; others use the
+        precompiled selectors in order.
+
+        Returns:
+            Tuple of (element, selector) or (None, None)
+        """
+        order = order or self.selectors
+
+        if self.predicates is None:
+            for selector in order:
+                element = self.compiled[selector].select_one(root)
+                if element is not None and (accept is None or accept(element)):
+                    return element, selector
+            return None, None
+
+        # First match in document order for each selector, as select_one would return
+        first = [None] * len(self.predicates)
+        pending = len(first)
+        for element in root.find_all(True):
+            for i, predicate in enumerate(self.predicates):
+                if first[i] is None and predicate(element):
+                    first[i] = element
+                    pending -= 1
+            if pending == 0:
+                break
+
+        found = dict(zip(self.selectors, first))
+        for selector in order:
+            element = found[selector]
+            if element is not None and (accept is None or accept(element)):
+                return element, selector
+        return None, None
+
+
+RESULT_SELECTORS = CompiledSelectorGroup(config.RESULT_SELECTORS)
+LINK_SELECTORS = CompiledSelectorGroup(config.LINK_SELECTORS)
+DATE_SELECTOR_GROUP = CompiledSelectorGroup([PRIMARY_DATE_SELECTOR] + DATE_SELECTORS)
+
+
+def make_soup(html: str, body_only: bool = False):
+    """Parse HTML with the configured backend, optionally skipping everything outside <body>."""
+    global _body_only
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    if body_only:
+        if _body_only is None:
+            # Every selector result lives in <body>, so <head> (inline scripts, styles) is never built
+            _body_only = SoupStrainer("body")
+        return BeautifulSoup(html, PARSER, parse_only=_body_only)
+    return BeautifulSoup(html, PARSER)
+
+
+def fragment_nodes(html: str) -> list:
+    """Parse concatenated outerHTML snippets and return the top-level elements."""
+    soup = make_soup(html)
+    # lxml wraps fragments in <html><body>, html.parser does not
+    root = soup.body or soup
+    return [node for node in root.children if getattr(node, "name", None)]
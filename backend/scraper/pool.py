@@ -0,0 +1,174 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver:
+    """A Chrome driver owned by a DriverPool together with its usage stats."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    """Pool of pre-launched Chrome drivers that scrapes borrow instead of cold-starting."""
+
+    def __init__(self, factory, size: int = None, max_uses: int = None, checkout_timeout: float = None):
+        self._factory = factory
+        self.size = size if size is not None else config.DRIVER_POOL_SIZE
+        self.max_uses = max_uses if max_uses is not None else config.DRIVER_MAX_USES
+        self.checkout_timeout = checkout_timeout if checkout_timeout is not None else config.DRIVER_CHECKOUT_TIMEOUT
+
+        # LIFO so the most recently used (warmest) driver is handed out first
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._live = 0
+        self._closed = False
+        self._recycled = 0
+
+    def warm(self):
+        """Launch drivers until the pool is full."""
+        while True:
+            with self._lock:
+                if self._closed or self._live >= self.size:
+                    return
+                self._live += 1
+            try:
+                pooled = PooledDriver(self._factory())
+            except Exception as e:
+                with self._lock:
+                    self._live -= 1
+                logger.warning("⚠️ Could not pre-launch pooled driver: %s", e)
+                return
+            self._idle.put(pooled)
+            logger.info("✅ Pre-launched pooled driver (%d/%d)", self.stats()["live"], self.size)
+
+    def checkout(self, timeout: float = None) -> PooledDriver:
+        """Take a healthy driver from the pool, launching one if there is spare capacity."""
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+
+        deadline = time.monotonic() + (timeout if timeout is not None else self.checkout_timeout)
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                pooled = self._launch_if_capacity()
+                if pooled is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No pooled driver available after waiting {self.checkout_timeout}s")
+                    try:
+                        pooled = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        continue
+
+            if self._is_healthy(pooled.driver):
+                return pooled
+
+            logger.warning("⚠️ Discarding unhealthy pooled driver")
+            self._discard(pooled)
+
+    def checkin(self, pooled: PooledDriver, healthy: bool = True):
+        """Return a driver to the pool, recycling it when it is worn out or broken."""
+        pooled.uses += 1
+
+        if self._closed or not healthy or pooled.uses >= self.max_uses:
+            if healthy and pooled.uses >= self.max_uses:
+                logger.info("♻️ Recycling pooled driver after %d uses", pooled.uses)
+            self._discard(pooled)
+            return
+
+        if not self._reset(pooled.driver):
+            self._discard(pooled)
+            return
+
+        self._idle.put(pooled)
+
+    @contextmanager
+    def borrow(self, timeout: float = None):
+        """Context manager yielding a driver that is returned to the pool afterwards."""
+        pooled = self.checkout(timeout)
+        healthy = True
+        try:
+            yield pooled.driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.checkin(pooled, healthy=healthy)
+
+    def close(self):
+        """Quit every idle driver and refuse further checkouts."""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "live": self._live,
+                "idle": self._idle.qsize(),
+                "recycled": self._recycled,
+                "max_uses": self.max_uses,
+            }
+
+    def _launch_if_capacity(self):
+        with self._lock:
+            if self._live >= self.size:
+                return None
+            self._live += 1
+        try:
+            return PooledDriver(self._factory())
+        except Exception:
+            with self._lock:
+                self._live -= 1
+            raise
+
+    def _discard(self, pooled: PooledDriver):
+        with self._lock:
+            self._live -= 1
+            self._recycled += 1
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _is_healthy(self, driver) -> bool:
+        """Cheap liveness probe: the browser answers a script and still has a window."""
+        try:
+            return driver.execute_script("return 1;") == 1 and bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _reset(self, driver) -> bool:
+        """Clear cookies, storage and extra tabs so the next scrape starts clean."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning("⚠️ Could not reset pooled driver: %s", e)
+            return False
@@ -0,0 +1,31 @@
+from typing import NamedTuple, Optional
+
+
+class ResultRecord(NamedTuple):
+    """
+    One search result. Tuple-backed, so a record costs three pointers instead of
+    a dict per result; ``get`` lets code written against result dicts (and
+    cached results, which stay dicts) read either form.
+    """
+
+    title: str
+    url: str
+    published_date: Optional[str] = None
+
+    def get(self, field: str, default=None):
+        return getattr(self, field) if field in self._fields else default
+
+
+FIELDS = ResultRecord._fields
+
+
+def as_dicts(records) -> list:
+    """Records as plain dicts, for JSON responses and the result cache."""
+    return [record._asdict() for record in records]
+
+
+def to_dataframe(records):
+    """pandas DataFrame of ``records``; pandas is only imported when this is called."""
+    import pandas as pd
+
+    return pd.DataFrame.from_records(records, columns=FIELDS)
@@ -0,0 +1,76 @@
+import threading
+
+import config
+
+
+class SelectorRegistry:
+    """
+    Ordered CSS selector candidates that learn from which one actually matched.
+
+    Every recorded hit bumps that selector's score while all scores decay, so the
+    candidate order follows recent DuckDuckGo markup. ``fallbacks`` are catch-all
+    selectors that keep their place at the end and are never promoted.
+    """
+
+    def __init__(self, name: str, selectors, fallbacks=(), decay: float = None):
+        self.name = name
+        self.selectors = list(selectors)
+        self.fallbacks = [s for s in self.selectors if s in set(fallbacks)]
+        self.decay = decay if decay is not None else config.SELECTOR_SCORE_DECAY
+
+        self._lock = threading.Lock()
+        self._scores = {s: 0.0 for s in self.selectors}
+        self._hits = {s: 0 for s in self.selectors}
+        self._lookups = 0
+        self._misses = 0
+        self._order = list(self.selectors)
+
+    def ordered(self) -> list:
+        """Candidates, most recently successful first."""
+        return self._order
+
+    def record_hit(self, selector: str):
+        with self._lock:
+            if selector not in self._scores:
+                return
+            self._lookups += 1
+            self._hits[selector] += 1
+            for candidate in self._scores:
+                self._scores[candidate] *= self.decay
+            self._scores[selector] += 1.0
+            self._reorder()
+
+    def record_miss(self):
+        with self._lock:
+            self._lookups += 1
+            self._misses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "lookups": self._lookups,
+                "misses": self._misses,
+                "order": list(self._order),
+                "selectors": [
+                    {"selector": s, "hits": self._hits[s], "score": round(self._scores[s], 3)}
+                    for s in self.selectors
+                ],
+            }
+
+    def _reorder(self):
+        position = {s: i for i, s in enumerate(self.selectors)}
+        learned = [s for s in self.selectors if s not in self.fallbacks]
+        learned.sort(key=lambda s: (-self._scores[s], position[s]))
+        # Swap in a new list so readers iterating the old one are unaffected
+        self._order = learned + self.fallbacks
+
+
+RESULT_REGISTRY = SelectorRegistry("results", config.RESULT_SELECTORS)
+LINK_REGISTRY = SelectorRegistry("links", config.LINK_SELECTORS, fallbacks=config.LINK_FALLBACK_SELECTORS)
+
+REGISTRIES = {registry.name: registry for registry in (RESULT_REGISTRY, LINK_REGISTRY)}
+
+
+def registry_stats() -> dict:
+    """Per-selector hit counts for every registry, to spot markup drift."""
+    return {name: registry.stats() for name, registry in REGISTRIES.items()}
@@ -0,0 +1,201 @@
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import config
+from .engines import scrape_with_engine
+from .urls import Deduplicator
+
+logger = logging.getLogger(__name__)
+
+SHARD_MODES = ("off", "fixed", "adaptive")
+# Per-shard fields reported in stats["shards"]
+SHARD_FIELDS = ("start_date", "end_date", "depth", "status", "engine", "pages_retrieved", "results",
+                "duplicates", "seconds", "split", "error")
+
+
+def _parse_range(start_date: str, end_date: str):
+    try:
+        start = datetime.date.fromisoformat(start_date)
+        end = datetime.date.fromisoformat(end_date)
+    except (TypeError, ValueError):
+        raise ValueError("Date format must be YYYY-MM-DD")
+    if end < start:
+        raise ValueError("start_date must not be after end_date")
+    return start, end
+
+
+def split_date_range(start_date: str, end_date: str, shard_days: int = None, shards: int = None) -> list:
+    """
+    Split the inclusive range ``start_date..end_date`` into contiguous
+    ``(start, end)`` ISO date pairs: ``shards`` near-equal parts if given,
+    otherwise ``shard_days``-day pieces (default ``SHARD_DAYS``). Never more
+    than ``SHARD_MAX_SHARDS`` pieces or one piece per day.
+    """
+    start, end = _parse_range(start_date, end_date)
+    days = (end - start).days + 1
+    if not shards:
+        step = max(1, shard_days or config.SHARD_DAYS)
+        shards = -(-days // step)
+    shards = max(1, min(shards, days, config.SHARD_MAX_SHARDS))
+
+    bounds = [start + datetime.timedelta(days=(i * days) // shards) for i in range(shards + 1)]
+    return [(a.isoformat(), (b - datetime.timedelta(days=1)).isoformat()) for a, b in zip(bounds, bounds[1:])]
+
+
+def _halves(start_date: str, end_date: str):
+    """The two halves of a range, or None when either would be shorter than SHARD_MIN_DAYS."""
+    start, end = _parse_range(start_date, end_date)
+    days = (end - start).days + 1
+    if days < 2 * max(1, config.SHARD_MIN_DAYS):
+        return None
+    return split_date_range(start_date, end_date, shards=2)
+
+
+def _merge_stats(stats: dict, shards: list, shard_stats: list, cross_duplicates: int, seconds: float):
+    """Fold the shards' scraper stats into ``stats`` in the shape of a single scrape."""
+    timings = {}
+    samples = {}
+    for sub in shard_stats:
+        for stage, total in (sub.get("timings") or {}).items():
+            if stage != "total":
+                timings[stage] = timings.get(stage, 0.0) + total
+        for stage, values in (sub.get("stage_samples") or {}).items():
+            samples.setdefault(stage, []).extend(values)
+    timings["total"] = seconds
+
+    stats.update({
+        "page_results": [count for sub in shard_stats for count in sub.get("page_results", [])],
+        "fallback_extraction": any(sub.get("fallback_extraction") for sub in shard_stats),
+        "captcha_detected": any(sub.get("captcha_detected") for sub in shard_stats),
+        "duplicates_dropped": cross_duplicates + sum(sub.get("duplicates_dropped", 0) for sub in shard_stats),
+        "timings": {stage: round(total, 4) for stage, total in timings.items()},
+        "stage_samples": samples,
+        "shards": [{field: shard.get(field) for field in SHARD_FIELDS} for shard in shards],
+        "pages_fetched": sum(shard["pages_retrieved"] for shard in shards),
+    })
+    strategies = [sub["driver_strategy"] for sub in shard_stats if sub.get("driver_strategy")]
+    if strategies:
+        stats["driver_strategy"] = strategies[0]
+
+
+def scrape_sharded(engine: str, query: str, max_pages: int, start_date: str = None, end_date: str = None,
+                   mode: str = None, shard_days: int = None, shards: int = None, parallelism: int = None,
+                   result_callback=None, progress_callback=None, stats: dict = None, log_context: dict = None,
+                   **kwargs):
+    """
+    Scrape a date range as concurrent sub-range scrapes and merge the results.
+
+    Every shard is its own ``scrape_with_engine`` run (own driver, up to
+    ``max_pages`` pages), so a long range is no longer limited by how deep one
+    paginated session can go. In "adaptive" mode a shard that used all its
+    pages is split in half and both halves are scraped too, so dense periods
+    get more shards. Results are deduplicated across shards as they stream in
+    and returned in date-range order. ``stats`` receives the merged scraper
+    statistics plus a ``shards`` list with per-shard outcomes.
+
+    A split shard's results are kept (its halves only add results it didn't
+    have), but only unsplit shards count towards the pages retrieved, since the
+    halves re-cover the same range; ``stats["pages_fetched"]`` includes both.
+
+    Returns:
+        Tuple of (list of ResultRecord, pages retrieved by unsplit shards, engine used)
+    """
+    mode = mode or config.SHARD_MODE
+    if mode not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode '{mode}'. Expected one of: {', '.join(SHARD_MODES)}")
+    ranges = split_date_range(start_date, end_date, shard_days, shards)
+    parallelism = min(parallelism or config.SHARD_PARALLELISM, config.SHARD_MAX_SHARDS)
+    driver_pool = kwargs.get("driver_pool")
+    if driver_pool is not None:
+        # More concurrent shards than pooled drivers would only time out in checkout
+        parallelism = min(parallelism, driver_pool.size)
+    parallelism = max(1, parallelism)
+    # Shards collect through result_callback; the scrapers needn't keep their own copy
+    kwargs["keep_results"] = False
+
+    dedupe = Deduplicator() if config.DEDUPE_RESULTS else None
+    lock = threading.Lock()
+    all_shards = []
+    shard_stats = []
+    accepted = {}
+    progress = {"pages": 0}
+    started = time.perf_counter()
+
+    def new_shard(start, end, depth=0):
+        shard = {"index": len(all_shards), "start_date": start, "end_date": end, "depth": depth,
+                 "status": "running", "pages_retrieved": 0, "results": 0, "duplicates": 0, "split": False}
+        all_shards.append(shard)
+        accepted[shard["index"]] = []
+        return shard
+
+    def run_shard(shard):
+        label = f"{shard['start_date']}..{shard['end_date']}"
+
+        def on_results(page, records):
+            with lock:
+                if dedupe:
+                    unique = dedupe.filter(records)
+                    shard["duplicates"] += len(records) - len(unique)
+                    records = unique
+                shard["results"] += len(records)
+                accepted[shard["index"]].extend(records)
+                progress["pages"] += 1
+                # Callbacks are serialized so consumers see one page at a time
+                if result_callback and records:
+                    result_callback(progress["pages"], records)
+
+        def on_progress(current, total, message):
+            if progress_callback:
+                progress_callback(progress["pages"], max_pages * len(all_shards), f"[{label}] {message}")
+
+        sub_stats = {}
+        shard_started = time.perf_counter()
+        try:
+            _, pages, used = scrape_with_engine(
+                engine, query, max_pages, result_callback=on_results, stats=sub_stats,
+                start_date=shard["start_date"], end_date=shard["end_date"], progress_callback=on_progress,
+                log_context={**(log_context or {}), "shard": label}, **kwargs
+            )
+            shard.update(status="ok", pages_retrieved=pages, engine=used)
+        except Exception as e:
+            logger.warning("⚠️ Shard %s failed: %s", label, e)
+            shard.update(status="error", error=str(e))
+        finally:
+            shard["seconds"] = round(time.perf_counter() - shard_started, 3)
+            with lock:
+                shard_stats.append(sub_stats)
+        return shard
+
+    logger.info("🧩 Scraping %s..%s as %d %s shards (%d at a time)", start_date, end_date, len(ranges), mode, parallelism)
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="shard") as executor:
+        pending = {executor.submit(run_shard, new_shard(start, end)) for start, end in ranges}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard = future.result()
+                saturated = shard["status"] == "ok" and shard["pages_retrieved"] >= max_pages
+                if mode != "adaptive" or not saturated or len(all_shards) + 2 > config.SHARD_MAX_SHARDS:
+                    continue
+                halves = _halves(shard["start_date"], shard["end_date"])
+                if halves:
+                    shard["split"] = True
+                    for start, end in halves:
+                        pending.add(executor.submit(run_shard, new_shard(start, end, shard["depth"] + 1)))
+
+    seconds = time.perf_counter() - started
+    if stats is not None:
+        _merge_stats(stats, all_shards, shard_stats, sum(shard["duplicates"] for shard in all_shards), seconds)
+
+    succeeded = [shard for shard in all_shards if shard["status"] == "ok"]
+    if not succeeded:
+        raise RuntimeError(f"❌ All {len(all_shards)} shards failed: {all_shards[0].get('error')}")
+
+    ordered = sorted(all_shards, key=lambda shard: (shard["start_date"], shard["depth"]))
+    records = [record for shard in ordered for record in accepted[shard["index"]]]
+    pages_retrieved = sum(shard["pages_retrieved"] for shard in all_shards if not shard["split"])
+    logger.info("✅ Sharded scrape complete: %d results from %d shards in %.1fs",
+                len(records), len(all_shards), seconds)
+    return records, pages_retrieved, succeeded[0]["engine"]
@@ -0,0 +1,27 @@
+import time
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Wall-clock time spent in each named phase of a scrape."""
+
+    def __init__(self):
+        self.samples = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float):
+        self.samples.setdefault(name, []).append(seconds)
+
+    def totals(self) -> dict:
+        """Seconds per stage (summed over repeats) plus the overall elapsed time."""
+        totals = {name: round(sum(values), 4) for name, values in self.samples.items()}
+        totals["total"] = round(time.perf_counter() - self._started, 4)
+        return totals
@@ -0,0 +1,110 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import config
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Redirect wrappers: (host, path) -> query parameter holding the target URL
+REDIRECT_PARAMS = {
+    ("duckduckgo.com", "/l/"): "uddg",
+    ("www.google.com", "/url"): "q",
+    ("google.com", "/url"): "q",
+}
+_MAX_REDIRECT_DEPTH = 3
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in config.TRACKING_PARAMS or name.startswith(tuple(config.TRACKING_PARAM_PREFIXES))
+
+
+def _unwrap_redirect(parts):
+    """Target of a known redirect wrapper (DuckDuckGo's /l/?uddg=...), or None."""
+    param = REDIRECT_PARAMS.get(((parts.hostname or "").lower(), parts.path))
+    if not param:
+        return None
+    for name, value in parse_qsl(parts.query):
+        if name == param and value.startswith(("http://", "https://", "//")):
+            return value
+    return None
+
+
+def clean_url(url: str) -> str:
+    """
+    Result URL as it should be reported: redirect wrappers unwrapped, tracking
+    parameters and fragment removed, protocol-relative links made https.
+    """
+    url = (url or "").strip()
+    for _ in range(_MAX_REDIRECT_DEPTH):
+        if url.startswith("//"):
+            url = "https:" + url
+        parts = urlsplit(url)
+        target = _unwrap_redirect(parts)
+        if not target:
+            break
+        url = target
+
+    if not parts.query and not parts.fragment:
+        return url
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    kept = [(name, value) for name, value in params if not _is_tracking_param(name)]
+    query = parts.query if len(kept) == len(params) else urlencode(kept)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def canonical_url(url: str) -> str:
+    """
+    Identity of the page behind a result URL, used as the dedupe key: the
+    cleaned URL with http/https, host case, ``www.``, default ports, query
+    parameter order and a trailing slash all normalized away.
+    """
+    url = clean_url(url)
+    return _canonicalize(url) if url else ""
+
+
+def _canonicalize(url: str) -> str:
+    parts = urlsplit(url)
+    original_scheme = (parts.scheme or "https").lower()
+    scheme = "https" if original_scheme == "http" else original_scheme
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    # Only the default port of the URL's own scheme is redundant (https://h:80 is not https://h)
+    netloc = f"{host}:{port}" if port and port != _DEFAULT_PORTS.get(original_scheme) else host
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_domain(url: str) -> str:
+    """Host of ``url`` without a leading ``www.``."""
+    return urlsplit(canonical_url(url)).hostname or ""
+
+
+class Deduplicator:
+    """
+    Drops results whose canonical URL was already emitted during this scrape.
+    Keeps a set of seen keys, so each record costs one canonicalization and an
+    O(1) lookup no matter how many pages have streamed in.
+    """
+
+    def __init__(self):
+        self.seen = set()
+        self.dropped = 0
+
+    def filter(self, records: list) -> list:
+        """New ResultRecords from ``records`` with their URLs cleaned, in order."""
+        unique = []
+        for record in records:
+            url = clean_url(record.get("url"))
+            key = _canonicalize(url)
+            if key in self.seen:
+                self.dropped += 1
+                continue
+            self.seen.add(key)
+            unique.append(record._replace(url=url))
+        return unique
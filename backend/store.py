@@ -0,0 +1,261 @@
+import os
+import sqlite3
+import threading
+import time
+
+import config
+from cache import canonical_query
+from scraper.urls import canonical_url, url_domain
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    id INTEGER PRIMARY KEY,
+    query TEXT NOT NULL,
+    canonical_query TEXT NOT NULL,
+    start_date TEXT NOT NULL DEFAULT '',
+    end_date TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    -- Also serves as the index for query lookups
+    UNIQUE (canonical_query, start_date, end_date)
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    query_id INTEGER NOT NULL REFERENCES queries (id),
+    engine TEXT,
+    status TEXT NOT NULL,
+    max_pages INTEGER NOT NULL,
+    pages_retrieved INTEGER,
+    result_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    position INTEGER NOT NULL,
+    page INTEGER,
+    title TEXT,
+    url TEXT NOT NULL,
+    canonical_url TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    published_date TEXT,
+    UNIQUE (run_id, canonical_url)
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_query ON runs (query_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_results_run_position ON results (run_id, position);
+CREATE INDEX IF NOT EXISTS idx_results_canonical_url ON results (canonical_url);
+CREATE INDEX IF NOT EXISTS idx_results_domain ON results (domain);
+CREATE INDEX IF NOT EXISTS idx_results_published_date ON results (published_date);
+"""
+
+RESULT_FIELDS = ("run_id", "position", "page", "title", "url", "canonical_url", "domain", "published_date")
+RESULT_COLUMNS = ", ".join(("id",) + RESULT_FIELDS)
+# Same columns qualified with the "r" alias used in joins
+R_RESULT_COLUMNS = ", ".join(f"r.{column}" for column in ("id",) + RESULT_FIELDS)
+
+
+class ResultStore:
+    """
+    SQLite history of every scrape: queries, runs and their results.
+
+    Writes go through one connection and are batched; reads use per-thread
+    connections so WAL mode lets them run while a scrape is being written.
+    """
+
+    def __init__(self, path: str = None, batch_size: int = None):
+        self.path = path or config.STORE_PATH
+        self.batch_size = batch_size or config.STORE_BATCH_SIZE
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+        self._pending = {}
+        self._positions = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        if self.path == ":memory:":
+            # An in-memory database only exists on the connection that created it
+            return self._writer
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    # Writing
+
+    def start_run(self, query: str, max_pages: int, start_date=None, end_date=None, engine: str = None) -> int:
+        with self._lock, self._writer:
+            self._writer.execute(
+                "INSERT OR IGNORE INTO queries (query, canonical_query, start_date, end_date, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (query, canonical_query(query), start_date or "", end_date or "", time.time()),
+            )
+            query_id = self._writer.execute(
+                "SELECT id FROM queries WHERE canonical_query = ? AND start_date = ? AND end_date = ?",
+                (canonical_query(query), start_date or "", end_date or ""),
+            ).fetchone()[0]
+            run_id = self._writer.execute(
+                "INSERT INTO runs (query_id, engine, status, max_pages, started_at) VALUES (?, ?, 'running', ?, ?)",
+                (query_id, engine, max_pages, time.time()),
+            ).lastrowid
+            self._pending[run_id] = []
+            self._positions[run_id] = 0
+        return run_id
+
+    def add_results(self, run_id: int, page: int, records: list):
+        """Queue a page of records; they are written once ``batch_size`` rows are pending."""
+        with self._lock:
+            pending = self._pending[run_id]
+            for record in records:
+                url = record.get("url")
+                if not url:
+                    continue
+                self._positions[run_id] += 1
+                pending.append((
+                    run_id,
+                    self._positions[run_id],
+                    page,
+                    record.get("title"),
+                    url,
+                    canonical_url(url),
+                    url_domain(url),
+                    record.get("published_date"),
+                ))
+            if len(pending) >= self.batch_size:
+                self._flush(run_id)
+
+    def finish_run(self, run_id: int, pages_retrieved: int = None, engine: str = None, error: str = None):
+        with self._lock:
+            self._flush(run_id)
+            with self._writer:
+                result_count = self._writer.execute(
+                    "SELECT COUNT(*) FROM results WHERE run_id = ?", (run_id,)
+                ).fetchone()[0]
+                self._writer.execute(
+                    "UPDATE runs SET status = ?, pages_retrieved = ?, result_count = ?, error = ?, "
+                    "engine = COALESCE(?, engine), finished_at = ? WHERE id = ?",
+                    ("error" if error else "ok", pages_retrieved, result_count, error, engine, time.time(), run_id),
+                )
+            self._pending.pop(run_id, None)
+            self._positions.pop(run_id, None)
+
+    def _flush(self, run_id: int):
+        pending = self._pending.get(run_id)
+        if not pending:
+            return
+        with self._writer:
+            # The same canonical URL is kept once per run
+            self._writer.executemany(
+                f"INSERT OR IGNORE INTO results ({', '.join(RESULT_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in RESULT_FIELDS)})",
+                pending,
+            )
+        self._pending[run_id] = []
+
+    # Reading
+
+    def _rows(self, sql: str, params=()) -> list:
+        return [dict(row) for row in self._reader().execute(sql, params)]
+
+    def queries(self, limit: int = 50, offset: int = 0) -> list:
+        """Query history, most recently run first."""
+        return self._rows(
+            "SELECT q.id, q.query, q.start_date, q.end_date, q.created_at, "
+            "COUNT(r.id) AS runs, MAX(r.started_at) AS last_run_at "
+            "FROM queries q LEFT JOIN runs r ON r.query_id = q.id "
+            "GROUP BY q.id ORDER BY last_run_at DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def find_query(self, query: str, start_date=None, end_date=None):
+        rows = self._rows(
+            "SELECT id, query, start_date, end_date, created_at FROM queries "
+            "WHERE canonical_query = ? AND start_date = ? AND end_date = ?",
+            (canonical_query(query), start_date or "", end_date or ""),
+        )
+        return rows[0] if rows else None
+
+    def runs(self, query_id: int, limit: int = 50) -> list:
+        return self._rows(
+            "SELECT * FROM runs WHERE query_id = ? ORDER BY started_at DESC LIMIT ?",
+            (query_id, limit),
+        )
+
+    def run(self, run_id: int):
+        rows = self._rows("SELECT * FROM runs WHERE id = ?", (run_id,))
+        return rows[0] if rows else None
+
+    def run_results(self, run_id: int, limit: int = 1000, offset: int = 0) -> list:
+        return self._rows(
+            f"SELECT {RESULT_COLUMNS} FROM results WHERE run_id = ? ORDER BY position LIMIT ? OFFSET ?",
+            (run_id, limit, offset),
+        )
+
+    def new_results(self, run_id: int) -> list:
+        """Results of a run whose canonical URL no earlier run of the same query returned."""
+        return self._rows(
+            f"SELECT {R_RESULT_COLUMNS} FROM results r JOIN runs cur ON cur.id = r.run_id "
+            "WHERE r.run_id = ? AND NOT EXISTS ("
+            "    SELECT 1 FROM results p JOIN runs prev ON prev.id = p.run_id"
+            "    WHERE p.canonical_url = r.canonical_url AND prev.query_id = cur.query_id AND prev.id < cur.id"
+            ") ORDER BY r.position",
+            (run_id,),
+        )
+
+    def search_results(self, domain: str = None, url: str = None, date_from: str = None, date_to: str = None,
+                       query_id: int = None, limit: int = 100, offset: int = 0) -> list:
+        """Stored results across all runs, filtered on the indexed columns."""
+        clauses, params = [], []
+        if domain:
+            clauses.append("r.domain = ?")
+            params.append(url_domain(f"//{domain}"))
+        if url:
+            clauses.append("r.canonical_url = ?")
+            params.append(canonical_url(url))
+        if date_from:
+            clauses.append("r.published_date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("r.published_date <= ?")
+            params.append(date_to)
+        if query_id is not None:
+            clauses.append("runs.query_id = ?")
+            params.append(query_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._rows(
+            f"SELECT {R_RESULT_COLUMNS}, runs.query_id "
+            f"FROM results r JOIN runs ON runs.id = r.run_id {where} "
+            "ORDER BY r.run_id DESC, r.position LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+
+    def stats(self) -> dict:
+        reader = self._reader()
+        return {
+            "path": self.path,
+            "queries": reader.execute("SELECT COUNT(*) FROM queries").fetchone()[0],
+            "runs": reader.execute("SELECT COUNT(*) FROM runs").fetchone()[0],
+            "results": reader.execute("SELECT COUNT(*) FROM results").fetchone()[0],
+        }
+
+    def close(self):
+        with self._lock:
+            for run_id in list(self._pending):
+                self._flush(run_id)
+            self._writer.close()
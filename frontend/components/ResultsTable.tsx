@@ -1,80 +1,106 @@
-import { useState, useMemo } from 'react';
+import { useState, useEffect } from 'react';
+import axios from 'axios';
 import { format } from 'date-fns';
-import * as XLSX from 'xlsx';
-import { ResultsTableProps, TableFilters, SearchResult } from '../types';
+import { ResultsTableProps, TableFilters, SearchResult, RunResultsPage, SortField } from '../types';
 
-const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
+const API_URL = 'http://127.0.0.1:8000';
+const PAGE_SIZE = 50;
+const FILTER_DEBOUNCE_MS = 250;
+
+const ResultsTable: React.FC<ResultsTableProps> = ({ runId, loading }) => {
   const [filters, setFilters] = useState<TableFilters>({
     title_filter: '',
-    date_filter: '',
     url_filter: '',
+    date_from: '',
+    date_to: '',
   });
+  const [appliedFilters, setAppliedFilters] = useState<TableFilters>(filters);
 
-  const [sortField, setSortField] = useState<keyof SearchResult>('title');
+  const [sortField, setSortField] = useState<SortField>('position');
   const [sortDirection, setSortDirection] = useState<'asc' | 'desc'>('asc');
+  const [offset, setOffset] = useState<number>(0);
+  const [page, setPage] = useState<RunResultsPage | null>(null);
+  const [fetching, setFetching] = useState<boolean>(false);
+  const [error, setError] = useState<string | null>(null);
 
-  // Filter and sort results
-  const filteredResults = useMemo(() => {
-    let filtered = results.filter(result => {
-      const titleMatch = result.title?.toLowerCase().includes(filters.title_filter.toLowerCase()) || !filters.title_filter;
-      const urlMatch = result.url?.toLowerCase().includes(filters.url_filter.toLowerCase()) || !filters.url_filter;
-      
-      let dateMatch = true;
-      if (filters.date_filter) {
-        const resultDate = result.date || result.post_date || result.published_date;
-        if (resultDate) {
-          dateMatch = resultDate.toLowerCase().includes(filters.date_filter.toLowerCase());
-        }
-      }
-      
-      return titleMatch && urlMatch && dateMatch;
-    });
+  // Only hit the server once typing pauses
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setAppliedFilters(filters);
+      setOffset(0);
+    }, FILTER_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [filters]);
 
-    // Sort results
-    filtered.sort((a, b) => {
-      const aValue = a[sortField] || '';
-      const bValue = b[sortField] || '';
-      
-      const comparison = aValue.toString().localeCompare(bValue.toString());
-      return sortDirection === 'asc' ? comparison : -comparison;
-    });
+  const queryParams = (windowOffset: number, limit: number) => ({
+    offset: windowOffset,
+    limit,
+    sort: `${sortDirection === 'desc' ? '-' : ''}${sortField}`,
+    title_contains: appliedFilters.title_filter || undefined,
+    url_contains: appliedFilters.url_filter || undefined,
+    date_from: appliedFilters.date_from || undefined,
+    date_to: appliedFilters.date_to || undefined,
+  });
+
+  // Filtering and sorting happen on the server; fetch only the visible window
+  useEffect(() => {
+    let cancelled = false;
+    setFetching(true);
+    axios
+      .get<RunResultsPage>(`${API_URL}/runs/${runId}/results`, { params: queryParams(offset, PAGE_SIZE) })
+      .then(response => {
+        if (!cancelled) {
+          setPage(response.data);
+          setError(null);
+        }
+      })
+      .catch(err => {
+        if (!cancelled) {
+          setError(axios.isAxiosError(err) ? err.response?.data?.detail || err.message : 'Failed to load results');
+        }
+      })
+      .finally(() => {
+        if (!cancelled) setFetching(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [runId, appliedFilters, sortField, sortDirection, offset]);
 
-    return filtered;
-  }, [results, filters, sortField, sortDirection]);
+  const rows: SearchResult[] = page?.results || [];
+  const total = page?.total ?? 0;
 
-  const handleSort = (field: keyof SearchResult): void => {
+  const handleSort = (field: SortField): void => {
     if (sortField === field) {
       setSortDirection(sortDirection === 'asc' ? 'desc' : 'asc');
     } else {
       setSortField(field);
       setSortDirection('asc');
     }
+    setOffset(0);
   };
 
-  const exportToCSV = (): void => {
-    const csvData = filteredResults.map(result => ({
-      Title: result.title || '',
-      URL: result.url || '',
-      'Post Date': result.date || result.post_date || result.published_date || '',
-    }));
+  // The server streams exports of every matching result, so the browser never holds the full set
+  const exportUrl = (exportFormat: 'csv' | 'xlsx' | 'parquet'): string => {
+    const params = new URLSearchParams({ format: exportFormat });
+    Object.entries(queryParams(0, PAGE_SIZE)).forEach(([name, value]) => {
+      if (value !== undefined && name !== 'offset' && name !== 'limit') {
+        params.set(name, String(value));
+      }
+    });
+    return `${API_URL}/runs/${runId}/export?${params.toString()}`;
+  };
 
-    const ws = XLSX.utils.json_to_sheet(csvData);
-    const wb = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(wb, ws, 'Search Results');
-    XLSX.writeFile(wb, `search_results_${format(new Date(), 'yyyy-MM-dd_HH-mm-ss')}.csv`);
+  const exportToCSV = (): void => {
+    window.location.href = exportUrl('csv');
   };
 
   const exportToExcel = (): void => {
-    const excelData = filteredResults.map(result => ({
-      Title: result.title || '',
-      URL: result.url || '',
-      'Post Date': result.date || result.post_date || result.published_date || '',
-    }));
+    window.location.href = exportUrl('xlsx');
+  };
 
-    const ws = XLSX.utils.json_to_sheet(excelData);
-    const wb = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(wb, ws, 'Search Results');
-    XLSX.writeFile(wb, `search_results_${format(new Date(), 'yyyy-MM-dd_HH-mm-ss')}.xlsx`);
+  const exportToParquet = (): void => {
+    window.location.href = exportUrl('parquet');
   };
 
   const formatDate = (dateString: string): string => {
@@ -102,22 +128,25 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
     );
   }
 
-  if (!results || results.length === 0) {
+  if (!runId) {
     return null;
   }
 
+  const hasFilters = Boolean(filters.title_filter || filters.url_filter || filters.date_from || filters.date_to);
+
   return (
     <div className="space-y-6">
       {/* Header with Export Buttons */}
       <div className="flex flex-col sm:flex-row items-start sm:items-center justify-between gap-4">
         <div>
           <h3 className="text-xl font-semibold text-gray-900 dark:text-white">
-            Search Results ({filteredResults.length})
+            Search Results ({total})
           </h3>
           <p className="text-sm text-gray-600 dark:text-gray-400">
-            {filteredResults.length !== results.length && 
-              `Filtered from ${results.length} total results`
+            {page && page.total !== page.run_total &&
+              `Filtered from ${page.run_total} total results`
             }
+            {error && <span className="text-red-600 dark:text-red-400">{error}</span>}
           </p>
         </div>
 
@@ -140,13 +169,22 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
             </svg>
             Export Excel
           </button>
+          <button
+            onClick={exportToParquet}
+            className="btn-secondary flex items-center gap-2 text-sm"
+          >
+            <svg className="w-4 h-4" fill="currentColor" viewBox="0 0 20 20">
+              <path fillRule="evenodd" d="M3 17a1 1 0 011-1h12a1 1 0 110 2H4a1 1 0 01-1-1zm3.293-7.707a1 1 0 011.414 0L9 10.586V3a1 1 0 112 0v7.586l1.293-1.293a1 1 0 111.414 1.414l-3 3a1 1 0 01-1.414 0l-3-3a1 1 0 010-1.414z" clipRule="evenodd" />
+            </svg>
+            Export Parquet
+          </button>
         </div>
       </div>
 
       {/* Filters */}
       <div className="card p-4">
         <h4 className="font-medium text-gray-900 dark:text-white mb-3">Filters</h4>
-        <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
+        <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
           <div>
             <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
               Title Filter
@@ -173,22 +211,32 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
           </div>
           <div>
             <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
-              Date Filter
+              Posted From
             </label>
             <input
-              type="text"
-              placeholder="Filter by date..."
-              value={filters.date_filter}
-              onChange={(e) => setFilters(prev => ({ ...prev, date_filter: e.target.value }))}
+              type="date"
+              value={filters.date_from}
+              onChange={(e) => setFilters(prev => ({ ...prev, date_from: e.target.value }))}
+              className="input-field"
+            />
+          </div>
+          <div>
+            <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
+              Posted To
+            </label>
+            <input
+              type="date"
+              value={filters.date_to}
+              onChange={(e) => setFilters(prev => ({ ...prev, date_to: e.target.value }))}
               className="input-field"
             />
           </div>
         </div>
         
-        {(filters.title_filter || filters.url_filter || filters.date_filter) && (
+        {hasFilters && (
           <div className="mt-3 flex justify-end">
             <button
-              onClick={() => setFilters({ title_filter: '', url_filter: '', date_filter: '' })}
+              onClick={() => setFilters({ title_filter: '', url_filter: '', date_from: '', date_to: '' })}
               className="text-sm text-primary-600 dark:text-primary-400 hover:text-primary-700 dark:hover:text-primary-300"
             >
               Clear Filters
@@ -198,7 +246,7 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
       </div>
 
       {/* Results Table */}
-      <div className="card overflow-hidden">
+      <div className={`card overflow-hidden ${fetching ? 'opacity-60' : ''}`}>
         <div className="overflow-x-auto">
           <table className="w-full">
             <thead className="bg-gray-50 dark:bg-gray-700">
@@ -231,11 +279,11 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
                 </th>
                 <th 
                   className="px-6 py-3 text-left text-xs font-medium text-gray-500 dark:text-gray-400 uppercase tracking-wider cursor-pointer hover:bg-gray-100 dark:hover:bg-gray-600"
-                  onClick={() => handleSort('date')}
+                  onClick={() => handleSort('published_date')}
                 >
                   <div className="flex items-center gap-2">
                     Post Date
-                    {sortField === 'date' && (
+                    {sortField === 'published_date' && (
                       <svg className={`w-4 h-4 ${sortDirection === 'asc' ? '' : 'rotate-180'}`} fill="currentColor" viewBox="0 0 20 20">
                         <path fillRule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clipRule="evenodd" />
                       </svg>
@@ -248,7 +296,7 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
               </tr>
             </thead>
             <tbody className="bg-white dark:bg-gray-800 divide-y divide-gray-200 dark:divide-gray-700">
-              {filteredResults.map((result, index) => (
+              {rows.map((result, index) => (
                 <tr key={result.url || index} className="hover:bg-gray-50 dark:hover:bg-gray-700">
                   <td className="px-6 py-4">
                     <div className="max-w-xs">
@@ -293,6 +341,31 @@ const ResultsTable: React.FC<ResultsTableProps> = ({ results, loading }) => {
             </tbody>
           </table>
         </div>
+
+        {/* Pagination */}
+        {total > PAGE_SIZE && (
+          <div className="flex items-center justify-between px-6 py-3 border-t border-gray-200 dark:border-gray-700">
+            <p className="text-sm text-gray-600 dark:text-gray-400">
+              Showing {offset + 1}–{Math.min(offset + PAGE_SIZE, total)} of {total}
+            </p>
+            <div className="flex gap-2">
+              <button
+                onClick={() => setOffset(Math.max(0, offset - PAGE_SIZE))}
+                disabled={offset === 0 || fetching}
+                className="btn-secondary text-sm disabled:opacity-50"
+              >
+                Previous
+              </button>
+              <button
+                onClick={() => setOffset(offset + PAGE_SIZE)}
+                disabled={offset + PAGE_SIZE >= total || fetching}
+                className="btn-secondary text-sm disabled:opacity-50"
+              >
+                Next
+              </button>
+            </div>
+          </div>
+        )}
       </div>
     </div>
   );
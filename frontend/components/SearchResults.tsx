@@ -1,7 +1,7 @@
 import { SearchResultsProps } from '../types';
 import ResultsTable from './ResultsTable';
 
-const SearchResults: React.FC<SearchResultsProps> = ({ results, searchInfo, loading, error }) => {
+const SearchResults: React.FC<SearchResultsProps> = ({ runId, searchInfo, loading, error }) => {
   if (loading) {
     return (
       <div className="card p-8 text-center">
@@ -43,7 +43,7 @@ const SearchResults: React.FC<SearchResultsProps> = ({ results, searchInfo, load
     );
   }
 
-  if (!results || results.length === 0) {
+  if (!runId || !searchInfo || searchInfo.total_results === 0) {
     return null;
   }
 
@@ -85,7 +85,7 @@ const SearchResults: React.FC<SearchResultsProps> = ({ results, searchInfo, load
       )}
 
       {/* Results Table */}
-      <ResultsTable results={results} loading={false} />
+      <ResultsTable key={runId} runId={runId} loading={false} />
     </div>
   );
 };
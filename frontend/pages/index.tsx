@@ -4,29 +4,33 @@ import Head from 'next/head';
 import ThemeToggle from '../components/ThemeToggle';
 import SearchForm from '../components/SearchForm';
 import SearchResults from '../components/SearchResults';
-import { SearchFormData, SearchResponse, SearchResult, SearchInfo } from '../types';
+import { SearchFormData, SearchResponse, SearchInfo } from '../types';
 
 const Home: React.FC = () => {
   const [loading, setLoading] = useState<boolean>(false);
-  const [results, setResults] = useState<SearchResult[]>([]);
+  const [runId, setRunId] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [searchInfo, setSearchInfo] = useState<SearchInfo | null>(null);
 
   const handleSearch = async (formData: SearchFormData): Promise<void> => {
     setLoading(true);
     setError(null);
-    setResults([]);
+    setRunId(null);
     setSearchInfo(null);
     
     try {
-      const response = await axios.post<SearchResponse>('http://127.0.0.1:8000/search', formData);
+      // The table pages through the run on the server, so skip the full result list here
+      const response = await axios.post<SearchResponse>('http://127.0.0.1:8000/search', {
+        ...formData,
+        include_results: false,
+      });
       const { data } = response;
       
-      setResults(data.results);
+      setRunId(data.run_id || null);
       setSearchInfo({
         query: data.query,
         pages_retrieved: data.pages_retrieved,
-        total_results: data.results.length
+        total_results: data.total_results ?? data.results.length
       });
     } catch (err) {
       console.error(err);
@@ -99,7 +103,7 @@ const Home: React.FC = () => {
 
           {/* Search Results */}
           <SearchResults
-            results={results}
+            runId={runId}
             searchInfo={searchInfo}
             loading={loading}
             error={error}
@@ -29,6 +29,20 @@ export interface SearchResponse {
   query: string;
   pages_retrieved: number;
   results: SearchResult[];
+  run_id?: string;
+  total_results?: number;
+}
+
+// One window of GET /runs/{run_id}/results
+export interface RunResultsPage {
+  run_id: string;
+  query: string;
+  total: number;
+  run_total: number;
+  offset: number;
+  limit: number;
+  sort: string;
+  results: SearchResult[];
 }
 
 export interface SearchInfo {
@@ -44,20 +58,23 @@ export interface SearchFormProps {
 }
 
 export interface SearchResultsProps {
-  results: SearchResult[];
+  runId: string | null;
   searchInfo: SearchInfo | null;
   loading: boolean;
   error: string | null;
 }
 
 export interface ResultsTableProps {
-  results: SearchResult[];
+  runId: string;
   loading: boolean;
 }
 
 // Filter types
 export interface TableFilters {
   title_filter: string;
-  date_filter: string;
   url_filter: string;
+  date_from: string;
+  date_to: string;
 }
+
+export type SortField = 'position' | 'title' | 'url' | 'published_date';